@@ -0,0 +1,227 @@
+"""
+Times the hot paths of web3 which have been optimized, and measures the
+memory used by log records, so that regressions can be spotted by comparing
+runs of different revisions.
+
+    $ python benchmarks/benchmark.py
+
+Memory is measured with `tracemalloc` and so requires python 3.4 or above.
+"""
+import json
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from eth_utils import (
+    encode_hex,
+    event_abi_to_log_topic,
+)
+
+from web3 import Web3
+from web3.formatters import (
+    lazy_block_formatter,
+    output_block_formatter,
+    output_transaction_receipt_formatter,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.utils.abi import (
+    check_if_arguments_can_be_encoded,
+)
+from web3.utils.caching import (
+    generate_cache_key,
+)
+from web3.utils.datastructures import (
+    AttributeDict,
+    Log,
+)
+from web3.utils.events import (
+    EventDecoder,
+    get_event_data,
+)
+
+
+TRANSFER_EVENT_ABI = {
+    'anonymous': False,
+    'inputs': [
+        {'indexed': True, 'name': 'from', 'type': 'address'},
+        {'indexed': True, 'name': 'to', 'type': 'address'},
+        {'indexed': False, 'name': 'value', 'type': 'uint256'},
+    ],
+    'name': 'Transfer',
+    'type': 'event',
+}
+TRANSFER_ABI = {
+    'constant': False,
+    'inputs': [
+        {'name': 'to', 'type': 'address'},
+        {'name': 'value', 'type': 'uint256'},
+    ],
+    'name': 'transfer',
+    'outputs': [{'name': '', 'type': 'bool'}],
+    'type': 'function',
+}
+TRANSFER_TOPIC = encode_hex(event_abi_to_log_topic(TRANSFER_EVENT_ABI))
+
+
+def hex32(value):
+    return '0x{0:064x}'.format(value)
+
+
+def hex20(value):
+    return '0x{0:040x}'.format(value)
+
+
+def make_transaction(index):
+    return {
+        'blockHash': hex32(1),
+        'blockNumber': '0x3d0900',
+        'from': hex20(index),
+        'gas': '0x15f90',
+        'gasPrice': '0x4a817c800',
+        'hash': hex32(index + 1000),
+        'input': '0xa9059cbb' + '00' * 64,
+        'nonce': hex(index),
+        'r': hex32(index + 2000),
+        's': hex32(index + 3000),
+        'to': hex20(index + 1),
+        'transactionIndex': hex(index),
+        'v': '0x1b',
+        'value': '0xde0b6b3a7640000',
+    }
+
+
+def make_log(index):
+    return {
+        'address': hex20(1),
+        'blockHash': hex32(1),
+        'blockNumber': '0x3d0900',
+        'data': hex32(index * 10 ** 18),
+        'logIndex': hex(index),
+        'topics': [TRANSFER_TOPIC, hex32(index), hex32(index + 1)],
+        'transactionHash': hex32(index + 1000),
+        'transactionIndex': hex(index),
+    }
+
+
+def make_block(num_transactions):
+    return {
+        'difficulty': '0x4ea3f27bc',
+        'extraData': '0x',
+        'gasLimit': '0x6691b7',
+        'gasUsed': '0x5208',
+        'hash': hex32(1),
+        'logsBloom': '0x' + '00' * 256,
+        'miner': hex20(1),
+        'mixHash': hex32(2),
+        'nonce': '0x689056015818adbe',
+        'number': '0x3d0900',
+        'parentHash': hex32(3),
+        'receiptsRoot': hex32(4),
+        'sha3Uncles': hex32(5),
+        'size': '0x220',
+        'stateRoot': hex32(6),
+        'timestamp': '0x55ba467c',
+        'totalDifficulty': '0x78ed983323d',
+        'transactions': [make_transaction(index) for index in range(num_transactions)],
+        'transactionsRoot': hex32(7),
+        'uncles': [],
+    }
+
+
+def make_receipt(index):
+    return {
+        'blockHash': hex32(1),
+        'blockNumber': '0x3d0900',
+        'contractAddress': None,
+        'cumulativeGasUsed': hex(21000 * (index + 1)),
+        'gasUsed': '0x5208',
+        'logs': [make_log(index)],
+        'root': hex32(index + 4000),
+        'transactionHash': hex32(index + 1000),
+        'transactionIndex': hex(index),
+    }
+
+
+def get_cases(size):
+    block = json.loads(json.dumps(make_block(size)))
+    receipts = [make_receipt(index) for index in range(size)]
+    logs = [
+        output_transaction_receipt_formatter(receipt)['logs'][0]
+        for receipt in receipts
+    ]
+    raw_logs = [make_log(index) for index in range(size)]
+    decoder = EventDecoder(TRANSFER_EVENT_ABI)
+
+    Token = Web3(BaseProvider()).eth.contract(abi=[TRANSFER_ABI])
+    rows = [[hex20(index + 1), index * 10 ** 18] for index in range(size)]
+
+    get_logs_params = ('eth_getLogs', [{
+        'fromBlock': '0x3e8',
+        'toBlock': '0x7d0',
+        'address': [hex20(1)] * 4,
+        'topics': [TRANSFER_TOPIC, None, [hex32(1), hex32(2)]],
+    }])
+
+    return (
+        ('cache key, eth_getLogs', lambda: generate_cache_key(get_logs_params)),
+        ('AttributeDict logs', lambda: [AttributeDict(log) for log in raw_logs]),
+        ('Log records', lambda: [Log(log) for log in raw_logs]),
+        ('format block', lambda: output_block_formatter(block)),
+        ('lazy block, read hash+to', lambda: [
+            (txn.hash, txn.to) for txn in lazy_block_formatter(block).transactions
+        ]),
+        ('format receipts', lambda: [
+            output_transaction_receipt_formatter(receipt) for receipt in receipts
+        ]),
+        ('get_event_data', lambda: [get_event_data(TRANSFER_EVENT_ABI, log) for log in logs]),
+        ('EventDecoder.decode_logs', lambda: decoder.decode_logs(logs)),
+        ('check arguments', lambda: [
+            check_if_arguments_can_be_encoded(TRANSFER_ABI, row, {}) for row in rows
+        ]),
+        ('encodeABI per row', lambda: [Token.encodeABI('transfer', row) for row in rows]),
+        ('encodeABIRows', lambda: Token.encodeABIRows('transfer', rows)),
+    )
+
+
+def measure_memory(container_class, logs):
+    """
+    Returns the bytes allocated per log when wrapping each of ``logs`` with
+    ``container_class``.  The values are shared with ``logs``, so only the
+    containers are measured.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    containers = [container_class(log) for log in logs]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del containers
+    return (after - before) / len(logs)
+
+
+def main(size=300, number=10, num_logs=100000):
+    print("{0:<28} {1:>12}".format("{0} items".format(size), "time (ms)"))
+    for name, fn in get_cases(size):
+        elapsed = timeit.timeit(fn, number=number) / number
+        print("{0:<28} {1:>12.3f}".format(name, elapsed * 1e3))
+
+    if tracemalloc is None:
+        print("Memory is not measured as tracemalloc is not available")
+        return
+
+    logs = [make_log(index) for index in range(num_logs)]
+    print("")
+    print("{0:<28} {1:>12}".format("{0} logs".format(num_logs), "bytes/log"))
+    for container_class in (AttributeDict, Log):
+        print("{0:<28} {1:>12.0f}".format(
+            container_class.__name__,
+            measure_memory(container_class, logs),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -43,6 +43,7 @@ setup(
             "gevent>=1.1.1,<1.2.0",
             "geventhttpclient>=1.3.1",
         ],
+        'async': ["aiohttp>=1.3.0"],
     },
     py_modules=['web3'],
     license="MIT",
@@ -0,0 +1,7 @@
+import sys
+
+
+collect_ignore = []
+
+if sys.version_info < (3, 4):
+    collect_ignore.append('test_async_web3.py')
@@ -0,0 +1,222 @@
+import asyncio
+import json
+import os
+import tempfile
+
+import pytest
+
+from eth_utils import (
+    force_bytes,
+    force_text,
+)
+
+from web3.async_main import AsyncWeb3
+from web3.providers.async_ipc import (
+    AsyncIPCProvider,
+)
+from web3.providers.async_rpc import (
+    AsyncHTTPProvider,
+    is_aiohttp_available,
+)
+from web3.providers.tester import (
+    TestRPCProvider,
+)
+from web3.utils.streaming import (
+    JSONMessageFramer,
+)
+
+from tests.providers.conftest import get_open_port
+
+
+RESULTS = {
+    'eth_blockNumber': '0x10',
+    'eth_gasPrice': '0x4a817c800',
+    'eth_getBalance': '0xde0b6b3a7640000',
+    'eth_coinbase': '0x82a978b3f5962a5b0957d9ee9eef472ee55b42f1',
+    'eth_estimateGas': '0x5208',
+    'eth_getBlockByNumber': {'number': '0x10', 'gasLimit': '0x47e7c4'},
+    'eth_sendTransaction': '0xebd8b7d2b6ab1e0a6b5b2a6f4a2fd8c3f1a8b3ea36d9a5e0b9f4b12b0a5d3c2e',
+    'web3_clientVersion': 'FakeNode/v0.1',
+}
+
+
+@pytest.fixture()
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture()
+def ipc_server(loop):
+    """
+    A node which answers requests once ``batch_size`` of them are in flight,
+    in reverse order, or with a single error with a `null` id if
+    ``reject_requests`` is set.
+    """
+    servers = []
+
+    def _ipc_server(batch_size, reject_requests=False):
+        ipc_path = os.path.join(tempfile.mkdtemp(), 'test.ipc')
+        requests_seen = []
+
+        @asyncio.coroutine
+        def handle_connection(reader, writer):
+            framer = JSONMessageFramer()
+            pending = []
+            while True:
+                data = yield from reader.read(4096)
+                if not data:
+                    writer.close()
+                    return
+                for message in framer.feed(data):
+                    request = json.loads(force_text(message))
+                    requests_seen.append(request)
+                    pending.append(request)
+                if len(pending) >= batch_size and reject_requests:
+                    writer.write(force_bytes(json.dumps({
+                        'jsonrpc': '2.0',
+                        'id': None,
+                        'error': {'code': -32600, 'message': 'invalid request'},
+                    })))
+                    pending = []
+                elif len(pending) >= batch_size:
+                    for request in reversed(pending):
+                        response = {
+                            'jsonrpc': '2.0',
+                            'id': request['id'],
+                            'result': RESULTS[request['method']],
+                        }
+                        writer.write(force_bytes(json.dumps(response)))
+                    pending = []
+
+        servers.append(loop.run_until_complete(
+            asyncio.start_unix_server(handle_connection, ipc_path, loop=loop)
+        ))
+        return ipc_path, requests_seen
+
+    yield _ipc_server
+
+    for server in servers:
+        server.close()
+        loop.run_until_complete(server.wait_closed())
+
+
+def test_async_web3_pipelines_requests(loop, ipc_server):
+    ipc_path, requests_seen = ipc_server(batch_size=3)
+
+    provider = AsyncIPCProvider(ipc_path, loop=loop)
+    web3 = AsyncWeb3(provider)
+
+    block_number, gas_price, client_version = loop.run_until_complete(asyncio.gather(
+        web3.eth.blockNumber,
+        web3.eth.gasPrice,
+        web3.version.node,
+        loop=loop,
+    ))
+    provider.close()
+
+    assert block_number == 16
+    assert gas_price == 20000000000
+    assert client_version == 'FakeNode/v0.1'
+    assert len(requests_seen) == 3
+
+
+def test_async_web3_follow_up_requests(loop, ipc_server):
+    ipc_path, requests_seen = ipc_server(batch_size=1)
+
+    provider = AsyncIPCProvider(ipc_path, loop=loop)
+    web3 = AsyncWeb3(provider)
+
+    # Sending a transaction with `data` but no `gas` estimates the gas and
+    # looks up the block gas limit before the transaction is sent.
+    txn_hash = loop.run_until_complete(web3.eth.sendTransaction({
+        'from': '0x82a978b3f5962a5b0957d9ee9eef472ee55b42f1',
+        'to': '0x82a978b3f5962a5b0957d9ee9eef472ee55b42f1',
+        'data': '0x1234',
+    }))
+    is_connected = loop.run_until_complete(web3.isConnected())
+    provider.close()
+
+    assert txn_hash == RESULTS['eth_sendTransaction']
+    assert is_connected is True
+    assert [request['method'] for request in requests_seen] == [
+        'eth_estimateGas',
+        'eth_blockNumber',
+        'eth_getBlockByNumber',
+        'eth_sendTransaction',
+        'web3_clientVersion',
+    ]
+    assert requests_seen[3]['params'][0]['gas'] == hex(21000 + 100000)
+
+
+def test_async_ipc_provider_unmatched_error(loop, ipc_server):
+    ipc_path, requests_seen = ipc_server(batch_size=2, reject_requests=True)
+
+    provider = AsyncIPCProvider(ipc_path, timeout=5, loop=loop)
+    web3 = AsyncWeb3(provider)
+
+    results = loop.run_until_complete(asyncio.gather(
+        web3.eth.blockNumber,
+        provider.coro_make_batch_request([('eth_gasPrice', []), ('eth_coinbase', [])]),
+        loop=loop,
+        return_exceptions=True,
+    ))
+    provider.close()
+
+    assert len(requests_seen) == 2
+    assert all(isinstance(result, ValueError) for result in results)
+    assert provider._pending == {}
+
+
+def test_async_ipc_provider_not_connected(loop):
+    ipc_path = os.path.join(tempfile.mkdtemp(), 'missing.ipc')
+    web3 = AsyncWeb3(AsyncIPCProvider(ipc_path, loop=loop))
+
+    assert loop.run_until_complete(web3.isConnected()) is False
+    with pytest.raises(IOError):
+        loop.run_until_complete(web3.eth.blockNumber)
+
+
+def test_async_web3_module_attributes(loop):
+    web3 = AsyncWeb3(AsyncIPCProvider('/does/not/exist', loop=loop))
+
+    web3.eth.defaultAccount = '0x82a978b3f5962a5b0957d9ee9eef472ee55b42f1'
+    assert web3.eth.defaultAccount == '0x82a978b3f5962a5b0957d9ee9eef472ee55b42f1'
+    assert web3.eth.defaultBlock == 'latest'
+
+
+@pytest.mark.skipif(not is_aiohttp_available(), reason="aiohttp is not installed")
+def test_async_http_provider(loop):
+    port = get_open_port()
+    testrpc_provider = TestRPCProvider(port=port)
+
+    try:
+        provider = AsyncHTTPProvider('http://127.0.0.1:{0}'.format(port), loop=loop)
+        web3 = AsyncWeb3(provider)
+
+        coinbase, accounts, block_number = loop.run_until_complete(asyncio.gather(
+            web3.eth.coinbase,
+            web3.eth.accounts,
+            web3.eth.blockNumber,
+            loop=loop,
+        ))
+        assert coinbase == accounts[0]
+        assert block_number == 0
+
+        responses = loop.run_until_complete(
+            provider.coro_make_batch_request([
+                ('eth_blockNumber', []),
+                ('web3_clientVersion', []),
+            ])
+        )
+        assert [response['result'] for response in responses][0] == '0x0'
+
+        loop.run_until_complete(provider.close())
+    finally:
+        try:
+            testrpc_provider.server.stop()
+            testrpc_provider.server.close()
+            testrpc_provider.thread.kill()
+        except AttributeError:
+            testrpc_provider.server.shutdown()
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from eth_utils import (
+    force_bytes,
+    force_text,
+)
+
+from web3.main import Web3
+from web3.providers.base import JSONBaseProvider
+from web3.utils.datastructures import (
+    AttributeDict,
+)
+
+
+class ReversingProvider(JSONBaseProvider):
+    """
+    Answers each member of a batch with its own method name, returning the
+    responses in the reverse order from the requests.
+    """
+    def __init__(self):
+        self.raw_requests = []
+        super(ReversingProvider, self).__init__()
+
+    def make_raw_request(self, request_data):
+        self.raw_requests.append(request_data)
+        rpc_requests = json.loads(force_text(request_data))
+        return force_bytes(json.dumps([
+            {'jsonrpc': '2.0', 'id': rpc_request['id'], 'result': rpc_request['method']}
+            for rpc_request in reversed(rpc_requests)
+        ]))
+
+
+def test_batch_results_match_individual_requests(web3):
+    batch = web3.createBatch()
+    balances = [batch.eth.getBalance(account) for account in web3.eth.accounts]
+    block_number = batch.eth.blockNumber
+
+    results = batch.execute()
+
+    assert results == [
+        web3.eth.getBalance(account) for account in web3.eth.accounts
+    ] + [web3.eth.blockNumber]
+    assert [balance.get() for balance in balances] == results[:-1]
+    assert block_number.get() == web3.eth.blockNumber
+
+
+def test_batch_applies_output_formatters(web3):
+    batch = web3.createBatch()
+    block = batch.eth.getBlock(0)
+    batch.execute()
+
+    assert isinstance(block.get(), AttributeDict)
+    assert block.get() == web3.eth.getBlock(0)
+
+
+def test_batch_request_errors_are_raised_on_get(web3):
+    batch = web3.createBatch()
+    version = batch.version.node
+    post = batch.shh.post({})
+
+    with pytest.raises(ValueError):
+        batch.execute()
+
+    assert version.get() == web3.version.node
+    with pytest.raises(ValueError):
+        post.get()
+
+
+def test_batch_can_only_be_executed_once(web3):
+    batch = web3.createBatch()
+    batch.eth.blockNumber
+    batch.execute()
+
+    with pytest.raises(ValueError):
+        batch.execute()
+    with pytest.raises(ValueError):
+        batch.eth.blockNumber
+
+
+def test_batch_responses_are_matched_by_id():
+    provider = ReversingProvider()
+    web3 = Web3(provider)
+
+    batch = web3.createBatch()
+    batch.net.listening
+    batch.eth.mining
+    batch.txpool.status
+
+    assert batch.execute() == ['net_listening', 'eth_mining', 'txpool_status']
+    assert len(provider.raw_requests) == 1
+
+
+def test_batch_size_splits_requests():
+    provider = ReversingProvider()
+    web3 = Web3(provider)
+
+    batch = web3.createBatch(batch_size=2)
+    for _ in range(5):
+        batch.eth.mining
+
+    assert batch.execute() == ['eth_mining'] * 5
+    assert len(provider.raw_requests) == 3
@@ -56,3 +56,28 @@ def test_key_generation_is_deterministic(value):
     left_key = generate_cache_key(left)
     right_key = generate_cache_key(right)
     assert left_key == right_key
+
+
+@pytest.mark.parametrize(
+    'left,right',
+    (
+        (1, '1'),
+        (b'1', '1'),
+        (True, 1),
+        (None, 'None'),
+        (['ab'], ['a', 'b']),
+        ([[1], 2], [[1, 2]]),
+        ([], {}),
+        ({'a': 1}, ['a', 1]),
+        ([''], []),
+    ),
+)
+def test_key_generation_is_unambiguous(left, right):
+    assert generate_cache_key(left) != generate_cache_key(right)
+
+
+def test_key_generation_treats_sequences_alike():
+    expected = generate_cache_key([1, 'a', b'b'])
+
+    assert generate_cache_key((1, 'a', b'b')) == expected
+    assert generate_cache_key(item for item in (1, 'a', b'b')) == expected
@@ -0,0 +1,177 @@
+import pytest
+
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.providers.caching import (
+    ResponseCache,
+)
+from web3.providers.manager import (
+    RequestManager,
+)
+from web3.utils.empty import (
+    empty,
+)
+
+
+BLOCK_HASH = '0x' + 'ab' * 32
+TXN_HASH = '0x' + 'cd' * 32
+
+
+class RecordingProvider(BaseProvider):
+    def __init__(self, results):
+        self.results = results
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        return {'jsonrpc': '2.0', 'id': 1, 'result': self.results[method]}
+
+
+class FakeClock(object):
+    now = 1000
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize(
+    'method,params,expected',
+    (
+        ('eth_getBlockByHash', [BLOCK_HASH, False], True),
+        ('eth_getBlockByNumber', ['0x10', False], True),
+        ('eth_getBlockByNumber', ['earliest', False], True),
+        ('eth_getBlockByNumber', ['latest', False], False),
+        ('eth_getBlockByNumber', ['pending', False], False),
+        ('eth_getBalance', ['0x' + '00' * 20, '0x10'], True),
+        ('eth_getBalance', ['0x' + '00' * 20, 'latest'], False),
+        ('eth_getBalance', ['0x' + '00' * 20], False),
+        ('eth_call', [{'to': '0x' + '00' * 20}, '0x10'], True),
+        ('eth_blockNumber', [], False),
+        ('eth_sendTransaction', [{}], False),
+    ),
+)
+def test_response_cache_rules(method, params, expected):
+    cache = ResponseCache()
+
+    assert (cache.get_cache_key(method, params) is not None) is expected
+
+
+def test_request_manager_serves_cached_results():
+    provider = RecordingProvider({
+        'eth_getBlockByHash': {'hash': BLOCK_HASH},
+        'eth_blockNumber': '0x10',
+    })
+    manager = RequestManager(provider, cache=ResponseCache())
+
+    for _ in range(3):
+        assert manager.request_blocking('eth_getBlockByHash', [BLOCK_HASH, False]) == {
+            'hash': BLOCK_HASH,
+        }
+        assert manager.request_blocking('eth_blockNumber', []) == '0x10'
+
+    assert provider.requests.count(('eth_getBlockByHash', [BLOCK_HASH, False])) == 1
+    assert provider.requests.count(('eth_blockNumber', [])) == 3
+    assert manager.cache.hits == 2
+
+
+def test_unmined_results_are_not_cached():
+    provider = RecordingProvider({
+        'eth_getTransactionByHash': {'hash': TXN_HASH, 'blockHash': None},
+        'eth_getTransactionReceipt': None,
+    })
+    manager = RequestManager(provider, cache=ResponseCache())
+
+    for _ in range(2):
+        manager.request_blocking('eth_getTransactionByHash', [TXN_HASH])
+        manager.request_blocking('eth_getTransactionReceipt', [TXN_HASH])
+
+    assert len(provider.requests) == 4
+    assert len(manager.cache) == 0
+
+
+def test_response_cache_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+
+    keys = [
+        cache.get_cache_key('eth_getBlockByNumber', [hex(number), False])
+        for number in range(3)
+    ]
+    cache.set('eth_getBlockByNumber', keys[0], {'number': 0})
+    cache.set('eth_getBlockByNumber', keys[1], {'number': 1})
+    # Touch the first entry so that the second is the least recently used.
+    assert cache.get(keys[0]) == {'number': 0}
+    cache.set('eth_getBlockByNumber', keys[2], {'number': 2})
+
+    assert cache.get(keys[0]) == {'number': 0}
+    assert cache.get(keys[1]) is empty
+    assert cache.get(keys[2]) == {'number': 2}
+
+
+def test_response_cache_byte_limit():
+    cache = ResponseCache(max_bytes=100)
+
+    keys = [
+        cache.get_cache_key('eth_getCode', ['0x' + '00' * 20, hex(number)])
+        for number in range(3)
+    ]
+    cache.set('eth_getCode', keys[0], '0x' + '00' * 20)
+    cache.set('eth_getCode', keys[1], '0x' + '00' * 20)
+    cache.set('eth_getCode', keys[2], '0x' + '00' * 200)
+
+    assert len(cache) == 2
+    assert cache.total_bytes <= 100
+    assert cache.get(keys[2]) is empty
+
+    cache.set('eth_getCode', keys[2], '0x' + '00' * 40)
+
+    assert cache.get(keys[0]) is empty
+    assert cache.total_bytes <= 100
+
+
+def test_response_cache_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(ttl=10, clock=clock)
+
+    cache_key = cache.get_cache_key('eth_getBlockByNumber', ['0x1', False])
+    cache.set('eth_getBlockByNumber', cache_key, {'number': '0x1'})
+
+    clock.now += 9
+    assert cache.get(cache_key) == {'number': '0x1'}
+    clock.now += 1
+    assert cache.get(cache_key) is empty
+    assert len(cache) == 0
+
+
+def test_request_batch_only_sends_uncached_requests():
+    provider = RecordingProvider({
+        'eth_getBlockByNumber': {'number': '0x1'},
+        'eth_blockNumber': '0x10',
+    })
+    manager = RequestManager(provider, cache=ResponseCache())
+
+    requests = [
+        ('eth_getBlockByNumber', ['0x1', False]),
+        ('eth_blockNumber', []),
+    ]
+    first = manager.request_batch(requests)
+    second = manager.request_batch(requests)
+
+    assert [response['result'] for response in first] == [{'number': '0x1'}, '0x10']
+    assert [response['result'] for response in second] == [{'number': '0x1'}, '0x10']
+    assert provider.requests == [
+        ('eth_getBlockByNumber', ['0x1', False]),
+        ('eth_blockNumber', []),
+        ('eth_blockNumber', []),
+    ]
+
+
+def test_cached_results_are_formatted(web3):
+    web3.setManager(RequestManager(web3.currentProvider, cache=ResponseCache()))
+
+    first = web3.eth.getBlock(0)
+    second = web3.eth.getBlock(0)
+
+    assert first == second
+    assert second['number'] == 0
+    assert web3._requestManager.cache.hits == 1
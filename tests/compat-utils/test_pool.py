@@ -0,0 +1,78 @@
+import pytest
+
+from web3.utils.compat.compat_stdlib import (
+    Event,
+    Pool,
+    Timeout,
+    threading,
+)
+
+
+def test_pool_returns_results():
+    pool = Pool(2)
+
+    futures = [pool.spawn(lambda value: value * 2, value) for value in range(5)]
+
+    assert [future.get(timeout=5) for future in futures] == [0, 2, 4, 6, 8]
+    assert all(future.successful() for future in futures)
+
+
+def test_pool_propagates_errors():
+    pool = Pool(1)
+
+    def fail():
+        raise ValueError("failed")
+
+    future = pool.spawn(fail)
+
+    with pytest.raises(ValueError):
+        future.get(timeout=5)
+    assert future.ready()
+    assert not future.successful()
+
+
+def test_pool_bounds_concurrency():
+    pool = Pool(2)
+    release = Event()
+    lock = threading.Lock()
+    counts = {'running': 0, 'max_running': 0}
+
+    def work():
+        with lock:
+            counts['running'] += 1
+            counts['max_running'] = max(counts['max_running'], counts['running'])
+        release.wait(5)
+        with lock:
+            counts['running'] -= 1
+
+    futures = [pool.spawn(work), pool.spawn(work)]
+    release.set()
+    futures.extend(pool.spawn(work) for _ in range(6))
+
+    for future in futures:
+        future.get(timeout=5)
+
+    assert counts['max_running'] <= 2
+
+
+def test_pool_result_rawlink():
+    pool = Pool(1)
+    linked = []
+
+    future = pool.spawn(lambda: 'result')
+    future.get(timeout=5)
+    future.rawlink(linked.append)
+
+    assert linked == [future]
+
+
+def test_pool_result_get_timeout():
+    pool = Pool(1)
+    release = Event()
+
+    future = pool.spawn(release.wait, 5)
+
+    with pytest.raises(Timeout):
+        future.get(timeout=0.01)
+    release.set()
+    assert future.get(timeout=5) is True
@@ -22,3 +22,15 @@ def test_contract_abi_encoding(web3, abi, method, arguments, data, expected):
     contract = web3.eth.contract(abi)
     actual = contract.encodeABI(method, arguments, data=data)
     assert actual == expected
+
+
+def test_contract_abi_row_encoding(web3):
+    contract = web3.eth.contract(ABI_C)
+    rows = [[1], [2], [3]]
+
+    encoded = contract.encodeABIRows('a', rows)
+    assert encoded == [contract.encodeABI('a', row) for row in rows]
+
+    buffer, offsets = contract.encodeABIRows('a', rows, as_buffer=True)
+    assert offsets == [0, 36, 72, 108]
+    assert len(buffer) == 108
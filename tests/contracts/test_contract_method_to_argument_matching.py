@@ -1,6 +1,7 @@
 import json
 import pytest
 
+from web3.utils import abi as abi_utils
 from web3.utils.abi import (
     get_abi_input_types,
 )
@@ -59,3 +60,43 @@ def test_error_when_duplicate_match(web3):
 
     with pytest.raises(ValueError):
         abi = Contract._find_matching_fn_abi('a', [100])
+
+
+OVERLOADED_BY_INT_SIZE = json.loads('[{"constant":false,"inputs":[{"name":"","type":"uint8"}],"name":"b","outputs":[],"type":"function"},{"constant":false,"inputs":[{"name":"","type":"int16"}],"name":"b","outputs":[],"type":"function"}]')
+
+
+def test_overload_resolution_is_memoized_by_encodability(web3, monkeypatch):
+    Contract = web3.eth.contract(OVERLOADED_BY_INT_SIZE)
+    calls = []
+    filter_by_encodability = abi_utils.filter_by_encodability
+
+    def counting_filter(*args):
+        calls.append(args)
+        return filter_by_encodability(*args)
+    monkeypatch.setattr(abi_utils, 'filter_by_encodability', counting_filter)
+
+    for value in (-5, -6, -7):
+        assert get_abi_input_types(Contract._find_matching_fn_abi('b', [value])) == ['int16']
+    assert len(calls) == 1
+
+    assert get_abi_input_types(Contract._find_matching_fn_abi('b', [300])) == ['int16']
+    with pytest.raises(ValueError):
+        Contract._find_matching_fn_abi('b', [5])
+    with pytest.raises(ValueError):
+        Contract._find_matching_fn_abi('b', [5])
+    with pytest.raises(ValueError):
+        Contract._find_matching_fn_abi('b', [2 ** 20])
+    assert len(calls) == 5
+
+
+def test_function_abi_index_is_built_per_class(web3):
+    Contract = web3.eth.contract(SINGLE_FN_ONE_ARG)
+    OtherContract = web3.eth.contract(MULTIPLE_FUNCTIONS)
+
+    assert Contract._function_abi_index is not None
+    assert Contract._function_abi_index.abi is Contract.abi
+    assert OtherContract._get_function_abi_index() is not Contract._get_function_abi_index()
+
+    fn_abi = Contract._find_matching_fn_abi('a', [1])
+    assert Contract._get_function_abi_index().get_selector(fn_abi) == '0xf0fdf834'
+    assert Contract._get_function_abi_index().get_output_types(fn_abi) == []
@@ -0,0 +1,253 @@
+import json
+
+import pytest
+
+from eth_abi import (
+    decode_abi,
+    encode_abi,
+    encode_single,
+)
+from eth_utils import (
+    decode_hex,
+    encode_hex,
+    function_signature_to_4byte_selector,
+)
+
+from web3 import Web3
+from web3.contract import (
+    Contract,
+    MULTICALL_AGGREGATE_SELECTOR,
+)
+from web3.exceptions import (
+    BadFunctionCallOutput,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+TOKEN_ABI = [
+    {
+        'constant': True,
+        'inputs': [{'name': 'owner', 'type': 'address'}],
+        'name': 'balanceOf',
+        'outputs': [{'name': '', 'type': 'uint256'}],
+        'payable': False,
+        'type': 'function',
+    },
+    {
+        'constant': True,
+        'inputs': [],
+        'name': 'symbol',
+        'outputs': [{'name': '', 'type': 'bytes32'}],
+        'payable': False,
+        'type': 'function',
+    },
+]
+
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector('balanceOf(address)')
+SYMBOL_SELECTOR = function_signature_to_4byte_selector('symbol()')
+
+OWNER = '0x' + '11' * 20
+AGGREGATOR = '0x' + 'aa' * 20
+BROKEN_TOKEN = '0x' + 'ee' * 20
+
+
+def token_address(index):
+    return '0x' + '{0:040x}'.format(index + 1)
+
+
+def execute_call(to, data):
+    """
+    Returns the return data of a call to token ``to`` where each token holds
+    a balance of ``1000 * token_index`` for every owner.
+    """
+    if to == BROKEN_TOKEN:
+        raise ValueError("execution reverted")
+
+    index = int(to, 16) - 1
+    selector, arguments = data[:4], data[4:]
+    if selector == BALANCE_OF_SELECTOR:
+        owner, = decode_abi(['address'], arguments)
+        assert owner == OWNER
+        return encode_single('uint256', 1000 * index)
+    elif selector == SYMBOL_SELECTOR:
+        return encode_single('bytes32', 'T{0}'.format(index).encode('ascii'))
+    raise AssertionError("Unknown selector")
+
+
+class MulticallProvider(BaseProvider):
+    def __init__(self):
+        self.batches = []
+        self.calls = []
+
+    def make_request(self, method, params):
+        assert method == 'eth_call'
+        self.calls.append(params)
+        transaction, _ = params
+        data = decode_hex(transaction['data'])
+
+        try:
+            if transaction['to'] == AGGREGATOR:
+                assert data[:4] == MULTICALL_AGGREGATE_SELECTOR
+                targets, call_data = decode_abi(['address[]', 'bytes[]'], data[4:])
+                result = encode_abi(['bytes[]'], [[
+                    execute_call(target, target_data)
+                    for target, target_data
+                    in zip(targets, call_data)
+                ]])
+            else:
+                result = execute_call(transaction['to'], data)
+        except ValueError as err:
+            return json.dumps({
+                'jsonrpc': '2.0',
+                'id': 1,
+                'error': {'code': -32000, 'message': str(err)},
+            })
+        return json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': encode_hex(result)})
+
+    def make_batch_request(self, requests):
+        self.batches.append(len(requests))
+        return super(MulticallProvider, self).make_batch_request(requests)
+
+    def isConnected(self):
+        return True
+
+
+@pytest.fixture()
+def provider():
+    return MulticallProvider()
+
+
+@pytest.fixture()
+def multicall_web3(provider):
+    web3 = Web3(provider)
+    web3.eth.defaultAccount = OWNER
+    return web3
+
+
+@pytest.fixture()
+def tokens(multicall_web3):
+    Token = multicall_web3.eth.contract(abi=TOKEN_ABI)
+    return [Token(token_address(index)) for index in range(25)]
+
+
+def test_multicall_sends_a_single_batch(multicall_web3, provider, tokens):
+    balances = Contract.multicall([
+        (token, 'balanceOf', [OWNER])
+        for token
+        in tokens
+    ])
+
+    assert balances == [1000 * index for index in range(25)]
+    assert provider.batches == [25]
+
+
+def test_multicall_respects_batch_size(multicall_web3, provider, tokens):
+    balances = Contract.multicall(
+        [(token, 'balanceOf', [OWNER]) for token in tokens],
+        batch_size=10,
+    )
+
+    assert balances == [1000 * index for index in range(25)]
+    assert provider.batches == [10, 10, 5]
+
+
+def test_multicall_mixes_functions_and_kwargs(multicall_web3, tokens):
+    results = Contract.multicall([
+        (tokens[1], 'symbol'),
+        (tokens[2], 'balanceOf', [], {'owner': OWNER}),
+    ])
+
+    assert results == ['T1'.ljust(32, '\x00'), 2000]
+
+
+def test_multicall_passes_block_identifier(multicall_web3, provider, tokens):
+    Contract.multicall([(tokens[0], 'symbol')], block_identifier=12)
+
+    transaction, block_identifier = provider.calls[0]
+    assert block_identifier == '0xc'
+    assert transaction['from'] == OWNER
+    assert transaction['to'] == tokens[0].address
+
+
+def test_multicall_matches_individual_calls(multicall_web3, tokens):
+    balances = Contract.multicall([
+        (token, 'balanceOf', [OWNER])
+        for token
+        in tokens[:3]
+    ])
+
+    assert balances == [token.call().balanceOf(OWNER) for token in tokens[:3]]
+
+
+def test_multicall_with_aggregator(multicall_web3, provider, tokens):
+    results = Contract.multicall(
+        [(token, 'balanceOf', [OWNER]) for token in tokens] + [(tokens[3], 'symbol')],
+        aggregator=AGGREGATOR,
+    )
+
+    assert results[:-1] == [1000 * index for index in range(25)]
+    assert results[-1] == 'T3'.ljust(32, '\x00')
+    assert len(provider.calls) == 1
+    assert provider.batches == []
+
+
+def test_multicall_raises_first_error(multicall_web3, tokens):
+    Token = multicall_web3.eth.contract(abi=TOKEN_ABI)
+
+    with pytest.raises(ValueError):
+        Contract.multicall([
+            (tokens[0], 'balanceOf', [OWNER]),
+            (Token(BROKEN_TOKEN), 'balanceOf', [OWNER]),
+        ])
+
+
+def test_multicall_returns_errors(multicall_web3, tokens):
+    Token = multicall_web3.eth.contract(abi=TOKEN_ABI)
+
+    results = Contract.multicall(
+        [
+            (tokens[1], 'balanceOf', [OWNER]),
+            (Token(BROKEN_TOKEN), 'balanceOf', [OWNER]),
+        ],
+        raise_errors=False,
+    )
+
+    assert results[0] == 1000
+    assert isinstance(results[1], ValueError)
+
+
+def test_multicall_aggregator_error(multicall_web3, tokens):
+    Token = multicall_web3.eth.contract(abi=TOKEN_ABI)
+
+    with pytest.raises(ValueError):
+        Contract.multicall(
+            [(Token(BROKEN_TOKEN), 'balanceOf', [OWNER])],
+            aggregator=AGGREGATOR,
+        )
+
+
+def test_multicall_requires_addresses(multicall_web3):
+    Token = multicall_web3.eth.contract(abi=TOKEN_ABI)
+
+    with pytest.raises(ValueError):
+        Contract.multicall([(Token, 'symbol')])
+
+
+def test_multicall_rejects_to_in_transaction(multicall_web3, tokens):
+    with pytest.raises(ValueError):
+        Contract.multicall([(tokens[0], 'symbol')], transaction={'to': AGGREGATOR})
+
+
+def test_multicall_undecodable_output(multicall_web3, provider, tokens):
+    provider.make_request = lambda method, params: json.dumps(
+        {'jsonrpc': '2.0', 'id': 1, 'result': '0x1234'}
+    )
+
+    with pytest.raises(BadFunctionCallOutput):
+        Contract.multicall([(tokens[0], 'symbol')])
+
+
+def test_empty_multicall():
+    assert Contract.multicall([]) == []
@@ -61,3 +61,11 @@ def test_eth_getBlock_using_earliest(web3):
 
     block_1 = web3.eth.getBlock(0)
     assert block == block_1
+
+
+def test_eth_getBlock_lazy(web3):
+    block_1 = web3.eth.getBlock(1, True)
+    lazy_block_1 = web3.eth.getBlock(1, True, lazy=True)
+
+    assert lazy_block_1['number'] == 1
+    assert lazy_block_1 == block_1
@@ -0,0 +1,76 @@
+import pytest
+
+from web3.main import Web3
+from web3.providers.rpc import (
+    HTTPProvider,
+)
+from web3.providers.tester import (
+    TestRPCProvider,
+)
+from web3.utils.compat import (
+    THREADING_BACKEND,
+    spawn,
+)
+
+from tests.providers.conftest import get_open_port
+
+
+pytestmark = pytest.mark.skipif(
+    THREADING_BACKEND != 'stdlib',
+    reason="Session strategies only apply to the requests based backend",
+)
+
+
+@pytest.fixture()
+def endpoint_uri():
+    port = get_open_port()
+    provider = TestRPCProvider(port=port)
+    yield provider.endpoint_uri
+    provider.server.shutdown()
+    provider.server.server_close()
+
+
+def test_pool_options_are_applied(endpoint_uri):
+    provider = HTTPProvider(endpoint_uri, pool_maxsize=3, pool_block=True)
+    web3 = Web3(provider)
+
+    for _ in range(5):
+        assert web3.eth.blockNumber == 0
+
+    stats = provider.get_pool_stats()
+
+    assert stats['session_strategy'] == 'shared'
+    assert len(stats['pools']) == 1
+    assert stats['pools'][0]['maxsize'] == 3
+    assert stats['pools'][0]['num_requests'] == 5
+    # The connection is kept alive and reused.
+    assert stats['pools'][0]['num_connections'] == 1
+
+
+def test_providers_with_different_options_do_not_share_sessions(endpoint_uri):
+    small = HTTPProvider(endpoint_uri, pool_maxsize=2)
+    large = HTTPProvider(endpoint_uri, pool_maxsize=20)
+
+    Web3(small).eth.blockNumber
+
+    assert small.get_pool_stats()['pools'][0]['maxsize'] == 2
+    assert large.get_pool_stats()['pools'] == []
+
+
+def test_per_thread_sessions(endpoint_uri):
+    provider = HTTPProvider(endpoint_uri, session_strategy='per-thread')
+    web3 = Web3(provider)
+
+    web3.eth.blockNumber
+    other_thread_stats = spawn(provider.get_pool_stats).get()
+
+    assert provider.get_pool_stats()['pools'][0]['num_requests'] == 1
+    assert other_thread_stats['session_strategy'] == 'per-thread'
+    assert other_thread_stats['pools'] == []
+
+
+def test_unknown_session_strategy(endpoint_uri):
+    provider = HTTPProvider(endpoint_uri, session_strategy='global')
+
+    with pytest.raises(ValueError):
+        provider.make_request('eth_blockNumber', [])
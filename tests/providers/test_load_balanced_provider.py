@@ -0,0 +1,177 @@
+import json
+
+import pytest
+
+from eth_utils import (
+    force_bytes,
+    force_text,
+)
+
+from web3.main import Web3
+from web3.providers.balancer import (
+    LoadBalancedHTTPProvider,
+)
+from web3.utils.compat import (
+    make_server,
+    spawn,
+)
+
+from tests.providers.conftest import get_open_port
+
+
+class FakeNode(object):
+    """
+    WSGI application answering every request with the name of the node, or
+    with a ``500`` while ``is_failing`` is set.
+    """
+    is_failing = False
+
+    def __init__(self, name):
+        self.name = name
+        self.methods = []
+
+    def __call__(self, environ, start_response):
+        body = environ['wsgi.input'].read(int(environ.get('CONTENT_LENGTH') or 0))
+        request = json.loads(force_text(body))
+
+        if self.is_failing:
+            start_response('500 Internal Server Error', [('Content-Type', 'text/plain')])
+            return [b'failing']
+
+        if isinstance(request, list):
+            self.methods.extend(item['method'] for item in request)
+            response = [
+                {'jsonrpc': '2.0', 'id': item['id'], 'result': self.name}
+                for item in request
+            ]
+        else:
+            self.methods.append(request['method'])
+            response = {'jsonrpc': '2.0', 'id': request['id'], 'result': self.name}
+
+        start_response('200 OK', [('Content-Type', 'application/json')])
+        return [force_bytes(json.dumps(response))]
+
+
+@pytest.fixture()
+def nodes():
+    servers = []
+    nodes = []
+
+    for name in ('node-a', 'node-b', 'node-c'):
+        port = get_open_port()
+        node = FakeNode(name)
+        node.endpoint_uri = 'http://127.0.0.1:{0}'.format(port)
+        server = make_server('127.0.0.1', port, node)
+        spawn(server.serve_forever)
+        servers.append(server)
+        nodes.append(node)
+
+    yield nodes
+
+    for server in servers:
+        try:
+            server.stop()
+        except AttributeError:
+            server.shutdown()
+        server.server_close()
+
+
+def get_web3(nodes, **kwargs):
+    provider = LoadBalancedHTTPProvider([node.endpoint_uri for node in nodes], **kwargs)
+    return Web3(provider)
+
+
+def test_round_robin_spreads_reads(nodes):
+    web3 = get_web3(nodes)
+
+    results = [
+        web3._requestManager.request_blocking('eth_blockNumber', [])
+        for _ in range(6)
+    ]
+
+    assert results == ['node-a', 'node-b', 'node-c'] * 2
+
+
+def test_writes_go_to_first_healthy_node(nodes):
+    web3 = get_web3(nodes)
+
+    for _ in range(3):
+        web3._requestManager.request_blocking('eth_sendRawTransaction', ['0x'])
+
+    assert nodes[0].methods == ['eth_sendRawTransaction'] * 3
+    assert nodes[1].methods == []
+
+
+def test_reads_fail_over_and_eject_failing_node(nodes):
+    web3 = get_web3(nodes, strategy='least-in-flight', eject_for=60)
+    nodes[0].is_failing = True
+
+    results = [
+        web3._requestManager.request_blocking('eth_blockNumber', [])
+        for _ in range(4)
+    ]
+
+    assert 'node-a' not in results
+    assert nodes[0].methods == []
+    assert not web3.currentProvider.endpoints[0].is_healthy
+
+
+def test_writes_are_not_retried(nodes):
+    web3 = get_web3(nodes)
+    nodes[0].is_failing = True
+
+    with pytest.raises(IOError):
+        web3._requestManager.request_blocking('eth_sendRawTransaction', ['0x'])
+
+    assert nodes[1].methods == []
+    assert nodes[2].methods == []
+
+    # The failed node is ejected so the next write goes to the next node.
+    web3._requestManager.request_blocking('eth_sendRawTransaction', ['0x'])
+    assert nodes[1].methods == ['eth_sendRawTransaction']
+
+
+def test_ejected_node_is_probed_and_restored(nodes):
+    web3 = get_web3(nodes, eject_for=0)
+    provider = web3.currentProvider
+    nodes[0].is_failing = True
+
+    web3._requestManager.request_blocking('eth_blockNumber', [])
+    assert not provider.endpoints[0].is_healthy
+
+    nodes[0].is_failing = False
+    provider.get_candidates(read_only=True)
+    for _ in range(100):
+        if provider.endpoints[0].is_healthy:
+            break
+        web3._requestManager.request_blocking('eth_blockNumber', [])
+
+    assert provider.endpoints[0].is_healthy
+    assert 'web3_clientVersion' in nodes[0].methods
+
+
+def test_batches_are_balanced(nodes):
+    web3 = get_web3(nodes, strategy='latency')
+
+    batch = web3.createBatch()
+    batch.version.node
+    batch.version.node
+    results = batch.execute()
+
+    assert len(set(results)) == 1
+
+
+def test_all_nodes_failing(nodes):
+    web3 = get_web3(nodes)
+    for node in nodes:
+        node.is_failing = True
+
+    with pytest.raises(IOError):
+        web3._requestManager.request_blocking('eth_blockNumber', [])
+
+    assert web3.isConnected() is False
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        LoadBalancedHTTPProvider(['http://127.0.0.1:8545'], strategy='random')
@@ -0,0 +1,157 @@
+import json
+import os
+import tempfile
+
+import pytest
+
+from eth_utils import (
+    force_bytes,
+    force_text,
+)
+
+from web3.main import Web3
+from web3.providers.ipc import (
+    PersistentIPCProvider,
+)
+from web3.utils.compat import (
+    socket,
+    spawn,
+)
+from web3.utils.streaming import (
+    JSONMessageFramer,
+)
+
+
+def serve_out_of_order(server_sock, batch_size):
+    """
+    Reads requests until ``batch_size`` of them have arrived and then answers
+    them in reverse order, one byte at a time.
+    """
+    conn, _ = server_sock.accept()
+    framer = JSONMessageFramer()
+    while True:
+        pending = []
+        while len(pending) < batch_size:
+            data = conn.recv(4096)
+            if not data:
+                conn.close()
+                return
+            pending.extend(
+                json.loads(force_text(message))
+                for message in framer.feed(data)
+            )
+        for request in reversed(pending):
+            if isinstance(request, list):
+                response = [
+                    {'jsonrpc': '2.0', 'id': item['id'], 'result': item['method']}
+                    for item in request
+                ]
+            else:
+                response = {
+                    'jsonrpc': '2.0', 'id': request['id'], 'result': request['method'],
+                }
+            response_data = force_bytes(json.dumps(response))
+            for index in range(len(response_data)):
+                conn.sendall(response_data[index:index + 1])
+
+
+def serve_invalid_request_errors(server_sock, batch_size=None):
+    """
+    Answers every request with an error which has a `null` id, as nodes do
+    for requests they cannot parse.
+    """
+    conn, _ = server_sock.accept()
+    framer = JSONMessageFramer()
+    while True:
+        data = conn.recv(4096)
+        if not data:
+            conn.close()
+            return
+        for _ in framer.feed(data):
+            response = {
+                'jsonrpc': '2.0',
+                'id': None,
+                'error': {'code': -32600, 'message': 'invalid request'},
+            }
+            conn.sendall(force_bytes(json.dumps(response)))
+
+
+@pytest.fixture()
+def ipc_server():
+    def _ipc_server(batch_size, serve=serve_out_of_order):
+        ipc_path = os.path.join(tempfile.mkdtemp(), 'test.ipc')
+        server_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server_sock.bind(ipc_path)
+        server_sock.listen(1)
+        spawn(serve, server_sock=server_sock, batch_size=batch_size)
+        return ipc_path
+    return _ipc_server
+
+
+def test_persistent_ipc_provider_pipelines_requests(ipc_server):
+    provider = PersistentIPCProvider(ipc_server(batch_size=3), timeout=5)
+    web3 = Web3(provider)
+
+    results = {}
+
+    def make_request(method):
+        results[method] = web3._requestManager.request_blocking(method, [])
+
+    threads = [
+        spawn(make_request, method=method)
+        for method in ('eth_mining', 'net_listening', 'txpool_status')
+    ]
+    for thread in threads:
+        thread.join(5)
+
+    assert results == {
+        'eth_mining': 'eth_mining',
+        'net_listening': 'net_listening',
+        'txpool_status': 'txpool_status',
+    }
+    provider.close()
+
+
+def test_persistent_ipc_provider_batch_requests(ipc_server):
+    provider = PersistentIPCProvider(ipc_server(batch_size=1), timeout=5)
+    web3 = Web3(provider)
+
+    batch = web3.createBatch()
+    batch.eth.mining
+    batch.net.listening
+
+    assert batch.execute() == ['eth_mining', 'net_listening']
+    provider.close()
+
+
+def test_persistent_ipc_provider_unmatched_error(ipc_server):
+    provider = PersistentIPCProvider(
+        ipc_server(batch_size=1, serve=serve_invalid_request_errors),
+        timeout=5,
+    )
+    web3 = Web3(provider)
+
+    with pytest.raises(ValueError):
+        web3._requestManager.request_blocking('eth_mining', [])
+
+    batch = web3.createBatch()
+    batch.eth.mining
+    batch.net.listening
+    with pytest.raises(ValueError):
+        batch.execute()
+    provider.close()
+
+
+def test_persistent_ipc_provider_request_after_close(ipc_server):
+    provider = PersistentIPCProvider(ipc_server(batch_size=1), timeout=5)
+    connection = provider.get_connection()
+    connection.close()
+
+    with pytest.raises(IOError):
+        connection.request(1, b'{}')
+    assert connection._pending == {}
+
+
+def test_persistent_ipc_provider_not_connected():
+    provider = PersistentIPCProvider(ipc_path='nonexistent')
+    assert provider.isConnected() is False
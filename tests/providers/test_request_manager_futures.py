@@ -0,0 +1,88 @@
+import pytest
+
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.providers.manager import (
+    RequestManager,
+)
+from web3.utils.compat import (
+    sleep,
+    threading,
+)
+
+
+class CountingProvider(BaseProvider):
+    """
+    Answers `echo` requests with their first param, keeping track of how
+    many requests are in flight at once.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def make_request(self, method, params):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        sleep(0.001)
+        with self.lock:
+            self.in_flight -= 1
+
+        if method == 'echo':
+            return {'jsonrpc': '2.0', 'id': 1, 'result': params[0]}
+        return {'jsonrpc': '2.0', 'id': 1, 'error': 'Unknown method: {0}'.format(method)}
+
+
+def test_request_async_and_receive_blocking():
+    manager = RequestManager(CountingProvider(), pool_size=2)
+
+    request_id = manager.request_async('echo', ['0x1'])
+
+    assert manager.receive_blocking(request_id, timeout=5) == '0x1'
+    with pytest.raises(KeyError):
+        manager.receive_blocking(request_id)
+
+
+def test_receive_blocking_raises_errors():
+    manager = RequestManager(CountingProvider())
+
+    request_id = manager.request_async('unknown', [])
+
+    with pytest.raises(ValueError):
+        manager.receive_blocking(request_id, timeout=5)
+
+
+def test_gather_preserves_order_and_bounds_concurrency():
+    provider = CountingProvider()
+    manager = RequestManager(provider, pool_size=3)
+
+    results = manager.gather(('echo', [index]) for index in range(50))
+
+    assert results == list(range(50))
+    assert provider.max_in_flight <= 3
+
+
+def test_gather_raises_first_error():
+    manager = RequestManager(CountingProvider(), pool_size=2)
+
+    with pytest.raises(ValueError):
+        manager.gather([('echo', [1]), ('unknown', []), ('echo', [2])])
+
+
+def test_as_completed_yields_each_request():
+    provider = CountingProvider()
+    manager = RequestManager(provider, pool_size=4)
+
+    requests = [('echo', [index]) for index in range(20)]
+    completed = [
+        (request, future.get())
+        for request, future
+        in manager.as_completed(iter(requests))
+    ]
+
+    assert sorted(completed) == sorted(
+        (request, request[1][0]) for request in requests
+    )
+    assert provider.max_in_flight <= 4
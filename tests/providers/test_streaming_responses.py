@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+
+import pytest
+
+from eth_utils import (
+    force_bytes,
+)
+
+from web3.main import Web3
+from web3.providers.ipc import (
+    IPCProvider,
+)
+from web3.providers.manager import RequestManager
+from web3.providers.tester import (
+    TestRPCProvider,
+    is_testrpc_available,
+)
+from web3.utils.compat import (
+    socket,
+    spawn,
+)
+
+
+LARGE_RESULT = ['0x' + '{0:064x}'.format(i) for i in range(20000)]
+
+
+def serve_large_response(server_sock):
+    """
+    Answers every request on a new connection with a large result, written in
+    small pieces.
+    """
+    while True:
+        conn, _ = server_sock.accept()
+        request = json.loads(conn.recv(4096).decode('utf8'))
+        response_data = force_bytes(json.dumps({
+            'jsonrpc': '2.0',
+            'id': request['id'],
+            'result': LARGE_RESULT,
+        }))
+        for index in range(0, len(response_data), 1000):
+            conn.sendall(response_data[index:index + 1000])
+        conn.close()
+
+
+@pytest.fixture()
+def ipc_path():
+    ipc_path = os.path.join(tempfile.mkdtemp(), 'test.ipc')
+    server_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server_sock.bind(ipc_path)
+    server_sock.listen(1)
+    spawn(serve_large_response, server_sock=server_sock)
+    return ipc_path
+
+
+@pytest.mark.parametrize('stream_responses', (True, False))
+def test_ipc_provider_reads_large_responses(ipc_path, stream_responses):
+    provider = IPCProvider(ipc_path, stream_responses=stream_responses)
+    manager = RequestManager(provider)
+
+    assert manager.request_blocking('txpool_content', []) == LARGE_RESULT
+
+
+def get_open_port():
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.bind(("", 0))
+    s.listen(1)
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+@pytest.mark.skipif(not is_testrpc_available, reason="`eth-testrpc` is not installed")
+def test_http_provider_streaming_responses():
+    web3 = Web3(TestRPCProvider(port=get_open_port(), stream_responses=True))
+
+    assert web3.isConnected()
+    assert web3.eth.getBlock(0)['number'] == 0
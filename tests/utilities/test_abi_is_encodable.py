@@ -1,6 +1,13 @@
 import pytest
 
+from eth_abi.abi import (
+    process_type,
+)
+
 from web3.utils.abi import (
+    check_if_arguments_can_be_encoded,
+    get_abi_type_validator,
+    get_arguments_validator,
     is_encodable,
 )
 
@@ -30,8 +37,89 @@ from web3.utils.abi import (
         (2**256, 'uint256', False),
         ('abc', 'uint256', False),
         (True, 'uint256', False),
+        (255, 'uint8', True),
+        (256, 'uint8', False),
+        (-127, 'int8', True),
+        (-128, 'int8', False),
+        # bool
+        (True, 'bool', True),
+        (1, 'bool', False),
+        # bytes and string
+        (b'12', 'bytes2', True),
+        ('12', 'bytes2', True),
+        (b'', 'bytes', True),
+        ('abc' * 100, 'bytes', True),
+        ('abc', 'string', True),
+        (b'abc', 'string', True),
+        (1, 'string', False),
+        # address
+        ('0xd3cda913deb6f67967b99d67acdfa1712c293601', 'address', True),
+        ('0xd3CdA913deB6f67967B99D67aCDFa1712C293601', 'address', True),
+        (b'0xd3cda913deb6f67967b99d67acdfa1712c293601', 'address', True),
+        ('d3cda913deb6f67967b99d67acdfa1712c293601', 'address', True),
+        (b'\xd3' * 20, 'address', True),
+        ('0xd3cda913deb6f67967b99d67acdfa1712c29360', 'address', False),
+        ('0xz3cda913deb6f67967b99d67acdfa1712c293601', 'address', False),
+        (1, 'address', False),
+        # arrays
+        ([1, 2, 3], 'uint8[]', True),
+        ([], 'uint8[]', True),
+        ([1, 256], 'uint8[]', False),
+        ((1, 2), 'uint8[2]', True),
+        ([1, 2, 3], 'uint8[2]', False),
+        ([[1], [2, 3]], 'uint8[][2]', True),
+        ([[1, 2]], 'uint8[2][]', True),
+        ([[1, 2, 3]], 'uint8[2][]', False),
+        ('abc', 'uint8[]', False),
     ),
 )
 def test_is_encodable(value, _type, expected):
     actual = is_encodable(_type, value)
     assert actual is expected
+
+
+def test_processed_types_share_validators():
+    assert get_abi_type_validator('uint8[2][]') is get_abi_type_validator('uint8[2][]')
+    assert is_encodable(process_type('uint8[2][]'), [[1, 2]]) is True
+    assert is_encodable(process_type('uint8[2][]'), [[1, 256]]) is False
+
+
+def test_unsupported_type():
+    with pytest.raises(ValueError):
+        is_encodable('real128x128', 1)
+
+
+def test_arguments_validator():
+    are_encodable = get_arguments_validator(['address', 'uint256'])
+
+    assert are_encodable(['0xd3cda913deb6f67967b99d67acdfa1712c293601', 1]) is True
+    assert are_encodable(['0xd3cda913deb6f67967b99d67acdfa1712c293601', -1]) is False
+    assert are_encodable(['0xd3cda913deb6f67967b99d67acdfa1712c293601']) is False
+
+
+TRANSFER_ABI = {
+    'constant': False,
+    'inputs': [
+        {'name': 'to', 'type': 'address'},
+        {'name': 'value', 'type': 'uint256'},
+    ],
+    'name': 'transfer',
+    'outputs': [],
+    'type': 'function',
+}
+
+
+@pytest.mark.parametrize(
+    'args,kwargs,expected',
+    (
+        (['0xd3cda913deb6f67967b99d67acdfa1712c293601', 1], {}, True),
+        (['0xd3cda913deb6f67967b99d67acdfa1712c293601'], {'value': 1}, True),
+        ([], {'to': '0xd3cda913deb6f67967b99d67acdfa1712c293601', 'value': 1}, True),
+        ([], {'to': '0xd3cda913deb6f67967b99d67acdfa1712c293601', 'value': -1}, False),
+        (['0xd3cda913deb6f67967b99d67acdfa1712c293601'], {}, False),
+        (['0xd3cda913deb6f67967b99d67acdfa1712c293601'], {'amount': 1}, False),
+        (['0xd3cda913deb6f67967b99d67acdfa1712c293601', 1], {'value': 1}, False),
+    ),
+)
+def test_check_if_arguments_can_be_encoded(args, kwargs, expected):
+    assert check_if_arguments_can_be_encoded(TRANSFER_ABI, args, kwargs) is expected
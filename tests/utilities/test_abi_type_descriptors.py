@@ -0,0 +1,75 @@
+import pytest
+
+from eth_abi.abi import (
+    process_type,
+)
+
+from web3.utils.abi import (
+    get_abi_type_descriptor,
+    normalize_event_input_types,
+    normalize_return_type,
+    process_abi_type,
+)
+from web3.utils.events import (
+    is_dynamic_sized_type,
+)
+
+
+@pytest.mark.parametrize(
+    'abi_type,is_recognized,is_probably_enum,normalized_type,is_dynamic',
+    (
+        ('uint256', True, False, 'uint256', False),
+        ('address[2]', True, False, 'address[2]', True),
+        ('bytes', True, False, 'bytes', True),
+        ('bytes32', True, False, 'bytes32', False),
+        ('string', True, False, 'string', True),
+        ('Lib.Status', False, True, 'uint8', False),
+        ('uint7', False, False, 'uint7', None),
+    ),
+)
+def test_abi_type_descriptor(abi_type,
+                             is_recognized,
+                             is_probably_enum,
+                             normalized_type,
+                             is_dynamic):
+    descriptor = get_abi_type_descriptor(abi_type)
+
+    assert descriptor.abi_type == abi_type
+    assert descriptor.is_recognized is is_recognized
+    assert descriptor.is_probably_enum is is_probably_enum
+    assert descriptor.normalized_type == normalized_type
+    assert descriptor.is_dynamic is is_dynamic
+
+
+def test_abi_type_descriptors_are_memoized():
+    assert get_abi_type_descriptor('uint256[]') is get_abi_type_descriptor('uint256[]')
+    assert process_abi_type('uint256[2][]') == process_type('uint256[2][]')
+    assert process_abi_type('uint256[2][]') is process_abi_type('uint256[2][]')
+
+
+def test_invalid_abi_type():
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            process_abi_type('uint7')
+        with pytest.raises(ValueError):
+            is_dynamic_sized_type('uint7')
+
+
+def test_normalize_event_input_types():
+    inputs = [
+        {'indexed': True, 'name': 'status', 'type': 'Lib.Status'},
+        {'indexed': False, 'name': 'value', 'type': 'uint256'},
+    ]
+    normalized = normalize_event_input_types(inputs)
+
+    assert normalized[0] == {'indexed': True, 'name': 'status', 'type': 'uint8'}
+    assert normalized[1] is inputs[1]
+
+
+@pytest.mark.parametrize(
+    'data_type',
+    ('address[]', process_type('address[]')),
+)
+def test_normalize_return_type_with_processed_type(data_type):
+    actual = normalize_return_type(data_type, ['01' * 20, '0x' + '02' * 20])
+    assert actual == ['0x' + '01' * 20, '0x' + '02' * 20]
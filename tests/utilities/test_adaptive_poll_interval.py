@@ -0,0 +1,190 @@
+import json
+
+import pytest
+
+from web3 import Web3
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.utils import polling
+from web3.utils.compat import (
+    Timeout,
+)
+from web3.utils.polling import (
+    AdaptivePollInterval,
+    is_transient_error,
+)
+from web3.utils.transactions import (
+    wait_for_transaction_receipt,
+)
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(polling.time, 'time', clock.time)
+    return clock
+
+
+def test_interval_backs_off_while_polls_are_empty():
+    adaptive_interval = AdaptivePollInterval(min_interval=0.1, max_interval=1, backoff=2)
+
+    intervals = []
+    for _ in range(6):
+        adaptive_interval.record_poll(False)
+        intervals.append(adaptive_interval.interval)
+
+    assert intervals == [0.2, 0.4, 0.8, 1, 1, 1]
+
+    adaptive_interval.record_poll(True)
+    assert adaptive_interval.interval == 0.1
+
+
+def test_interval_is_capped_by_half_the_block_time(clock):
+    adaptive_interval = AdaptivePollInterval(min_interval=0.1, max_interval=5, backoff=2)
+
+    adaptive_interval.record_block(10)
+    clock.now += 2
+    assert adaptive_interval.record_block(11) is True
+    clock.now += 2
+    assert adaptive_interval.record_block(11) is False
+    assert adaptive_interval.block_time == 2
+
+    for _ in range(10):
+        adaptive_interval.record_poll(False)
+    assert adaptive_interval.interval == 1
+
+
+def test_block_time_is_per_block(clock):
+    adaptive_interval = AdaptivePollInterval()
+
+    adaptive_interval.record_block(10)
+    clock.now += 12
+    adaptive_interval.record_block(14)
+    assert adaptive_interval.block_time == 3
+
+    clock.now += 7
+    adaptive_interval.record_block()
+    assert adaptive_interval.block_time == 0.75 * 3 + 0.25 * 7
+
+
+def test_new_block_resets_interval():
+    adaptive_interval = AdaptivePollInterval(min_interval=0.1, max_interval=1)
+    for _ in range(10):
+        adaptive_interval.record_poll(False)
+    assert adaptive_interval.interval == 1
+
+    adaptive_interval.record_block()
+    assert adaptive_interval.interval == 0.1
+
+
+def test_errors_back_off_exponentially():
+    adaptive_interval = AdaptivePollInterval(min_interval=0.1, max_error_interval=1)
+
+    intervals = []
+    for _ in range(5):
+        adaptive_interval.record_error()
+        intervals.append(adaptive_interval.interval)
+
+    assert intervals == [0.2, 0.4, 0.8, 1, 1]
+
+    adaptive_interval.record_poll(False)
+    assert adaptive_interval.errors == 0
+    assert adaptive_interval.interval < 1
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    (
+        {'min_interval': 0},
+        {'min_interval': 2, 'max_interval': 1},
+        {'backoff': 0.5},
+    ),
+)
+def test_invalid_intervals(kwargs):
+    with pytest.raises(ValueError):
+        AdaptivePollInterval(**kwargs)
+
+
+@pytest.mark.parametrize(
+    'error,expected',
+    (
+        (IOError(), True),
+        (OSError(), True),
+        (ValueError({'code': -32000}), False),
+    ),
+)
+def test_is_transient_error(error, expected):
+    assert is_transient_error(error) is expected
+
+
+class ReceiptProvider(BaseProvider):
+    """
+    Fails the first ``num_errors`` receipt requests with a connection error,
+    then returns no receipt ``num_pending`` times.  The block number is taken
+    from ``block_numbers`` for each receipt request, staying at the last one.
+    """
+    def __init__(self, num_errors, num_pending, error=IOError, block_numbers=(1,)):
+        self.num_errors = num_errors
+        self.num_pending = num_pending
+        self.error = error
+        self.block_numbers = list(block_numbers)
+        self.num_requests = 0
+
+    def make_request(self, method, params):
+        if method == 'eth_blockNumber':
+            if len(self.block_numbers) > 1:
+                block_number = self.block_numbers.pop(0)
+            else:
+                block_number = self.block_numbers[0]
+            return json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': hex(block_number)})
+
+        assert method == 'eth_getTransactionReceipt'
+        self.num_requests += 1
+        if self.num_errors:
+            self.num_errors -= 1
+            raise self.error("Connection refused")
+        if self.num_pending:
+            self.num_pending -= 1
+            return json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': None})
+        return json.dumps({
+            'jsonrpc': '2.0',
+            'id': 1,
+            'result': {'transactionHash': params[0], 'blockNumber': '0x1', 'logs': []},
+        })
+
+
+def test_wait_for_transaction_receipt_retries_connection_errors():
+    provider = ReceiptProvider(num_errors=2, num_pending=2)
+
+    receipt = wait_for_transaction_receipt(Web3(provider), '0x' + '01' * 32, timeout=5)
+
+    assert receipt['blockNumber'] == 1
+    assert provider.num_requests == 5
+
+
+def test_wait_for_transaction_receipt_polls_quickly_after_a_new_block(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(Timeout, 'sleep', lambda timeout, seconds: sleeps.append(seconds))
+    provider = ReceiptProvider(num_errors=0, num_pending=6, block_numbers=(1, 1, 1, 1, 2))
+
+    wait_for_transaction_receipt(Web3(provider), '0x' + '01' * 32, timeout=5)
+
+    assert len(sleeps) == 6
+    assert sleeps[0] < sleeps[1] < sleeps[2] < sleeps[3]
+    assert sleeps[4] == sleeps[0] == 0.1
+
+
+def test_wait_for_transaction_receipt_raises_node_errors():
+    provider = ReceiptProvider(num_errors=1, num_pending=0, error=ValueError)
+
+    with pytest.raises(ValueError):
+        wait_for_transaction_receipt(Web3(provider), '0x' + '01' * 32, timeout=5)
@@ -0,0 +1,208 @@
+import json
+
+import pytest
+
+from web3 import Web3
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.utils.filters import (
+    BLOCK_ADDED,
+    BLOCK_REMOVED,
+    BlockFollower,
+    BlockReorgTooDeep,
+)
+
+
+def make_hash(fork, block_number):
+    return '0x' + '{0:032x}{1:032x}'.format(fork, block_number)
+
+
+class ChainProvider(BaseProvider):
+    """
+    A chain of empty blocks with one log each, which can be extended or have
+    its most recent blocks replaced.  The reported head is ``head_offset``
+    blocks ahead of the blocks which can be fetched, and fetching block
+    ``fail_at_block`` fails with a connection error.
+    """
+    def __init__(self, num_blocks, head_offset=0):
+        self.hashes = []
+        self.num_forks = 0
+        self.head_offset = head_offset
+        self.fail_at_block = None
+        self.requests = []
+        self.mine(num_blocks)
+
+    def mine(self, num_blocks=1):
+        for _ in range(num_blocks):
+            self.hashes.append(make_hash(self.num_forks, len(self.hashes)))
+
+    def reorg(self, depth, num_blocks):
+        self.num_forks += 1
+        del self.hashes[-depth:]
+        self.mine(num_blocks)
+
+    def get_block(self, block_number):
+        if block_number >= len(self.hashes):
+            return None
+        return {
+            'number': hex(block_number),
+            'hash': self.hashes[block_number],
+            'parentHash': self.hashes[block_number - 1] if block_number else '0x' + '00' * 32,
+            'timestamp': hex(block_number),
+        }
+
+    def get_logs(self, block_number):
+        if block_number >= len(self.hashes):
+            return []
+        return [{
+            'address': '0x' + '00' * 20,
+            'blockHash': self.hashes[block_number],
+            'blockNumber': hex(block_number),
+            'data': '0x',
+            'logIndex': '0x0',
+            'topics': [],
+            'transactionHash': self.hashes[block_number],
+            'transactionIndex': '0x0',
+        }]
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        if method == 'eth_blockNumber':
+            result = hex(len(self.hashes) - 1 + self.head_offset)
+        elif method == 'eth_getBlockByNumber':
+            if int(params[0], 16) == self.fail_at_block:
+                raise IOError("Connection reset")
+            result = self.get_block(int(params[0], 16))
+        elif method == 'eth_getLogs':
+            assert params[0]['fromBlock'] == params[0]['toBlock']
+            result = self.get_logs(int(params[0]['fromBlock'], 16))
+        else:
+            raise AssertionError("Unexpected request: {0}".format(method))
+        return json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': result})
+
+
+def summarize(events):
+    return [
+        (event['type'], event['block']['number'], event['block']['hash'])
+        for event
+        in events
+    ]
+
+
+def test_follower_adds_blocks_in_order():
+    provider = ChainProvider(num_blocks=5)
+    follower = BlockFollower(Web3(provider), from_block=2, filter_params={})
+
+    events = list(follower.poll())
+    assert summarize(events) == [
+        (BLOCK_ADDED, number, make_hash(0, number)) for number in range(2, 5)
+    ]
+    assert [event['logs'][0]['blockNumber'] for event in events] == [2, 3, 4]
+
+    assert list(follower.poll()) == []
+
+    provider.mine(2)
+    assert summarize(list(follower.poll())) == [
+        (BLOCK_ADDED, 5, make_hash(0, 5)),
+        (BLOCK_ADDED, 6, make_hash(0, 6)),
+    ]
+
+
+def test_follower_starts_at_latest_block():
+    provider = ChainProvider(num_blocks=5)
+    follower = BlockFollower(Web3(provider))
+
+    assert summarize(list(follower.poll())) == [(BLOCK_ADDED, 4, make_hash(0, 4))]
+    assert 'eth_getLogs' not in provider.requests
+
+
+def test_follower_waits_for_blocks_beyond_the_head():
+    provider = ChainProvider(num_blocks=5, head_offset=1)
+    follower = BlockFollower(Web3(provider), from_block=3, filter_params={})
+
+    assert summarize(list(follower.poll())) == [
+        (BLOCK_ADDED, 3, make_hash(0, 3)),
+        (BLOCK_ADDED, 4, make_hash(0, 4)),
+    ]
+    assert list(follower.poll()) == []
+
+    provider.mine()
+    assert summarize(list(follower.poll())) == [(BLOCK_ADDED, 5, make_hash(0, 5))]
+
+
+def test_follower_removes_reorged_blocks():
+    provider = ChainProvider(num_blocks=10)
+    follower = BlockFollower(Web3(provider), from_block=0, filter_params={})
+    list(follower.poll())
+
+    provider.reorg(depth=3, num_blocks=4)
+    events = list(follower.poll())
+
+    assert summarize(events) == [
+        (BLOCK_REMOVED, 9, make_hash(0, 9)),
+        (BLOCK_REMOVED, 8, make_hash(0, 8)),
+        (BLOCK_REMOVED, 7, make_hash(0, 7)),
+        (BLOCK_ADDED, 7, make_hash(1, 7)),
+        (BLOCK_ADDED, 8, make_hash(1, 8)),
+        (BLOCK_ADDED, 9, make_hash(1, 9)),
+        (BLOCK_ADDED, 10, make_hash(1, 10)),
+    ]
+    assert events[0]['logs'][0]['blockHash'] == make_hash(0, 9)
+    assert events[-1]['logs'][0]['blockHash'] == make_hash(1, 10)
+
+
+def test_follower_follows_a_reorg_straight_after_starting():
+    provider = ChainProvider(num_blocks=5)
+    follower = BlockFollower(Web3(provider))
+    list(follower.poll())
+
+    provider.reorg(depth=1, num_blocks=2)
+
+    assert summarize(follower.poll()) == [
+        (BLOCK_REMOVED, 4, make_hash(0, 4)),
+        (BLOCK_ADDED, 4, make_hash(1, 4)),
+        (BLOCK_ADDED, 5, make_hash(1, 5)),
+    ]
+
+
+def test_follower_resumes_after_an_error_part_way():
+    provider = ChainProvider(num_blocks=3)
+    follower = BlockFollower(Web3(provider), from_block=0)
+    list(follower.poll())
+
+    provider.mine(5)
+    provider.fail_at_block = 6
+    events = []
+    with pytest.raises(IOError):
+        for event in follower.poll():
+            events.append(event)
+
+    provider.fail_at_block = None
+    events.extend(follower.poll())
+
+    assert [event['block']['number'] for event in events] == [3, 4, 5, 6, 7]
+
+
+def test_follower_only_remembers_max_reorg_depth_blocks():
+    provider = ChainProvider(num_blocks=10)
+    follower = BlockFollower(Web3(provider), from_block=0, max_reorg_depth=3)
+    list(follower.poll())
+    assert [block['block']['number'] for block in follower.blocks] == [7, 8, 9]
+
+    provider.reorg(depth=3, num_blocks=4)
+    with pytest.raises(BlockReorgTooDeep) as excinfo:
+        list(follower.poll())
+    assert 'deeper than the 3 blocks' in str(excinfo.value)
+
+
+def test_follower_yields_events():
+    provider = ChainProvider(num_blocks=3)
+    follower = BlockFollower(Web3(provider), from_block=0)
+
+    events = iter(follower)
+    assert [next(events)['block']['number'] for _ in range(3)] == [0, 1, 2]
+
+    provider.mine()
+    assert next(events)['block']['number'] == 3
+    events.close()
@@ -0,0 +1,140 @@
+import pytest
+
+
+from web3.utils.events import (
+    construct_event_data_filters,
+    construct_event_topic_filter,
+)
+
+
+EVENT_1_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": False,"name":"arg0","type":"uint256"},
+        {"indexed": True,"name":"arg1","type":"uint256"},
+        {"indexed": True,"name":"arg2","type":"uint256"},
+        {"indexed": False,"name":"arg3","type":"uint256"},
+        {"indexed": True,"name":"arg4","type":"uint256"},
+        {"indexed": False,"name":"arg5","type":"uint256"},
+    ],
+    "name": "Event_1",
+    "type":"event",
+}
+EVENT_1_TOPIC = '0xa7144ed450ecab4a6283d3b1e290ff6c889232d922b84d88203eb7619222fb32'
+
+EVENT_2_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": False,"name":"arg0","type":"string"},
+        {"indexed": False,"name":"arg1","type":"uint256[2]"},
+        {"indexed": False,"name":"arg2","type":"uint256[]"},
+        {"indexed": False,"name":"arg3","type":"bytes32"},
+    ],
+    "name": "Event_2",
+    "type":"event",
+}
+
+
+def hex_and_pad(i):
+    unpadded_hex_value = hex(i).rstrip('L')
+    return '0x' + unpadded_hex_value[2:].zfill(64)
+
+
+@pytest.mark.parametrize(
+    'event_abi,arguments,expected',
+    (
+        (
+            EVENT_1_ABI,
+            {},
+            [EVENT_1_TOPIC],
+        ),
+        (
+            EVENT_1_ABI,
+            {'arg0': 1, 'arg3': [1, 2]},
+            [EVENT_1_TOPIC],
+        ),
+        (
+            EVENT_1_ABI,
+            {'arg1': 1},
+            [EVENT_1_TOPIC, hex_and_pad(1)],
+        ),
+        (
+            EVENT_1_ABI,
+            {'arg1': [1, 2, 1]},
+            [EVENT_1_TOPIC, [hex_and_pad(1), hex_and_pad(2)]],
+        ),
+        (
+            EVENT_1_ABI,
+            {'arg1': [1, 3], 'arg2': [2, 4]},
+            [
+                EVENT_1_TOPIC,
+                [hex_and_pad(1), hex_and_pad(3)],
+                [hex_and_pad(2), hex_and_pad(4)],
+            ],
+        ),
+        (
+            EVENT_1_ABI,
+            {'arg1': [1, None], 'arg4': []},
+            [EVENT_1_TOPIC],
+        ),
+        (
+            EVENT_1_ABI,
+            {'arg4': 5},
+            [EVENT_1_TOPIC, None, None, hex_and_pad(5)],
+        ),
+    )
+)
+def test_construct_event_topic_filter(event_abi, arguments, expected):
+    actual = construct_event_topic_filter(event_abi, arguments)
+    assert actual == expected
+
+
+def test_topic_filter_grows_with_the_number_of_values():
+    arguments = {
+        'arg1': list(range(100)),
+        'arg2': list(range(100)),
+        'arg4': list(range(100)),
+    }
+
+    topics = construct_event_topic_filter(EVENT_1_ABI, arguments)
+
+    assert [len(values) for values in topics[1:]] == [100, 100, 100]
+
+
+@pytest.mark.parametrize(
+    'event_abi,arguments,expected',
+    (
+        (
+            EVENT_1_ABI,
+            {},
+            [],
+        ),
+        (
+            EVENT_1_ABI,
+            {'arg1': 1, 'arg3': [1, 2], 'arg5': 3},
+            [
+                (32, False, [hex_and_pad(1), hex_and_pad(2)]),
+                (64, False, [hex_and_pad(3)]),
+            ],
+        ),
+        (
+            EVENT_2_ABI,
+            {'arg2': [[]], 'arg3': b'\x01' * 32},
+            [
+                (96, True, [hex_and_pad(0)]),
+                (128, False, ['0x' + '01' * 32]),
+            ],
+        ),
+        (
+            EVENT_2_ABI,
+            {'arg0': 'a', 'arg1': [[1, 2]]},
+            [
+                (0, True, [hex_and_pad(1) + '61'.ljust(64, '0')]),
+                (32, False, [hex_and_pad(1) + hex_and_pad(2)[2:]]),
+            ],
+        ),
+    )
+)
+def test_construct_event_data_filters(event_abi, arguments, expected):
+    actual = construct_event_data_filters(event_abi, arguments)
+    assert actual == expected
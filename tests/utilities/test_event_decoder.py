@@ -0,0 +1,180 @@
+import pytest
+
+from eth_abi import (
+    encode_abi,
+)
+from eth_abi.exceptions import (
+    NonEmptyPaddingBytes,
+)
+from eth_utils import (
+    decode_hex,
+    encode_hex,
+    event_abi_to_log_topic,
+    force_text,
+)
+
+from web3.utils.compat import (
+    threading,
+)
+from web3.utils.events import (
+    EventDecoder,
+    get_event_data,
+    get_event_decoder,
+)
+
+
+def make_event_abi(inputs, anonymous=False):
+    return {
+        'anonymous': anonymous,
+        'inputs': [
+            {'indexed': indexed, 'name': name, 'type': arg_type}
+            for name, arg_type, indexed
+            in inputs
+        ],
+        'name': 'Event',
+        'type': 'event',
+    }
+
+
+def make_log_entry(event_abi, topics, data):
+    if not event_abi['anonymous']:
+        topics = [encode_hex(event_abi_to_log_topic(event_abi))] + topics
+    return {
+        'address': '0xd3cda913deb6f67967b99d67acdfa1712c293601',
+        'blockHash': '0x' + 'ab' * 32,
+        'blockNumber': 16,
+        'data': data,
+        'logIndex': 0,
+        'topics': topics,
+        'transactionHash': '0x' + 'cd' * 32,
+        'transactionIndex': 1,
+    }
+
+
+def as_bytes(log_entry):
+    """
+    Forces decoding through the generic `eth_abi` decoders.
+    """
+    return dict(
+        log_entry,
+        data=decode_hex(log_entry['data']),
+        topics=[decode_hex(topic) for topic in log_entry['topics']],
+    )
+
+
+ADDRESS = '0x' + '12' * 20
+BYTES32 = b'\x01' * 32
+
+
+@pytest.mark.parametrize(
+    'inputs,topic_values,data_values,expected_args',
+    (
+        (
+            (('from', 'address', True), ('to', 'address', True), ('value', 'uint256', False)),
+            ((ADDRESS, ADDRESS.replace('12', '34')),),
+            (12345,),
+            {'from': ADDRESS, 'to': ADDRESS.replace('12', '34'), 'value': 12345},
+        ),
+        (
+            (('flag', 'bool', True), ('small', 'uint8', False), ('id', 'bytes32', False)),
+            ((True,),),
+            (255, BYTES32),
+            {'flag': True, 'small': 255, 'id': force_text(BYTES32)},
+        ),
+        (
+            (('delta', 'int256', True), ('name', 'string', False), ('values', 'uint256[]', False)),
+            ((-5,),),
+            (b'a name', [1, 2, 3]),
+            {'delta': -5, 'name': 'a name', 'values': [1, 2, 3]},
+        ),
+    ),
+)
+def test_event_decoder(inputs, topic_values, data_values, expected_args):
+    event_abi = make_event_abi(inputs)
+    topic_types = [arg_type for _, arg_type, indexed in inputs if indexed]
+    data_types = [arg_type for _, arg_type, indexed in inputs if not indexed]
+
+    topics = [
+        encode_hex(encode_abi([topic_type], [value]))
+        for topic_type, value
+        in zip(topic_types, topic_values[0])
+    ]
+    data = encode_hex(encode_abi(data_types, list(data_values)))
+    log_entry = make_log_entry(event_abi, topics, data)
+
+    decoder = EventDecoder(event_abi)
+    event_data = decoder.decode(log_entry)
+
+    assert event_data['args'] == expected_args
+    assert event_data['event'] == 'Event'
+    assert event_data['blockNumber'] == 16
+    assert decoder.decode(as_bytes(log_entry)) == event_data
+    assert decoder.decode_logs([log_entry, log_entry]) == [event_data, event_data]
+
+
+def test_event_decoder_anonymous_event():
+    event_abi = make_event_abi((('value', 'uint256', True),), anonymous=True)
+    log_entry = make_log_entry(event_abi, ['0x' + '00' * 31 + '07'], '0x')
+
+    assert EventDecoder(event_abi).decode(log_entry)['args'] == {'value': 7}
+
+
+def test_event_decoder_checks_number_of_topics():
+    event_abi = make_event_abi((('value', 'uint256', True),))
+    log_entry = make_log_entry(event_abi, [], '0x')
+
+    with pytest.raises(ValueError):
+        EventDecoder(event_abi).decode(log_entry)
+
+
+def test_event_decoder_checks_padding():
+    event_abi = make_event_abi((('owner', 'address', True), ('value', 'uint8', False)))
+    decoder = EventDecoder(event_abi)
+
+    bad_address = make_log_entry(event_abi, ['0x' + 'ff' * 32], '0x' + '00' * 32)
+    with pytest.raises(NonEmptyPaddingBytes):
+        decoder.decode(bad_address)
+
+    bad_uint8 = make_log_entry(event_abi, ['0x' + '00' * 32], '0x' + '00' * 30 + '0101')
+    with pytest.raises(NonEmptyPaddingBytes):
+        decoder.decode(bad_uint8)
+
+
+def test_event_decoder_rejects_duplicate_names():
+    event_abi = make_event_abi((('value', 'uint256', True), ('value', 'uint256', False)))
+    log_entry = make_log_entry(event_abi, ['0x' + '00' * 32], '0x' + '00' * 32)
+
+    with pytest.raises(ValueError):
+        EventDecoder(event_abi).decode(log_entry)
+
+
+def test_get_event_decoder_is_cached():
+    event_abi = make_event_abi((('value', 'uint256', False),))
+    log_entry = make_log_entry(event_abi, [], '0x' + '00' * 31 + '01')
+
+    assert get_event_decoder(event_abi) is get_event_decoder(event_abi)
+    assert get_event_decoder(dict(event_abi)) is get_event_decoder(event_abi)
+    assert get_event_data(event_abi, log_entry)['args'] == {'value': 1}
+
+
+def test_get_event_decoder_from_many_threads():
+    event_abis = [
+        make_event_abi((('value{0}'.format(index), 'uint256', False),))
+        for index in range(300)
+    ]
+    errors = []
+
+    def get_decoders():
+        try:
+            for event_abi in event_abis:
+                assert get_event_decoder(event_abi).event_abi == event_abi
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=get_decoders) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
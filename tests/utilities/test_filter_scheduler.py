@@ -0,0 +1,251 @@
+import json
+
+from web3 import Web3
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.utils.compat import (
+    Timeout,
+    threading,
+)
+from web3.utils.filters import (
+    FilterScheduler,
+    PastLogFilter,
+    ShhFilter,
+    get_filter_scheduler,
+    set_filter_scheduler,
+)
+from web3.utils.polling import (
+    AdaptivePollInterval,
+)
+
+
+def block_hash(filter_id, block_number):
+    return '0x' + '{0:032x}{1:032x}'.format(int(filter_id, 16), block_number)
+
+
+class FilterChangesProvider(BaseProvider):
+    """
+    Serves block filters whose changes are queued with `add_block`, recording
+    the size of each batch.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.changes = {}
+        self.installed = set()
+        self.batch_sizes = []
+        self.requests = []
+        self.past_logs = []
+
+    def add_block(self, block_number):
+        with self.lock:
+            for filter_id, changes in self.changes.items():
+                changes.append(block_hash(filter_id, block_number))
+
+    def make_batch_request(self, requests):
+        with self.lock:
+            self.batch_sizes.append(len(requests))
+        return super(FilterChangesProvider, self).make_batch_request(requests)
+
+    def make_request(self, method, params):
+        with self.lock:
+            self.requests.append(method)
+            if method in ('eth_newBlockFilter', 'shh_newFilter'):
+                filter_id = hex(len(self.changes))
+                self.changes[filter_id] = []
+                self.installed.add(filter_id)
+                return self.respond(filter_id)
+            elif method in ('eth_uninstallFilter', 'shh_uninstallFilter'):
+                self.installed.discard(params[0])
+                return self.respond(True)
+            elif method in ('eth_getFilterChanges', 'shh_getFilterChanges'):
+                if params[0] not in self.installed:
+                    return json.dumps({
+                        'jsonrpc': '2.0',
+                        'id': 1,
+                        'error': {'code': -32000, 'message': 'filter not found'},
+                    })
+                changes, self.changes[params[0]] = self.changes[params[0]], []
+                return self.respond(changes)
+            elif method == 'eth_getFilterLogs':
+                return self.respond(self.past_logs)
+            raise AssertionError("Unexpected request: {0}".format(method))
+
+    def respond(self, result):
+        return json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': result})
+
+
+def wait_for(condition, seconds=5):
+    with Timeout(seconds) as timeout:
+        while not condition():
+            timeout.sleep(0.01)
+
+
+def make_web3(poll_interval=0.01, max_workers=4):
+    web3 = Web3(FilterChangesProvider())
+    set_filter_scheduler(web3, FilterScheduler(web3, poll_interval, max_workers))
+    return web3
+
+
+def test_filters_share_one_poller_and_batch():
+    web3 = make_web3()
+    provider = web3.currentProvider
+    threads_before = threading.active_count()
+
+    seen = [[] for _ in range(50)]
+    filters = [web3.eth.filter('latest') for _ in range(50)]
+    for block_filter, seen_hashes in zip(filters, seen):
+        block_filter.watch(seen_hashes.append)
+        assert block_filter.running is True
+
+    for block_number in range(3):
+        provider.add_block(block_number)
+    wait_for(lambda: all(len(seen_hashes) == 3 for seen_hashes in seen))
+
+    # The poller and at most `max_workers` callback threads.
+    assert threading.active_count() - threads_before <= 5
+    assert 50 in provider.batch_sizes
+    assert provider.requests.count('eth_getFilterChanges') == sum(provider.batch_sizes)
+    for index, seen_hashes in enumerate(seen):
+        assert seen_hashes == [block_hash(hex(index), n) for n in range(3)]
+
+    for block_filter in filters:
+        block_filter.stop_watching()
+    assert provider.installed == set()
+    wait_for(lambda: get_filter_scheduler(web3)._thread is None)
+
+
+def test_filter_which_errors_is_stopped():
+    web3 = make_web3()
+    provider = web3.currentProvider
+
+    broken_filter = web3.eth.filter('latest')
+    block_filter = web3.eth.filter('latest')
+    seen_hashes = []
+    broken_filter.watch(lambda _: _)
+    block_filter.watch(seen_hashes.append)
+
+    provider.installed.discard(broken_filter.filter_id)
+    broken_filter.join(5)
+    assert broken_filter.running is False
+    assert isinstance(broken_filter.exception, ValueError)
+    assert get_filter_scheduler(web3).filters == [block_filter]
+
+    provider.add_block(1)
+    wait_for(lambda: seen_hashes)
+    block_filter.stop_watching()
+
+
+def test_callback_which_raises_stops_its_filter():
+    web3 = make_web3()
+    provider = web3.currentProvider
+
+    def callback(_):
+        raise ZeroDivisionError()
+
+    block_filter = web3.eth.filter('latest')
+    block_filter.watch(callback)
+    provider.add_block(1)
+
+    block_filter.join(5)
+    assert block_filter.running is False
+    assert not block_filter.is_alive()
+    assert isinstance(block_filter.exception, ZeroDivisionError)
+    assert get_filter_scheduler(web3).filters == []
+    assert block_filter.filter_id not in provider.installed
+
+
+def test_join_waits_for_running_callbacks():
+    web3 = make_web3()
+    provider = web3.currentProvider
+    started = threading.Event()
+    release = threading.Event()
+    seen_hashes = []
+
+    def callback(value):
+        started.set()
+        release.wait(5)
+        seen_hashes.append(value)
+
+    block_filter = web3.eth.filter('latest')
+    block_filter.watch(callback)
+    block_filter.join(0.05)
+    assert block_filter.is_alive()
+
+    provider.add_block(1)
+    assert started.wait(5)
+    block_filter.stop_watching()
+    assert block_filter.is_alive()
+    assert not seen_hashes
+
+    release.set()
+    block_filter.join()
+    assert not block_filter.is_alive()
+    assert seen_hashes == [block_hash(block_filter.filter_id, 1)]
+
+
+def test_shh_filter_polls_shh_changes():
+    web3 = make_web3()
+    provider = web3.currentProvider
+
+    messages = []
+    shh_filter = web3.shh.filter({'topics': []})
+    assert isinstance(shh_filter, ShhFilter)
+    shh_filter.watch(messages.append)
+    provider.add_block(1)
+
+    wait_for(lambda: messages)
+    shh_filter.stop_watching()
+
+    assert 'shh_getFilterChanges' in provider.requests
+    assert 'eth_getFilterChanges' not in provider.requests
+    assert 'shh_uninstallFilter' in provider.requests
+
+
+def test_past_log_filter_uses_the_scheduler_workers():
+    web3 = make_web3()
+    provider = web3.currentProvider
+    provider.past_logs = [{'data': '0x'}, {'data': '0x'}]
+
+    seen_logs = []
+    past_log_filter = PastLogFilter(web3, '0x0')
+    past_log_filter.watch(seen_logs.append)
+
+    wait_for(lambda: past_log_filter.running is False)
+    assert len(seen_logs) == 2
+    assert get_filter_scheduler(web3)._thread is None
+
+
+class FlakyFilterChangesProvider(FilterChangesProvider):
+    def __init__(self, num_failed_batches):
+        super(FlakyFilterChangesProvider, self).__init__()
+        self.num_failed_batches = num_failed_batches
+
+    def make_batch_request(self, requests):
+        with self.lock:
+            if self.num_failed_batches:
+                self.num_failed_batches -= 1
+                raise IOError("Connection refused")
+        return super(FlakyFilterChangesProvider, self).make_batch_request(requests)
+
+
+def test_scheduler_adapts_interval():
+    web3 = Web3(FlakyFilterChangesProvider(num_failed_batches=2))
+    provider = web3.currentProvider
+    adaptive_interval = AdaptivePollInterval(min_interval=0.01, max_interval=0.05)
+    scheduler = FilterScheduler(web3, adaptive_interval=adaptive_interval)
+    set_filter_scheduler(web3, scheduler)
+
+    seen_hashes = []
+    block_filter = web3.eth.filter('latest')
+    block_filter.watch(seen_hashes.append)
+
+    wait_for(lambda: provider.num_failed_batches == 0 and provider.batch_sizes)
+    assert block_filter.running is True
+
+    wait_for(lambda: scheduler.interval == 0.05)
+    provider.add_block(1)
+    wait_for(lambda: seen_hashes)
+    assert adaptive_interval.last_block_at is not None
+
+    block_filter.stop_watching()
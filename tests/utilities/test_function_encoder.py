@@ -0,0 +1,188 @@
+import pytest
+
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+from eth_utils import (
+    add_0x_prefix,
+    decode_hex,
+    encode_hex,
+    force_text,
+    function_abi_to_4byte_selector,
+)
+
+from web3.contract import (
+    Contract,
+)
+from web3.utils.abi import (
+    FunctionEncoder,
+    compile_word_encoder,
+)
+
+
+def function_abi(name, *input_types):
+    return {
+        'constant': False,
+        'inputs': [
+            {'name': 'arg{0}'.format(index), 'type': input_type}
+            for index, input_type
+            in enumerate(input_types)
+        ],
+        'name': name,
+        'outputs': [],
+        'type': 'function',
+    }
+
+
+TRANSFER_ABI = function_abi('transfer', 'address', 'uint256')
+WORDS_ABI = function_abi('words', 'int8', 'uint8', 'bool', 'int256', 'address')
+DYNAMIC_ABI = function_abi('dynamic', 'uint256[]', 'bytes', 'string', 'bytes32', 'address[2]')
+STATIC_ABI = function_abi('static', 'bytes4', 'uint8[3]', 'bool')
+
+
+def legacy_encode(abi, arguments):
+    selector = encode_hex(function_abi_to_4byte_selector(abi))
+    return force_text(add_0x_prefix(Contract._encode_abi(abi, arguments, selector)))
+
+
+addresses = st.binary(min_size=20, max_size=20).map(encode_hex)
+uint256s = st.integers(min_value=0, max_value=2 ** 256 - 1)
+
+
+@given(to=addresses, value=uint256s)
+def test_word_encoding_matches_eth_abi(to, value):
+    encoder = FunctionEncoder(TRANSFER_ABI)
+    assert not encoder.has_dynamic_arguments
+    assert encoder.encode_arguments([to, value]) == legacy_encode(TRANSFER_ABI, [to, value])
+
+
+@given(
+    arguments=st.tuples(
+        st.integers(min_value=-127, max_value=127),
+        st.integers(min_value=0, max_value=255),
+        st.booleans(),
+        st.integers(min_value=-2 ** 255 + 1, max_value=2 ** 255 - 1),
+        addresses,
+    ).map(list),
+)
+def test_signed_word_encoding_matches_eth_abi(arguments):
+    encoder = FunctionEncoder(WORDS_ABI)
+    assert encoder.encode_arguments(arguments) == legacy_encode(WORDS_ABI, arguments)
+
+
+@given(
+    arguments=st.tuples(
+        st.lists(uint256s, max_size=4),
+        st.binary(max_size=70),
+        st.text(alphabet=st.characters(max_codepoint=127), max_size=40),
+        st.binary(max_size=32),
+        st.lists(addresses, min_size=2, max_size=2),
+    ).map(list),
+)
+def test_dynamic_encoding_matches_eth_abi(arguments):
+    encoder = FunctionEncoder(DYNAMIC_ABI)
+    assert encoder.has_dynamic_arguments
+    assert encoder.encode_arguments(arguments) == legacy_encode(DYNAMIC_ABI, arguments)
+
+
+@given(
+    arguments=st.tuples(
+        st.binary(max_size=4),
+        st.lists(st.integers(min_value=0, max_value=255), min_size=3, max_size=3),
+        st.booleans(),
+    ).map(list),
+)
+def test_static_encoding_matches_eth_abi(arguments):
+    encoder = FunctionEncoder(STATIC_ABI)
+    assert not encoder.has_dynamic_arguments
+    assert encoder.encode_arguments(arguments) == legacy_encode(STATIC_ABI, arguments)
+
+
+def test_checksummed_address_encoding():
+    checksummed = '0xd3CdA913deB6f67967B99D67aCDFa1712C293601'
+    expected = legacy_encode(TRANSFER_ABI, [checksummed, 1])
+    assert FunctionEncoder(TRANSFER_ABI).encode_arguments([checksummed, 1]) == expected
+
+
+@pytest.mark.parametrize(
+    'processed_type,is_word',
+    (
+        (('uint', '256', []), True),
+        (('int', '8', []), True),
+        (('address', '', []), True),
+        (('bool', '', []), True),
+        (('bytes', '32', []), True),
+        (('bytes', '', []), False),
+        (('uint', '256', [[2]]), False),
+        (('string', '', []), False),
+    ),
+)
+def test_compile_word_encoder(processed_type, is_word):
+    assert (compile_word_encoder(processed_type) is not None) is is_word
+
+
+@pytest.mark.parametrize(
+    'arguments',
+    (
+        ['0xd3cda913deb6f67967b99d67acdfa1712c293601'],
+        ['0xd3cda913deb6f67967b99d67acdfa1712c293601', -1],
+        ['0xd3cda913deb6f67967b99d67acdfa1712c293601', 2 ** 256],
+        ['not-an-address', 1],
+        ['0xd3cda913deb6f67967b99d67acdfa1712c293601', True],
+    ),
+)
+def test_invalid_arguments(arguments):
+    with pytest.raises(TypeError):
+        FunctionEncoder(TRANSFER_ABI).encode_arguments(arguments)
+
+
+def test_encode_with_args_and_kwargs():
+    encoder = FunctionEncoder(TRANSFER_ABI)
+    to = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+    expected = legacy_encode(TRANSFER_ABI, [to, 5])
+
+    assert encoder.encode([to, 5]) == expected
+    assert encoder.encode([to], {'arg1': 5}) == expected
+    assert encoder.encode(kwargs={'arg0': to, 'arg1': 5}) == expected
+
+
+def test_encode_rows():
+    encoder = FunctionEncoder(TRANSFER_ABI)
+    rows = [
+        ['0x' + '{0:040x}'.format(index), index * 10]
+        for index
+        in range(20)
+    ]
+    rows.append({'arg0': '0x' + '11' * 20, 'arg1': 1})
+
+    encoded = encoder.encode_rows(rows)
+    assert encoded == [encoder.encode(row) for row in rows[:-1]] + [encoder.encode(kwargs=rows[-1])]
+
+    buffer, offsets = encoder.encode_rows_to_buffer(rows)
+    assert len(offsets) == len(rows) + 1
+    assert offsets[-1] == len(buffer)
+    assert [
+        buffer[start:end]
+        for start, end
+        in zip(offsets, offsets[1:])
+    ] == [decode_hex(data) for data in encoded]
+
+
+def test_encode_rows_reports_invalid_row():
+    encoder = FunctionEncoder(TRANSFER_ABI)
+    rows = [['0x' + '11' * 20, 1], ['0x' + '11' * 20, -1]]
+
+    with pytest.raises(TypeError) as excinfo:
+        encoder.encode_rows(rows)
+    assert 'row 1' in str(excinfo.value)
+
+
+def test_encode_constructor_arguments():
+    constructor_abi = {
+        'inputs': [{'name': 'supply', 'type': 'uint256'}],
+        'type': 'constructor',
+    }
+    encoder = FunctionEncoder(constructor_abi, selector='')
+    assert encoder.encode_arguments([1]) == '0x' + '{0:064x}'.format(1)
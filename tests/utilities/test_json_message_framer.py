@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from web3.utils.streaming import (
+    JSONMessageFramer,
+)
+
+
+MESSAGES = (
+    {'jsonrpc': '2.0', 'id': 1, 'result': '0x1'},
+    [{'id': 2, 'result': 'brace } in string'}, {'id': 3, 'result': '[unbalanced'}],
+    {'id': 4, 'result': 'escaped \\" quote and \\\\ backslash {'},
+    {'id': 5, 'result': {'nested': [{}, [], {'a': [1, 2, 3]}]}},
+)
+
+STREAM = b' \n'.join(json.dumps(message).encode('utf8') for message in MESSAGES)
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 3, 7, 64, len(STREAM)))
+def test_framer_splits_stream_into_messages(chunk_size):
+    framer = JSONMessageFramer()
+    messages = []
+    for index in range(0, len(STREAM), chunk_size):
+        messages.extend(framer.feed(STREAM[index:index + chunk_size]))
+
+    assert [json.loads(message.decode('utf8')) for message in messages] == list(MESSAGES)
+    assert framer.buffer == bytearray()
+
+
+def test_framer_holds_incomplete_messages():
+    framer = JSONMessageFramer()
+    assert framer.feed(b'{"id": 1, "result": "a') == []
+    assert framer.feed(b'b"}{"id"') == [b'{"id": 1, "result": "ab"}']
+    assert framer.buffer == bytearray(b'{"id"')
+
+
+def test_framer_rejects_unbalanced_data():
+    framer = JSONMessageFramer()
+    with pytest.raises(ValueError):
+        framer.feed(b'{}}')
@@ -0,0 +1,100 @@
+from eth_abi import (
+    encode_abi,
+)
+from eth_utils import (
+    encode_hex,
+    force_bytes,
+    force_text,
+)
+
+from web3.utils.events import (
+    construct_event_data_filters,
+)
+from web3.utils.filters import (
+    LogMatcher,
+    construct_event_log_filter,
+)
+
+
+EVENT_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True,"name":"from","type":"address"},
+        {"indexed": True,"name":"to","type":"address"},
+        {"indexed": False,"name":"memo","type":"string"},
+        {"indexed": False,"name":"value","type":"uint256"},
+    ],
+    "name": "Transfer",
+    "type":"event",
+}
+CONTRACT_ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+
+def make_address(i):
+    return '0x' + '{0:040x}'.format(i)
+
+
+def make_log(topics, memo, value, address=CONTRACT_ADDRESS):
+    data = encode_abi(['string', 'uint256'], [force_bytes(memo), value])
+    return {
+        'address': address,
+        'topics': topics,
+        'data': force_text(encode_hex(data)),
+    }
+
+
+def make_topic(address):
+    return '0x' + address[2:].zfill(64)
+
+
+def test_matcher_checks_each_topic_position():
+    log_matcher, filter_params = construct_event_log_filter(
+        EVENT_ABI,
+        contract_address=CONTRACT_ADDRESS,
+        argument_filters={
+            'from': [make_address(i) for i in range(1000)],
+            'to': [make_address(1), make_address(2)],
+        },
+    )
+    event_topic = filter_params['topics'][0]
+
+    def matches(from_address, to_address):
+        topics = [event_topic, make_topic(from_address), make_topic(to_address)]
+        return log_matcher.match(make_log(topics, 'memo', 1))
+
+    assert len(filter_params['topics'][1]) == 1000
+    assert matches(make_address(999), make_address(2))
+    assert not matches(make_address(1000), make_address(2))
+    assert not matches(make_address(999), make_address(3))
+    assert not log_matcher.match(make_log([event_topic], 'memo', 1))
+
+    wrong_address_log = make_log(
+        [event_topic, make_topic(make_address(1)), make_topic(make_address(1))],
+        'memo',
+        1,
+        address=make_address(1),
+    )
+    assert not log_matcher.match(wrong_address_log)
+
+
+def test_matcher_checks_static_and_dynamic_data():
+    log_matcher = LogMatcher(
+        data_filters=construct_event_data_filters(
+            EVENT_ABI,
+            {'memo': ['rent', 'a much longer memo which spans several words'], 'value': [1, 2]},
+        ),
+    )
+
+    assert log_matcher.match(make_log([], 'rent', 2))
+    assert log_matcher.match(make_log([], 'a much longer memo which spans several words', 1))
+    assert not log_matcher.match(make_log([], 'rent', 3))
+    assert not log_matcher.match(make_log([], 'rents', 1))
+    assert not log_matcher.match(make_log([], '', 1))
+    assert not log_matcher.match({'address': CONTRACT_ADDRESS, 'topics': [], 'data': '0x'})
+
+
+def test_empty_matcher_matches_everything():
+    log_matcher = LogMatcher()
+
+    assert log_matcher.match(make_log([], 'memo', 1))
+    assert log_matcher.match({'address': CONTRACT_ADDRESS, 'topics': [], 'data': '0x'})
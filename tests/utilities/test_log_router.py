@@ -0,0 +1,129 @@
+from eth_utils import (
+    encode_hex,
+    event_abi_to_log_topic,
+)
+
+from web3 import Web3
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.utils.events import (
+    LogRouter,
+)
+
+
+def make_event_abi(name, inputs):
+    return {
+        'anonymous': False,
+        'inputs': [
+            {'indexed': indexed, 'name': arg_name, 'type': arg_type}
+            for arg_name, arg_type, indexed
+            in inputs
+        ],
+        'name': name,
+        'type': 'event',
+    }
+
+
+ERC20_TRANSFER = make_event_abi('Transfer', (
+    ('from', 'address', True),
+    ('to', 'address', True),
+    ('value', 'uint256', False),
+))
+ERC721_TRANSFER = make_event_abi('Transfer', (
+    ('from', 'address', True),
+    ('to', 'address', True),
+    ('tokenId', 'uint256', True),
+))
+APPROVAL = make_event_abi('Approval', (
+    ('owner', 'address', True),
+    ('spender', 'address', True),
+    ('value', 'uint256', False),
+))
+
+TOKEN_ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+NFT_ADDRESS = '0x' + '11' * 20
+OTHER_ADDRESS = '0x' + '22' * 20
+
+
+def word(value):
+    return '0x' + '{0:064x}'.format(value)
+
+
+def make_log(address, event_abi, topics, data='0x'):
+    return {
+        'address': address,
+        'blockHash': word(1),
+        'blockNumber': 1,
+        'data': data,
+        'logIndex': 0,
+        'topics': [encode_hex(event_abi_to_log_topic(event_abi))] + topics,
+        'transactionHash': word(2),
+        'transactionIndex': 0,
+    }
+
+
+def test_log_router_routes_by_topic():
+    router = LogRouter()
+    router.add_abi([ERC20_TRANSFER, APPROVAL, {'type': 'function', 'name': 'f', 'inputs': []}])
+
+    transfers = []
+    approvals = []
+    router.add_handler('Transfer', transfers.append)
+    router.add_handler('Approval', approvals.append)
+
+    logs = [
+        make_log(TOKEN_ADDRESS, ERC20_TRANSFER, [word(1), word(2)], word(10)),
+        make_log(TOKEN_ADDRESS, APPROVAL, [word(1), word(3)], word(20)),
+        make_log(OTHER_ADDRESS, ERC20_TRANSFER, [word(4), word(5)], word(30)),
+        dict(make_log(TOKEN_ADDRESS, APPROVAL, []), topics=[word(9)]),
+        dict(make_log(TOKEN_ADDRESS, APPROVAL, []), topics=[]),
+    ]
+    routed = router.route_logs(logs)
+
+    assert [event['event'] for event in routed] == ['Transfer', 'Approval', 'Transfer']
+    assert [event['args']['value'] for event in transfers] == [10, 30]
+    assert [event['args']['value'] for event in approvals] == [20]
+    assert router.decode(logs[3]) is None
+
+
+def test_log_router_addresses():
+    router = LogRouter()
+    router.add_abi([ERC20_TRANSFER], address=TOKEN_ADDRESS.upper().replace('0X', '0x'))
+    router.add_abi([ERC721_TRANSFER], address=NFT_ADDRESS)
+
+    token_log = make_log(TOKEN_ADDRESS, ERC20_TRANSFER, [word(1), word(2)], word(10))
+    nft_log = make_log(NFT_ADDRESS, ERC721_TRANSFER, [word(1), word(2), word(7)])
+    other_log = make_log(OTHER_ADDRESS, ERC20_TRANSFER, [word(1), word(2)], word(10))
+
+    assert router.decode(token_log)['args']['value'] == 10
+    assert router.decode(nft_log)['args']['tokenId'] == 7
+    assert router.decode(other_log) is None
+
+
+def test_log_router_shared_signatures():
+    router = LogRouter()
+    router.add_abi([ERC20_TRANSFER])
+    router.add_abi([ERC721_TRANSFER])
+
+    token_log = make_log(TOKEN_ADDRESS, ERC20_TRANSFER, [word(1), word(2)], word(10))
+    nft_log = make_log(NFT_ADDRESS, ERC721_TRANSFER, [word(1), word(2), word(7)])
+
+    assert router.decode(token_log)['args']['value'] == 10
+    assert router.decode(nft_log)['args']['tokenId'] == 7
+
+
+def test_log_router_add_contract():
+    web3 = Web3(BaseProvider())
+    token = web3.eth.contract(abi=[ERC20_TRANSFER, APPROVAL], address=TOKEN_ADDRESS)
+
+    router = LogRouter()
+    router.add_contract(token)
+
+    log = make_log(TOKEN_ADDRESS, APPROVAL, [word(1), word(3)], word(20))
+    assert router.route(log)['args'] == {
+        'owner': '0x' + '00' * 19 + '01',
+        'spender': '0x' + '00' * 19 + '03',
+        'value': 20,
+    }
+    assert router.decode(dict(log, address=OTHER_ADDRESS)) is None
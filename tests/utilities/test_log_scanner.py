@@ -0,0 +1,198 @@
+import json
+import socket
+
+import pytest
+
+from eth_utils import (
+    encode_hex,
+    event_abi_to_log_topic,
+)
+
+from web3 import Web3
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.utils.compat import (
+    threading,
+)
+from web3.utils.filters import (
+    LogScanner,
+    is_chunk_too_large_error,
+)
+
+
+TRANSFER_ABI = {
+    'anonymous': False,
+    'inputs': [
+        {'indexed': True, 'name': 'from', 'type': 'address'},
+        {'indexed': True, 'name': 'to', 'type': 'address'},
+        {'indexed': False, 'name': 'value', 'type': 'uint256'},
+    ],
+    'name': 'Transfer',
+    'type': 'event',
+}
+TRANSFER_TOPIC = encode_hex(event_abi_to_log_topic(TRANSFER_ABI))
+CONTRACT_ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+
+def address_topic(index):
+    return '0x' + '00' * 12 + '{0:040x}'.format(index)
+
+
+def make_log(block_number, value):
+    return {
+        'address': CONTRACT_ADDRESS,
+        'blockHash': '0x' + '{0:064x}'.format(block_number),
+        'blockNumber': hex(block_number),
+        'data': '0x' + '{0:064x}'.format(value),
+        'logIndex': '0x0',
+        'topics': [TRANSFER_TOPIC, address_topic(1), address_topic(value % 2)],
+        'transactionHash': '0x' + '{0:064x}'.format(value),
+        'transactionIndex': '0x0',
+    }
+
+
+class LogsProvider(BaseProvider):
+    """
+    Serves `eth_getLogs` for one log in each block up to ``block_number``,
+    failing requests for more than ``max_blocks`` blocks.
+    """
+    def __init__(self, block_number, max_blocks=None):
+        self.block_number = block_number
+        self.max_blocks = max_blocks
+        self.lock = threading.Lock()
+        self.requested_ranges = []
+
+    def make_request(self, method, params):
+        if method == 'eth_blockNumber':
+            return json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': hex(self.block_number)})
+
+        assert method == 'eth_getLogs'
+        from_block = int(params[0]['fromBlock'], 16)
+        to_block = int(params[0]['toBlock'], 16)
+        with self.lock:
+            self.requested_ranges.append((from_block, to_block))
+
+        if self.max_blocks is not None and to_block - from_block + 1 > self.max_blocks:
+            return json.dumps({
+                'jsonrpc': '2.0',
+                'id': 1,
+                'error': {'code': -32005, 'message': 'query returned more than 10000 results'},
+            })
+        return json.dumps({
+            'jsonrpc': '2.0',
+            'id': 1,
+            'result': [make_log(block, block) for block in range(from_block, to_block + 1)],
+        })
+
+
+def test_log_scanner_yields_logs_in_order():
+    provider = LogsProvider(block_number=99)
+    scanner = LogScanner(Web3(provider), {}, chunk_size=7, concurrency=3)
+
+    log_entries = list(scanner)
+
+    assert [log['blockNumber'] for log in log_entries] == list(range(100))
+    assert scanner.checkpoint == 100
+
+
+def test_log_scanner_shrinks_chunks_which_are_too_large():
+    provider = LogsProvider(block_number=99, max_blocks=10)
+    scanner = LogScanner(Web3(provider), {'fromBlock': 0, 'toBlock': 99}, chunk_size=64)
+
+    log_entries = list(scanner)
+
+    assert [log['blockNumber'] for log in log_entries] == list(range(100))
+    assert (0, 63) in provider.requested_ranges
+    assert min(to_block - from_block for from_block, to_block in provider.requested_ranges) < 10
+
+
+def test_log_scanner_raises_when_chunks_cannot_shrink():
+    provider = LogsProvider(block_number=99, max_blocks=10)
+    scanner = LogScanner(
+        Web3(provider),
+        {'fromBlock': 0, 'toBlock': 99},
+        chunk_size=64,
+        min_chunk_size=32,
+    )
+
+    with pytest.raises(ValueError):
+        list(scanner)
+
+
+class TimingOutProvider(LogsProvider):
+    def make_request(self, method, params):
+        if method == 'eth_getLogs':
+            with self.lock:
+                self.requested_ranges.append(params[0]['fromBlock'])
+            raise socket.timeout('timed out')
+        return super(TimingOutProvider, self).make_request(method, params)
+
+
+def test_log_scanner_raises_timeouts_without_splitting_chunks():
+    provider = TimingOutProvider(block_number=99)
+    scanner = LogScanner(
+        Web3(provider),
+        {'fromBlock': 0, 'toBlock': 99},
+        chunk_size=64,
+        concurrency=1,
+    )
+
+    with pytest.raises(socket.timeout):
+        list(scanner)
+
+    assert len(provider.requested_ranges) <= 2
+
+
+def test_log_scanner_checkpoint_resumes_scan():
+    provider = LogsProvider(block_number=49)
+    web3 = Web3(provider)
+    scanner = LogScanner(web3, {}, chunk_size=10, max_chunk_size=10)
+
+    scan = scanner.scan()
+    first_logs = [next(scan) for _ in range(25)]
+    scan.close()
+    assert scanner.checkpoint == 20
+
+    resumed = LogScanner(web3, {'fromBlock': scanner.checkpoint}, chunk_size=10)
+    remaining_logs = list(resumed)
+
+    assert first_logs[:20] + remaining_logs == list(LogScanner(web3, {}))
+
+
+def test_contract_scan_events_decodes_and_filters():
+    web3 = Web3(LogsProvider(block_number=19))
+    token = web3.eth.contract(abi=[TRANSFER_ABI], address=CONTRACT_ADDRESS)
+
+    events = list(token.scanEvents('Transfer', {'fromBlock': 10}, chunk_size=4))
+
+    assert [event['args']['value'] for event in events] == list(range(10, 20))
+    assert all(event['event'] == 'Transfer' for event in events)
+    assert [event['blockNumber'] for event in events] == list(range(10, 20))
+    assert all(event['logIndex'] == 0 for event in events)
+
+
+def test_get_logs_formats_logs():
+    web3 = Web3(LogsProvider(block_number=2))
+
+    log_entries = web3.eth.getLogs({'fromBlock': 0, 'toBlock': 2})
+
+    assert [log['blockNumber'] for log in log_entries] == [0, 1, 2]
+    assert all(log['transactionIndex'] == 0 for log in log_entries)
+
+
+@pytest.mark.parametrize(
+    'error,expected',
+    (
+        (ValueError({'message': 'query returned more than 10000 results'}), True),
+        (ValueError({'message': 'Log response size exceeded.'}), True),
+        (ValueError({'message': 'query timeout exceeded'}), True),
+        (ValueError({'message': 'invalid argument 0'}), False),
+        (IOError('Read timed out.'), False),
+        (socket.timeout('timed out'), False),
+        (IOError('Too many open files'), False),
+        (IOError('Connection refused'), False),
+    ),
+)
+def test_is_chunk_too_large_error(error, expected):
+    assert is_chunk_too_large_error(error) is expected
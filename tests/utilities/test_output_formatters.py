@@ -0,0 +1,135 @@
+from web3.formatters import (
+    output_block_formatter,
+    output_transaction_formatter,
+    output_transaction_receipt_formatter,
+)
+from web3.utils.datastructures import (
+    AttributeDict,
+)
+
+
+ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+CHECKSUM_ADDRESS = '0xd3CDA913deB6f67967B99D67aCDFa1712C293601'
+HASH = '0x' + 'ab' * 32
+
+
+TRANSACTION = {
+    'blockHash': HASH,
+    'blockNumber': '0x10',
+    'from': ADDRESS,
+    'gas': '0x15f90',
+    'gasPrice': '0x4a817c800',
+    'hash': HASH,
+    'input': '0x',
+    'nonce': '0x0',
+    'to': None,
+    'transactionIndex': '0x1',
+    'value': '0xde0b6b3a7640000',
+}
+
+
+def test_output_transaction_formatter():
+    txn = output_transaction_formatter(TRANSACTION)
+
+    assert isinstance(txn, AttributeDict)
+    assert txn == {
+        'blockHash': HASH,
+        'blockNumber': 16,
+        'from': ADDRESS,
+        'gas': 90000,
+        'gasPrice': 20000000000,
+        'hash': HASH,
+        'input': '0x',
+        'nonce': 0,
+        'to': None,
+        'transactionIndex': 1,
+        'value': 10 ** 18,
+    }
+
+
+def test_output_transaction_formatter_pending_and_null():
+    txn = output_transaction_formatter(dict(
+        TRANSACTION,
+        blockHash=None,
+        blockNumber=None,
+        transactionIndex=None,
+    ))
+
+    assert txn.blockNumber is None
+    assert txn.transactionIndex is None
+    assert output_transaction_formatter(None) is None
+
+
+def test_output_transaction_formatter_coerces_bytes_to_text():
+    txn = output_transaction_formatter(dict(
+        TRANSACTION,
+        hash=HASH.encode('ascii'),
+        nonce=b'0x2',
+    ))
+
+    assert txn.hash == HASH
+    assert txn.nonce == 2
+
+
+def test_output_block_formatter():
+    block = output_block_formatter({
+        'difficulty': '0x20000',
+        'gasLimit': '0x47e7c4',
+        'gasUsed': '0x5208',
+        'number': '0x10',
+        'size': '0x220',
+        'timestamp': '0x55ba467c',
+        'totalDifficulty': '0x40000',
+        'uncles': [HASH],
+        'transactions': [TRANSACTION],
+    })
+
+    assert isinstance(block, AttributeDict)
+    assert block.number == 16
+    assert block.difficulty == 131072
+    assert block.uncles == [HASH]
+    assert block.transactions[0]['value'] == 10 ** 18
+    assert block.transactions[0]['blockNumber'] == 16
+
+
+def test_output_block_formatter_with_transaction_hashes():
+    block = output_block_formatter({
+        'number': None,
+        'transactions': [HASH, HASH.encode('ascii')],
+    })
+
+    assert block.number is None
+    assert block.transactions == [HASH, HASH]
+
+
+def test_output_transaction_receipt_formatter():
+    receipt = output_transaction_receipt_formatter({
+        'blockHash': HASH,
+        'blockNumber': '0x10',
+        'contractAddress': None,
+        'cumulativeGasUsed': '0xa410',
+        'gasUsed': '0x5208',
+        'logs': [{
+            'address': CHECKSUM_ADDRESS,
+            'blockNumber': '0x10',
+            'data': '0x',
+            'logIndex': '0x0',
+            'topics': [HASH],
+            'transactionIndex': '0x1',
+        }],
+        'transactionHash': HASH,
+        'transactionIndex': '0x1',
+    })
+
+    assert isinstance(receipt, AttributeDict)
+    assert receipt.gasUsed == 21000
+    assert receipt.cumulativeGasUsed == 42000
+    assert receipt.logs == [{
+        'address': ADDRESS,
+        'blockNumber': 16,
+        'data': '0x',
+        'logIndex': 0,
+        'topics': [HASH],
+        'transactionIndex': 1,
+    }]
+    assert output_transaction_receipt_formatter(None) is None
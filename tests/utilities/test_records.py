@@ -0,0 +1,194 @@
+from collections import (
+    Mapping,
+)
+import copy
+import pickle
+
+import pytest
+
+from web3.formatters import (
+    lazy_block_formatter,
+    output_block_formatter,
+    output_log_formatter,
+    output_transaction_formatter,
+    output_transaction_receipt_formatter,
+)
+from web3.utils.datastructures import (
+    AttributeDict,
+    Block,
+    Log,
+    Receipt,
+    Transaction,
+)
+
+
+LOG = {
+    'address': '0xd3CDA913deB6f67967B99D67aCDFa1712C293601',
+    'blockNumber': 16,
+    'data': '0x',
+    'logIndex': 0,
+    'topics': ['0x' + 'ab' * 32],
+    'customField': 'extra',
+}
+
+
+def test_record_access():
+    log = Log(LOG)
+    assert log.blockNumber == 16
+    assert log['blockNumber'] == 16
+    assert log.customField == 'extra'
+    assert log['customField'] == 'extra'
+    assert log.get('blockHash') is None
+    assert log.get('blockHash', 'default') == 'default'
+
+
+def test_record_missing_fields():
+    log = Log(LOG)
+    assert 'blockHash' not in log
+    with pytest.raises(KeyError):
+        log['blockHash']
+    with pytest.raises(AttributeError):
+        log.blockHash
+    with pytest.raises(KeyError):
+        log['unknownField']
+    with pytest.raises(AttributeError):
+        log.unknownField
+
+
+def test_record_mapping_interface():
+    log = Log(LOG)
+    assert isinstance(log, Mapping)
+    assert isinstance(log, AttributeDict)
+    assert list(log) == list(LOG)
+    assert len(log) == len(LOG)
+    assert dict(log.items()) == LOG
+    assert set(log.keys()) == set(LOG)
+    assert log.to_dict() == LOG
+
+
+def test_record_immutable():
+    log = Log(LOG)
+    with pytest.raises(TypeError):
+        log.blockNumber = 0
+    with pytest.raises(TypeError):
+        log['blockNumber'] = 0
+    with pytest.raises(TypeError):
+        del log.blockNumber
+    assert log.blockNumber == 16
+
+
+def test_record_equality():
+    assert Log(LOG) == LOG
+    assert LOG == Log(LOG)
+    assert Log(LOG) == AttributeDict(LOG)
+    assert Log(LOG) == Log(dict(LOG))
+    assert Log(LOG) != dict(LOG, blockNumber=17)
+    assert Log(LOG) != Log(dict(LOG, customField='other'))
+    assert Log(LOG) != [LOG]
+
+
+def test_record_hashable():
+    assert hash(Log(LOG)) == hash(Log(dict(reversed(list(LOG.items())))))
+    assert len({Log(LOG), Log(LOG), Log(dict(LOG, blockNumber=17))}) == 2
+
+
+def test_record_kwargs():
+    assert Log(blockNumber=1, data='0x') == {'blockNumber': 1, 'data': '0x'}
+    assert Log({'blockNumber': 1}, data='0x') == {'blockNumber': 1, 'data': '0x'}
+
+
+@pytest.mark.parametrize(
+    'record_class',
+    (Block, Log, Receipt, Transaction),
+)
+def test_record_pickle_and_copy(record_class):
+    record = record_class(LOG)
+    for duplicate in (pickle.loads(pickle.dumps(record)), copy.copy(record), copy.deepcopy(record)):
+        assert type(duplicate) is record_class
+        assert duplicate == record
+        assert list(duplicate) == list(record)
+
+
+def test_record_repr():
+    log = Log({'blockNumber': 16})
+    assert repr(log) == "Log({'blockNumber': 16})"
+
+
+def test_records_do_not_have_a_dict():
+    with pytest.raises(AttributeError):
+        Log(LOG).__dict__
+
+
+def test_output_formatters_return_records():
+    txn = output_transaction_formatter({'from': '0x' + '00' * 20, 'nonce': '0x1'})
+    assert isinstance(txn, Transaction)
+    assert txn['from'] == '0x' + '00' * 20
+    assert txn.nonce == 1
+
+    log = output_log_formatter({'blockNumber': '0x10', 'topics': []})
+    assert isinstance(log, Log)
+
+    receipt = output_transaction_receipt_formatter({'logs': [{'logIndex': '0x0'}]})
+    assert isinstance(receipt, Receipt)
+    assert isinstance(receipt.logs[0], Log)
+
+    block = output_block_formatter({'number': '0x1', 'transactions': [{'nonce': '0x0'}]})
+    assert isinstance(block, Block)
+    assert isinstance(block.transactions[0], Transaction)
+
+
+def test_lazy_record_decodes_on_first_access():
+    decoded = []
+
+    def decode_field(key, value):
+        decoded.append(key)
+        return value * 2
+
+    log = Log.lazy({'blockNumber': 8, 'logIndex': 1, 'customField': 'a'}, decode_field)
+    assert decoded == []
+
+    assert log.blockNumber == 16
+    assert log['blockNumber'] == 16
+    assert log['customField'] == 'aa'
+    assert log.customField == 'aa'
+    assert decoded == ['blockNumber', 'customField']
+
+    assert 'logIndex' in log
+    assert 'blockHash' not in log
+    assert list(log) == ['blockNumber', 'logIndex', 'customField']
+    assert decoded == ['blockNumber', 'customField']
+
+    assert log == {'blockNumber': 16, 'logIndex': 2, 'customField': 'aa'}
+    assert decoded == ['blockNumber', 'customField', 'logIndex']
+
+
+def test_lazy_record_missing_fields():
+    log = Log.lazy({'blockNumber': 8}, lambda key, value: value)
+    with pytest.raises(KeyError):
+        log['blockHash']
+    with pytest.raises(AttributeError):
+        log.blockHash
+    with pytest.raises(AttributeError):
+        log.unknownField
+
+
+def test_lazy_record_pickles_decoded_values():
+    log = Log.lazy({'blockNumber': 8}, lambda key, value: value * 2)
+    duplicate = pickle.loads(pickle.dumps(log))
+    assert duplicate == {'blockNumber': 16}
+    assert hash(duplicate) == hash(log)
+
+
+def test_lazy_block_formatter_matches_output_block_formatter():
+    raw_block = {
+        'number': '0x1',
+        'gasUsed': '0x5208',
+        'hash': '0x' + 'ab' * 32,
+        'transactions': [{'nonce': '0x0', 'value': '0xa', 'to': None}],
+    }
+    block = lazy_block_formatter(raw_block)
+    assert isinstance(block, Block)
+    assert isinstance(block.transactions[0], Transaction)
+    assert block.transactions[0].value == 10
+    assert block == output_block_formatter(raw_block)
+    assert lazy_block_formatter(None) is None
@@ -0,0 +1,145 @@
+import json
+import time
+
+import pytest
+
+from web3 import Web3
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.utils.compat import (
+    Timeout,
+)
+from web3.utils.transactions import (
+    wait_for_transaction_receipts,
+)
+
+
+def txn_hash(index):
+    return '0x' + '{0:064x}'.format(index)
+
+
+class MiningProvider(BaseProvider):
+    """
+    Mines the next ``txns_per_block`` transactions every ``polls_per_block``
+    times the block filter is polled.
+    """
+    def __init__(self, txn_hashes, txns_per_block, failed_batches=0, polls_per_block=1):
+        self.unmined = list(txn_hashes)
+        self.txns_per_block = txns_per_block
+        self.polls_per_block = polls_per_block
+        self.num_polls = 0
+        self.failed_batches = failed_batches
+        self.receipts = {}
+        self.block_number = 0
+        self.installed = set()
+        self.requests = []
+        self.batch_sizes = []
+
+    def make_batch_request(self, requests):
+        if self.failed_batches:
+            self.failed_batches -= 1
+            raise IOError("Connection refused")
+        self.batch_sizes.append(len(requests))
+        return super(MiningProvider, self).make_batch_request(requests)
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        if method == 'eth_newBlockFilter':
+            self.installed.add('0x1')
+            return self.respond('0x1')
+        elif method == 'eth_uninstallFilter':
+            self.installed.discard(params[0])
+            return self.respond(True)
+        elif method == 'eth_getFilterChanges':
+            self.num_polls += 1
+            if not self.txns_per_block or self.num_polls % self.polls_per_block:
+                return self.respond([])
+            self.block_number += 1
+            mined, self.unmined = (
+                self.unmined[:self.txns_per_block],
+                self.unmined[self.txns_per_block:],
+            )
+            for mined_hash in mined:
+                self.receipts[mined_hash] = {
+                    'transactionHash': mined_hash,
+                    'blockNumber': hex(self.block_number),
+                    'logs': [],
+                }
+            return self.respond([txn_hash(self.block_number)])
+        elif method == 'eth_getTransactionReceipt':
+            return self.respond(self.receipts.get(params[0]))
+        raise AssertionError("Unexpected request: {0}".format(method))
+
+    def respond(self, result):
+        return json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': result})
+
+
+def test_receipts_are_checked_once_per_block():
+    txn_hashes = [txn_hash(index) for index in range(100)]
+    provider = MiningProvider(txn_hashes, txns_per_block=25)
+
+    receipts = list(wait_for_transaction_receipts(Web3(provider), txn_hashes, timeout=5))
+
+    assert [receipt['transactionHash'] for receipt in receipts] == txn_hashes
+    assert [receipt['blockNumber'] for receipt in receipts] == [
+        index // 25 + 1 for index in range(100)
+    ]
+    assert provider.batch_sizes == [100, 100, 75, 50, 25]
+    assert provider.requests.count('eth_getFilterChanges') == 4
+    assert provider.installed == set()
+
+
+def test_receipts_are_batched():
+    txn_hashes = [txn_hash(index) for index in range(10)]
+    provider = MiningProvider(txn_hashes, txns_per_block=10)
+
+    receipts = list(wait_for_transaction_receipts(
+        Web3(provider),
+        txn_hashes,
+        timeout=5,
+        batch_size=4,
+    ))
+
+    assert len(receipts) == 10
+    assert provider.batch_sizes == [4, 4, 2, 4, 4, 2]
+
+
+def test_connection_errors_are_retried():
+    txn_hashes = [txn_hash(index) for index in range(10)]
+    provider = MiningProvider(txn_hashes, txns_per_block=10, failed_batches=2)
+
+    receipts = list(wait_for_transaction_receipts(Web3(provider), txn_hashes, timeout=5))
+
+    assert len(receipts) == 10
+    assert provider.installed == set()
+
+
+def test_timeout_uninstalls_block_filter():
+    txn_hashes = [txn_hash(index) for index in range(10)]
+    provider = MiningProvider(txn_hashes, txns_per_block=0)
+
+    with pytest.raises(Timeout):
+        list(wait_for_transaction_receipts(Web3(provider), txn_hashes, timeout=0.3))
+
+    assert provider.installed == set()
+
+
+def test_time_spent_by_the_caller_is_not_counted():
+    txn_hashes = [txn_hash(index) for index in range(6)]
+    provider = MiningProvider(txn_hashes, txns_per_block=3, polls_per_block=2)
+
+    receipts = []
+    for receipt in wait_for_transaction_receipts(Web3(provider), txn_hashes, timeout=1):
+        receipts.append(receipt)
+        time.sleep(0.3)
+
+    assert len(receipts) == 6
+    assert provider.installed == set()
+
+
+def test_no_transactions():
+    provider = MiningProvider([], txns_per_block=1)
+
+    assert list(wait_for_transaction_receipts(Web3(provider), [])) == []
+    assert provider.requests == []
@@ -14,6 +14,10 @@ from web3.providers.tester import (
 )
 from web3.providers.ipc import (
     IPCProvider,
+    PersistentIPCProvider,
+)
+from web3.providers.balancer import (
+    LoadBalancedHTTPProvider,
 )
 
 __version__ = pkg_resources.get_distribution("web3").version
@@ -25,6 +29,8 @@ __all__ = [
     "RPCProvider",
     "KeepAliveRPCProvider",
     "IPCProvider",
+    "PersistentIPCProvider",
+    "LoadBalancedHTTPProvider",
     "TestRPCProvider",
     "EthereumTesterProvider",
 ]
@@ -0,0 +1,89 @@
+"""
+asyncio based counterpart of `Web3`.  Requires python 3.4 and above.
+"""
+import asyncio
+
+from eth_utils import (
+    encode_hex,
+    force_text,
+)
+
+from web3.main import Web3
+from web3.providers.async_ipc import (
+    AsyncIPCProvider,
+)
+from web3.providers.async_manager import (
+    AsyncRequestManager,
+)
+from web3.providers.async_rpc import (
+    AsyncHTTPProvider,
+)
+from web3.utils.deferred import (
+    MODULE_NAMES,
+    DeferredModule,
+    ModuleHost,
+)
+
+
+class AsyncWeb3(object):
+    """
+    Exposes the same module APIs as `Web3`, but each property access or
+    method call which talks to the node returns a coroutine.
+
+        >>> block_number = yield from web3.eth.blockNumber
+        >>> balance = yield from web3.eth.getBalance(address)
+    """
+    # Providers
+    AsyncHTTPProvider = AsyncHTTPProvider
+    AsyncIPCProvider = AsyncIPCProvider
+
+    # Managers
+    AsyncRequestManager = AsyncRequestManager
+
+    # Encoding, Currency and Address utilities are shared with `Web3`
+    Iban = Web3.Iban
+    toHex = Web3.toHex
+    toAscii = Web3.toAscii
+    toUtf8 = Web3.toUtf8
+    fromAscii = Web3.fromAscii
+    fromUtf8 = Web3.fromUtf8
+    toDecimal = Web3.toDecimal
+    fromDecimal = Web3.fromDecimal
+    toWei = Web3.toWei
+    fromWei = Web3.fromWei
+    isAddress = Web3.isAddress
+    isChecksumAddress = Web3.isChecksumAddress
+    toChecksumAddress = Web3.toChecksumAddress
+
+    def __init__(self, provider):
+        self._requestManager = AsyncRequestManager(provider)
+        self._host = ModuleHost(None)
+
+        for module_name in MODULE_NAMES:
+            setattr(self, module_name, DeferredModule(self._host, module_name, self._run))
+
+    def _run(self, fn):
+        return self._requestManager.coro_run(self._host, fn)
+
+    def setProvider(self, provider):
+        self._requestManager.setProvider(provider)
+
+    @property
+    def currentProvider(self):
+        return self._requestManager.provider
+
+    @asyncio.coroutine
+    def sha3(self, value, encoding="hex"):
+        if encoding == 'hex':
+            hex_string = value
+        else:
+            hex_string = encode_hex(value)
+        result = yield from self._requestManager.coro_request('web3_sha3', [hex_string])
+        return force_text(result)
+
+    @asyncio.coroutine
+    def isConnected(self):
+        if self.currentProvider is None:
+            return False
+        is_connected = yield from self.currentProvider.coro_isConnected()
+        return is_connected
@@ -0,0 +1,119 @@
+from __future__ import absolute_import
+
+from cytoolz.itertoolz import (
+    partition_all,
+)
+
+from web3.providers.manager import (
+    ReplayRequestManager,
+    RequestCaptured,
+)
+from web3.utils.deferred import (
+    MODULE_NAMES,
+    DeferredModule,
+    ModuleHost,
+)
+from web3.utils.empty import (
+    empty,
+)
+
+
+class BatchRequest(object):
+    """
+    Handle to a single call which has been queued on a `Batch`.
+    """
+    result = empty
+    error = None
+
+    def __init__(self, fn):
+        self.fn = fn
+
+    @property
+    def ready(self):
+        return self.result is not empty or self.error is not None
+
+    def get(self):
+        if self.error is not None:
+            raise self.error
+        elif self.result is empty:
+            raise ValueError("The batch for this request has not been executed")
+        return self.result
+
+
+class Batch(object):
+    """
+    Queues calls made through the module APIs (``batch.eth``, ``batch.net``,
+    ...) so that they can be sent to the node as a single JSON-RPC batch.
+    """
+    executed = False
+
+    def __init__(self, web3, batch_size=None):
+        self.web3 = web3
+        self.batch_size = batch_size
+        self.requests = []
+        self.host = ModuleHost(web3._requestManager, web3=web3)
+
+        for module_name in MODULE_NAMES:
+            setattr(self, module_name, DeferredModule(self.host, module_name, self.add))
+
+    def __len__(self):
+        return len(self.requests)
+
+    def add(self, fn):
+        """
+        Queue ``fn`` which will be called with a `ModuleHost` whose modules
+        should be used to make the request.
+        """
+        if self.executed:
+            raise ValueError("Cannot add requests to a batch which has been executed")
+        batch_request = BatchRequest(fn)
+        self.requests.append(batch_request)
+        return batch_request
+
+    def execute(self):
+        """
+        Send all of the queued requests, returning their results in the order
+        they were queued.
+
+        Only the first request made by each call is batched.  Calls which need
+        to make follow up requests, such as `eth.sendTransaction` estimating
+        gas, make those as normal blocking requests.
+        """
+        if self.executed:
+            raise ValueError("Cannot execute a batch more than once")
+        self.executed = True
+
+        request_manager = self.web3._requestManager
+        captured_requests = []
+
+        for batch_request in self.requests:
+            try:
+                batch_request.result = self.host.run(
+                    batch_request.fn,
+                    ReplayRequestManager(),
+                )
+            except RequestCaptured as captured:
+                captured_requests.append((batch_request, captured))
+            except Exception as err:
+                batch_request.error = err
+
+        batch_size = self.batch_size or len(captured_requests) or 1
+        for chunk in partition_all(batch_size, captured_requests):
+            responses = request_manager.request_batch([
+                (captured.method, captured.params)
+                for _, captured
+                in chunk
+            ])
+            for (batch_request, captured), response in zip(chunk, responses):
+                try:
+                    batch_request.result = self.host.run(
+                        batch_request.fn,
+                        ReplayRequestManager(
+                            responses=[(captured.method, response)],
+                            fallback=request_manager,
+                        ),
+                    )
+                except Exception as err:
+                    batch_request.error = err
+
+        return [batch_request.get() for batch_request in self.requests]
@@ -6,9 +6,11 @@ import warnings
 import itertools
 
 from eth_utils import (
+    decode_hex,
+    function_signature_to_4byte_selector,
     is_address,
+    is_dict,
     is_list_like,
-    function_abi_to_4byte_selector,
     encode_hex,
     add_0x_prefix,
     remove_0x_prefix,
@@ -30,22 +32,27 @@ from eth_abi.exceptions import (
 from cytoolz.functoolz import (
     compose,
 )
+from cytoolz.itertoolz import (
+    partition_all,
+)
+
+from web3 import formatters
 
 from web3.exceptions import (
     BadFunctionCallOutput,
 )
+from web3.providers.manager import (
+    get_response_result,
+)
 
 from web3.utils.abi import (
     filter_by_type,
     filter_by_name,
-    filter_by_argument_count,
     filter_by_argument_name,
-    filter_by_encodability,
+    FunctionABIIndex,
     get_abi_input_types,
-    get_abi_output_types,
     get_constructor_abi,
     merge_args_and_kwargs,
-    normalize_return_type,
     check_if_arguments_can_be_encoded,
 )
 from web3.utils.decorators import (
@@ -55,13 +62,14 @@ from web3.utils.empty import (
     empty,
 )
 from web3.utils.events import (
-    get_event_data,
+    get_event_decoder,
 )
 from web3.utils.exception import (
     raise_from,
 )
 from web3.utils.filters import (
-    construct_event_filter_params,
+    construct_event_log_filter,
+    LogScanner,
     PastLogFilter,
 )
 from web3.utils.validation import (
@@ -105,6 +113,7 @@ class Contract(object):
 
     # class properties (overridable at instance level)
     abi = None
+    _function_abi_index = None
     asm = None
     ast = None
 
@@ -214,7 +223,10 @@ class Contract(object):
                     "`Contract.factory` only accepts keyword arguments which are "
                     "present on the contract class".format(key)
                 )
-        return type(contract_name, (cls,), kwargs)
+        contract_class = type(contract_name, (cls,), kwargs)
+        if contract_class.abi is not None:
+            contract_class._get_function_abi_index()
+        return contract_class
 
     #
     # deprecated properties
@@ -331,6 +343,31 @@ class Contract(object):
 
         return cls._encode_abi(fn_abi, fn_arguments, data)
 
+    @classmethod
+    def encodeABIRows(cls, fn_name, rows, as_buffer=False):
+        """
+        Encodes the call data for many calls to the contract function
+        ``fn_name``.  Each row is either a list of positional arguments or a
+        dictionary of keyword arguments.
+
+        The function is chosen using the first row.  Returns a list of hex
+        encoded call data, or a `(buffer, offsets)` tuple from
+        `FunctionEncoder.encode_rows_to_buffer` if ``as_buffer`` is set.
+        """
+        rows = list(rows)
+        if rows and is_dict(rows[0]):
+            fn_abi = cls._find_matching_fn_abi(fn_name, kwargs=rows[0])
+        elif rows:
+            fn_abi = cls._find_matching_fn_abi(fn_name, args=rows[0])
+        else:
+            fn_abi = cls._find_matching_fn_abi(fn_name)
+
+        encoder = cls._get_function_abi_index().get_encoder(fn_abi)
+        if as_buffer:
+            return encoder.encode_rows_to_buffer(rows)
+        else:
+            return encoder.encode_rows(rows)
+
     @combomethod
     def on(self, event_name, filter_params=None, *callbacks):
         """
@@ -346,18 +383,18 @@ class Contract(object):
             argument_filter_names,
         )
 
-        data_filter_set, event_filter_params = construct_event_filter_params(
+        log_matcher, event_filter_params = construct_event_log_filter(
             event_abi,
             contract_address=self.address,
             argument_filters=argument_filters,
             **filter_params
         )
 
-        log_data_extract_fn = functools.partial(get_event_data, event_abi)
+        log_data_extract_fn = get_event_decoder(event_abi).decode
 
         log_filter = self.web3.eth.filter(event_filter_params)
 
-        log_filter.set_data_filters(data_filter_set)
+        log_filter.log_matcher = log_matcher
         log_filter.log_entry_formatter = log_data_extract_fn
         log_filter.filter_params = event_filter_params
 
@@ -388,7 +425,7 @@ class Contract(object):
             web3=log_filter.web3,
             filter_id=log_filter.filter_id,
             log_entry_formatter=log_filter.log_entry_formatter,
-            data_filter_set=log_filter.data_filter_set,
+            log_matcher=log_filter.log_matcher,
         )
         past_log_filter.filter_params = log_filter.filter_params
 
@@ -397,6 +434,118 @@ class Contract(object):
 
         return past_log_filter
 
+    @combomethod
+    def scanEvents(self, event_name, filter_params=None, **scanner_kwargs):
+        """
+        Returns a `LogScanner` which yields all past events using
+        `eth_getLogs`, in chunks of blocks.
+        """
+        if filter_params is None:
+            filter_params = {}
+
+        event_filter_params = dict(filter_params)
+        argument_filters = event_filter_params.pop('filter', {})
+        event_abi = self._find_matching_event_abi(
+            event_name,
+            list(argument_filters.keys()),
+        )
+
+        log_matcher, event_filter_params = construct_event_log_filter(
+            event_abi,
+            contract_address=self.address,
+            argument_filters=argument_filters,
+            **event_filter_params
+        )
+
+        return LogScanner(
+            self.web3,
+            event_filter_params,
+            log_entry_formatter=get_event_decoder(event_abi).decode,
+            log_matcher=log_matcher,
+            **scanner_kwargs
+        )
+
+    @classmethod
+    def multicall(cls,
+                  calls,
+                  transaction=None,
+                  block_identifier=None,
+                  batch_size=None,
+                  aggregator=None,
+                  raise_errors=True):
+        """
+        Execute many contract function calls using as few requests as
+        possible, returning their results in the same order as ``calls``.
+
+        Each call is a tuple of `(contract, function_name)` optionally
+        followed by a list of positional arguments and a dictionary of
+        keyword arguments.  The contracts may be different but must all have
+        an address and share the same web3 instance.
+
+        By default the calls are sent as JSON-RPC batches of up to
+        ``batch_size`` `eth_call` requests.  If the address of an
+        ``aggregator`` contract exposing
+        `aggregate(address[] targets, bytes[] data) returns (bytes[])` is
+        given, all of the calls are instead made with a single `eth_call` to
+        it.  In that case a single failing call causes the whole request to
+        fail.
+
+        When ``raise_errors`` is `False`, the exception for a call which
+        fails is returned in place of its result instead of being raised.
+        """
+        if not calls:
+            return []
+
+        prepared_calls = [prepare_multicall_call(*call) for call in calls]
+        web3 = prepared_calls[0][0].web3
+
+        if transaction is None:
+            call_transaction = {}
+        else:
+            call_transaction = dict(**transaction)
+
+        if 'data' in call_transaction or 'to' in call_transaction:
+            raise ValueError("Cannot set data or to in a multicall transaction")
+        if web3.eth.defaultAccount is not empty:
+            call_transaction.setdefault('from', web3.eth.defaultAccount)
+
+        if block_identifier is None:
+            block_identifier = web3.eth.defaultBlock
+
+        if aggregator is None:
+            return_data = get_batched_multicall_return_data(
+                web3,
+                prepared_calls,
+                call_transaction,
+                block_identifier,
+                batch_size,
+            )
+        else:
+            return_data = get_aggregated_multicall_return_data(
+                web3,
+                prepared_calls,
+                call_transaction,
+                block_identifier,
+                aggregator,
+            )
+
+        results = []
+        for (contract, function_name, function_abi, _), data in zip(prepared_calls, return_data):
+            try:
+                if isinstance(data, Exception):
+                    raise data
+                results.append(decode_contract_function_output(
+                    contract,
+                    function_name,
+                    function_abi,
+                    data,
+                ))
+            except (ValueError, BadFunctionCallOutput) as err:
+                if raise_errors:
+                    raise
+                results.append(err)
+        return results
+
     @combomethod
     def estimateGas(self, transaction=None):
         """
@@ -591,38 +740,16 @@ class Contract(object):
     #
 
     @classmethod
-    def _find_matching_fn_abi(cls, fn_name=None, args=None, kwargs=None):
-        filters = []
-
-        if fn_name:
-            filters.append(functools.partial(filter_by_name, fn_name))
+    def _get_function_abi_index(cls):
+        function_abi_index = cls._function_abi_index
+        if function_abi_index is None or function_abi_index.abi is not cls.abi:
+            function_abi_index = FunctionABIIndex(cls.abi)
+            cls._function_abi_index = function_abi_index
+        return function_abi_index
 
-        if args is not None or kwargs is not None:
-            if args is None:
-                args = tuple()
-            if kwargs is None:
-                kwargs = {}
-
-            num_arguments = len(args) + len(kwargs)
-            filters.extend([
-                functools.partial(filter_by_argument_count, num_arguments),
-                functools.partial(filter_by_encodability, args, kwargs),
-            ])
-
-        function_candidates = filter_by_type('function', cls.abi)
-
-        for filter_fn in filters:
-            function_candidates = filter_fn(function_candidates)
-
-            if len(function_candidates) == 1:
-                return function_candidates[0]
-            elif not function_candidates:
-                break
-
-        if not function_candidates:
-            raise ValueError("No matching functions found")
-        else:
-            raise ValueError("Multiple functions found")
+    @classmethod
+    def _find_matching_fn_abi(cls, fn_name=None, args=None, kwargs=None):
+        return cls._get_function_abi_index().find_function(fn_name, args, kwargs)
 
     @classmethod
     def _find_matching_event_abi(cls, event_name=None, argument_names=None):
@@ -650,14 +777,15 @@ class Contract(object):
             raise ValueError("Multiple functions found")
 
     @classmethod
-    def _get_function_info(cls, fn_name, args=None, kwargs=None):
+    def _get_function_info(cls, fn_name, args=None, kwargs=None, fn_abi=None):
         if args is None:
             args = tuple()
         if kwargs is None:
             kwargs = {}
 
-        fn_abi = cls._find_matching_fn_abi(fn_name, args, kwargs)
-        fn_selector = encode_hex(function_abi_to_4byte_selector(fn_abi))
+        if fn_abi is None:
+            fn_abi = cls._find_matching_fn_abi(fn_name, args, kwargs)
+        fn_selector = cls._get_function_abi_index().get_selector(fn_abi)
 
         fn_arguments = merge_args_and_kwargs(fn_abi, args, kwargs)
 
@@ -668,7 +796,8 @@ class Contract(object):
                              fn_name,
                              fn_args=None,
                              fn_kwargs=None,
-                             transaction=None):
+                             transaction=None,
+                             fn_abi=None):
         """
         Returns a dictionary of the transaction that could be used to call this
         TODO: make this a public API
@@ -689,6 +818,7 @@ class Contract(object):
             fn_name,
             fn_args,
             fn_kwargs,
+            fn_abi,
         )
         return prepared_transaction
 
@@ -725,11 +855,11 @@ class Contract(object):
 
     @classmethod
     @coerce_return_to_text
-    def _encode_transaction_data(cls, fn_name, args=None, kwargs=None):
-        fn_abi, fn_selector, fn_arguments = cls._get_function_info(
-            fn_name, args, kwargs,
+    def _encode_transaction_data(cls, fn_name, args=None, kwargs=None, fn_abi=None):
+        fn_abi, _, fn_arguments = cls._get_function_info(
+            fn_name, args, kwargs, fn_abi,
         )
-        return add_0x_prefix(cls._encode_abi(fn_abi, fn_arguments, fn_selector))
+        return cls._get_function_abi_index().get_encoder(fn_abi).encode_arguments(fn_arguments)
 
     @classmethod
     @coerce_return_to_text
@@ -762,21 +892,36 @@ def call_contract_function(contract,
     Helper function for interacting with a contract function using the
     `eth_call` API.
     """
+    function_abi = contract._find_matching_fn_abi(function_name, args, kwargs)
+
     call_transaction = contract._prepare_transaction(
         fn_name=function_name,
         fn_args=args,
         fn_kwargs=kwargs,
         transaction=transaction,
+        fn_abi=function_abi,
     )
 
     return_data = contract.web3.eth.call(call_transaction)
 
-    function_abi = contract._find_matching_fn_abi(function_name, args, kwargs)
+    return decode_contract_function_output(
+        contract,
+        function_name,
+        function_abi,
+        return_data,
+    )
+
 
-    output_types = get_abi_output_types(function_abi)
+def decode_contract_function_output(contract, function_name, function_abi, return_data):
+    """
+    Decodes the ``return_data`` of an `eth_call` to the contract function
+    ``function_abi`` using the cached output decoder of ``contract``.
+    """
+    function_abi_index = contract._get_function_abi_index()
+    output_decoder = function_abi_index.get_output_decoder(function_abi)
 
     try:
-        output_data = decode_abi(output_types, return_data)
+        normalized_data = output_decoder(return_data)
     except DecodingError as e:
         # Provide a more helpful error message than the one provided by
         # eth-abi-utils
@@ -795,23 +940,115 @@ def call_contract_function(contract,
                 "output_types {}".format(
                     function_name,
                     return_data,
-                    output_types
+                    function_abi_index.get_output_types(function_abi),
                 )
             )
         raise_from(BadFunctionCallOutput(msg), e)
 
-    normalized_data = [
-        normalize_return_type(data_type, data_value)
-        for data_type, data_value
-        in zip(output_types, output_data)
-    ]
-
     if len(normalized_data) == 1:
         return normalized_data[0]
     else:
         return normalized_data
 
 
+MULTICALL_AGGREGATE_SELECTOR = function_signature_to_4byte_selector(
+    'aggregate(address[],bytes[])',
+)
+
+
+def prepare_multicall_call(contract, function_name, args=None, kwargs=None):
+    """
+    Returns a `(contract, function_name, function_abi, data)` tuple with the
+    call data for a single call given to `Contract.multicall`.
+    """
+    if not contract.address:
+        raise ValueError(
+            "Please ensure that every contract used with `Contract.multicall` "
+            "has an address."
+        )
+    if args is None:
+        args = tuple()
+    if kwargs is None:
+        kwargs = {}
+
+    function_abi = contract._find_matching_fn_abi(function_name, args, kwargs)
+    data = contract._encode_transaction_data(function_name, args, kwargs, function_abi)
+    return contract, function_name, function_abi, data
+
+
+def get_batched_multicall_return_data(web3,
+                                      prepared_calls,
+                                      transaction,
+                                      block_identifier,
+                                      batch_size=None):
+    """
+    Makes the prepared calls as batches of `eth_call` requests.  Returns the
+    return data of each call, or the exception for calls which failed.
+    """
+    formatted_transaction = formatters.input_transaction_formatter(web3.eth, transaction)
+    formatted_block_identifier = formatters.input_block_identifier_formatter(block_identifier)
+
+    requests = []
+    for contract, _, _, data in prepared_calls:
+        call_transaction = dict(formatted_transaction)
+        call_transaction['to'] = formatters.input_address_formatter(contract.address)
+        call_transaction['data'] = data
+        requests.append(('eth_call', [call_transaction, formatted_block_identifier]))
+
+    return_data = []
+    for chunk in partition_all(batch_size or len(requests), requests):
+        for response in web3._requestManager.request_batch(list(chunk)):
+            try:
+                return_data.append(get_response_result(response))
+            except ValueError as err:
+                return_data.append(err)
+    return return_data
+
+
+def get_aggregated_multicall_return_data(web3,
+                                         prepared_calls,
+                                         transaction,
+                                         block_identifier,
+                                         aggregator):
+    """
+    Makes the prepared calls with a single `eth_call` to the `aggregate`
+    function of the ``aggregator`` contract.  Returns the return data of
+    each call.
+    """
+    validate_address(aggregator)
+
+    encoded_arguments = encode_abi(
+        ['address[]', 'bytes[]'],
+        [
+            [contract.address for contract, _, _, _ in prepared_calls],
+            [decode_hex(data) for _, _, _, data in prepared_calls],
+        ],
+    )
+
+    call_transaction = dict(transaction)
+    call_transaction['to'] = aggregator
+    call_transaction['data'] = add_0x_prefix(
+        encode_hex(MULTICALL_AGGREGATE_SELECTOR + encoded_arguments)
+    )
+
+    aggregated_return_data = web3.eth.call(call_transaction, block_identifier)
+
+    try:
+        return_data, = decode_abi(['bytes[]'], decode_hex(aggregated_return_data))
+    except DecodingError as e:
+        raise_from(BadFunctionCallOutput(
+            "Could not decode return data {0} of the aggregator contract at "
+            "{1}".format(aggregated_return_data, aggregator)
+        ), e)
+
+    if len(return_data) != len(prepared_calls):
+        raise BadFunctionCallOutput(
+            "The aggregator contract at {0} returned {1} results for {2} "
+            "calls".format(aggregator, len(return_data), len(prepared_calls))
+        )
+    return return_data
+
+
 def transact_with_contract_function(contract=None,
                                     function_name=None,
                                     transaction=None,
@@ -148,8 +148,7 @@ class Eth(object):
             ],
         )
 
-    @apply_formatters_to_return(formatters.output_block_formatter)
-    def getBlock(self, block_identifier, full_transactions=False):
+    def getBlock(self, block_identifier, full_transactions=False, lazy=False):
         """
         `eth_getBlockByHash`
         `eth_getBlockByNumber`
@@ -159,13 +158,16 @@ class Eth(object):
         else:
             method = 'eth_getBlockByHash'
 
-        return self.web3._requestManager.request_blocking(
+        block = self.web3._requestManager.request_blocking(
             method,
             [
                 formatters.input_block_identifier_formatter(block_identifier),
                 full_transactions,
             ],
         )
+        if lazy:
+            return formatters.lazy_block_formatter(block)
+        return formatters.output_block_formatter(block)
 
     @apply_formatters_to_return(to_decimal)
     def getBlockTransactionCount(self, block_identifier):
@@ -189,12 +191,14 @@ class Eth(object):
         """
         raise NotImplementedError("TODO")
 
-    @apply_formatters_to_return(formatters.output_transaction_formatter)
-    def getTransaction(self, transaction_hash):
-        return self.web3._requestManager.request_blocking(
+    def getTransaction(self, transaction_hash, lazy=False):
+        transaction = self.web3._requestManager.request_blocking(
             "eth_getTransactionByHash",
             [transaction_hash],
         )
+        if lazy:
+            return formatters.lazy_transaction_formatter(transaction)
+        return formatters.output_transaction_formatter(transaction)
 
     @apply_formatters_to_return(formatters.output_transaction_formatter)
     def getTransactionFromBlock(self, block_identifier, transaction_index):
@@ -321,6 +325,13 @@ class Eth(object):
             "eth_getFilterLogs", [filter_id],
         )
 
+    @apply_formatters_to_return(formatters.log_array_formatter)
+    def getLogs(self, filter_params):
+        return self.web3._requestManager.request_blocking(
+            "eth_getLogs",
+            [formatters.input_filter_params_formatter(filter_params)],
+        )
+
     def uninstallFilter(self, filter_id):
         return self.web3._requestManager.request_blocking(
             "eth_uninstallFilter", [filter_id],
@@ -11,6 +11,7 @@ from eth_utils import (
     compose as _compose,
     decode_hex,
     encode_hex,
+    force_obj_to_text,
     is_0x_prefixed,
     is_address,
     is_dict,
@@ -29,6 +30,10 @@ from web3.iban import Iban
 
 from web3.utils.datastructures import (
     AttributeDict,
+    Block,
+    Log,
+    Receipt,
+    Transaction,
 )
 from web3.utils.empty import (
     empty,
@@ -148,43 +153,177 @@ def input_transaction_formatter(eth, txn):
     }
 
 
-@apply_if_not_null
-@wrap_with(AttributeDict)
-@coerce_args_to_text
-@coerce_return_to_text
-def output_transaction_formatter(txn):
-    formatters = {
-        'blockNumber': apply_if_not_null(to_decimal),
-        'transactionIndex': apply_if_not_null(to_decimal),
-        'nonce': to_decimal,
-        'gas': to_decimal,
-        'gasPrice': to_decimal,
-        'value': to_decimal,
-    }
+TEXT_TYPE = type(u'')
 
-    return {
-        key: formatters.get(key, noop)(value)
-        for key, value in txn.items()
-    }
+#
+# Values of these types are returned by the compiled formatters unchanged.
+# Anything else is coerced to text, matching `coerce_return_to_text`.
+#
+PASSTHROUGH_TYPES = frozenset((TEXT_TYPE, int, bool, float, type(None)))
+
+
+def hex_to_int(value):
+    """
+    Fast path for `to_decimal` when given a `0x` prefixed hex string.
+    """
+    if type(value) is TEXT_TYPE and value.startswith('0x'):
+        return int(value, 16)
+    return to_decimal(force_obj_to_text(value))
+
+
+def hex_to_int_if_not_null(value):
+    if value is None:
+        return None
+    return hex_to_int(value)
+
+
+def coerce_to_text(value):
+    """
+    Equivalent to `force_obj_to_text` with fast paths for values which are
+    already text and lists of them.
+    """
+    value_type = type(value)
+    if value_type in PASSTHROUGH_TYPES:
+        return value
+    elif value_type is list:
+        return [coerce_to_text(item) for item in value]
+    return force_obj_to_text(value)
+
+
+def normalize_address(value):
+    """
+    Fast path for `to_normalized_address` when given a `0x` prefixed hex
+    string of the right length.
+    """
+    if type(value) is TEXT_TYPE and len(value) == 42 and value.startswith('0x'):
+        int(value, 16)
+        return value.lower()
+    return to_normalized_address(force_obj_to_text(value))
+
+
+def compile_dict_formatter(field_formatters, record_class=None):
+    """
+    Builds a function which formats a dictionary in a single pass, applying
+    the formatter for each known key and coercing all other values to text.
+    If ``record_class`` is given the result is returned as one.
+    """
+    get_formatter = field_formatters.get
+
+    def format_dict(value):
+        result = {}
+        for key, field in value.items():
+            formatter = get_formatter(key)
+            if formatter is not None:
+                result[key] = formatter(field)
+            elif type(field) in PASSTHROUGH_TYPES:
+                result[key] = field
+            else:
+                result[key] = coerce_to_text(field)
+        if record_class is None:
+            return result
+        return record_class(result)
+    return format_dict
+
+
+def compile_lazy_formatter(field_formatters, record_class):
+    """
+    Like `compile_dict_formatter` but builds a ``record_class`` which keeps
+    the unformatted dictionary and formats each value on first access.
+    """
+    get_formatter = field_formatters.get
+
+    def format_field(key, field):
+        formatter = get_formatter(key)
+        if formatter is not None:
+            return formatter(field)
+        elif type(field) in PASSTHROUGH_TYPES:
+            return field
+        else:
+            return coerce_to_text(field)
+
+    def format_dict(value):
+        return record_class.lazy(value, format_field)
+    return format_dict
+
+
+def compile_array_formatter(item_formatter):
+    """
+    Builds a function which formats each dictionary in an array with
+    ``item_formatter``, coercing any other items to text.
+    """
+    def format_array(value):
+        if not is_list_like(value):
+            return coerce_to_text(value)
+        return [
+            item_formatter(item) if type(item) is dict or is_dict(item) else coerce_to_text(item)
+            for item
+            in value
+        ]
+    return format_array
+
+
+TRANSACTION_FORMATTERS = {
+    'blockNumber': hex_to_int_if_not_null,
+    'transactionIndex': hex_to_int_if_not_null,
+    'nonce': hex_to_int,
+    'gas': hex_to_int,
+    'gasPrice': hex_to_int,
+    'value': hex_to_int,
+}
+
+
+format_transaction = compile_dict_formatter(TRANSACTION_FORMATTERS, Transaction)
+lazy_format_transaction = compile_lazy_formatter(TRANSACTION_FORMATTERS, Transaction)
+
+
+format_log = compile_dict_formatter({
+    'blockNumber': hex_to_int_if_not_null,
+    'transactionIndex': hex_to_int_if_not_null,
+    'logIndex': hex_to_int_if_not_null,
+    'address': normalize_address,
+}, Log)
+
+
+format_transaction_receipt = compile_dict_formatter({
+    'blockNumber': hex_to_int_if_not_null,
+    'transactionIndex': hex_to_int,
+    'cumulativeGasUsed': hex_to_int,
+    'gasUsed': hex_to_int,
+    'logs': apply_if_not_null(compile_array_formatter(format_log)),
+}, Receipt)
+
+
+BLOCK_FORMATTERS = {
+    'gasLimit': hex_to_int,
+    'gasUsed': hex_to_int,
+    'size': hex_to_int,
+    'timestamp': hex_to_int,
+    'number': hex_to_int_if_not_null,
+    'difficulty': hex_to_int,
+    'totalDifficulty': hex_to_int,
+}
+
+
+format_block = compile_dict_formatter(dict(
+    BLOCK_FORMATTERS,
+    transactions=compile_array_formatter(format_transaction),
+), Block)
+lazy_format_block = compile_lazy_formatter(dict(
+    BLOCK_FORMATTERS,
+    transactions=compile_array_formatter(lazy_format_transaction),
+), Block)
+
+
+output_transaction_formatter = apply_if_not_null(format_transaction)
+lazy_transaction_formatter = apply_if_not_null(lazy_format_transaction)
+lazy_block_formatter = apply_if_not_null(lazy_format_block)
 
 
-@wrap_with(AttributeDict)
-@coerce_return_to_text
 def output_log_formatter(log):
     """
     Formats the output of a log
     """
-    formatters = {
-        'blockNumber': apply_if_not_null(to_decimal),
-        'transactionIndex': apply_if_not_null(to_decimal),
-        'logIndex': apply_if_not_null(to_decimal),
-        'address': to_normalized_address,
-    }
-
-    return {
-        key: formatters.get(key, noop)(value)
-        for key, value in log.items()
-    }
+    return format_log(log)
 
 
 log_array_formatter = apply_if_not_null(apply_to_array(apply_if_dict(
@@ -193,50 +332,18 @@ log_array_formatter = apply_if_not_null(apply_to_array(apply_if_dict(
 
 
 @apply_if_not_null
-@wrap_with(AttributeDict)
-@coerce_args_to_text
-@coerce_return_to_text
 def output_transaction_receipt_formatter(receipt):
     """
     Formats the output of a transaction receipt to its proper values
     """
-    formatters = {
-        'blockNumber': apply_if_not_null(to_decimal),
-        'transactionIndex': to_decimal,
-        'cumulativeGasUsed': to_decimal,
-        'gasUsed': to_decimal,
-        'logs': log_array_formatter,
-    }
-
-    return {
-        key: formatters.get(key, noop)(value)
-        for key, value in receipt.items()
-    }
+    return format_transaction_receipt(receipt)
 
 
-@wrap_with(AttributeDict)
-@coerce_return_to_text
 def output_block_formatter(block):
     """
     Formats the output of a block to its proper values
     """
-    formatters = {
-        'gasLimit': to_decimal,
-        'gasUsed': to_decimal,
-        'size': to_decimal,
-        'timestamp': to_decimal,
-        'number': apply_if_not_null(to_decimal),
-        'difficulty': to_decimal,
-        'totalDifficulty': to_decimal,
-        'transactions': apply_if_array(apply_to_array(apply_if_dict(
-            output_transaction_formatter,
-        ))),
-    }
-
-    return {
-        key: formatters.get(key, noop)(value)
-        for key, value in block.items()
-    }
+    return format_block(block)
 
 
 @coerce_return_to_text
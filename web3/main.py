@@ -17,6 +17,7 @@ from cytoolz.functoolz import (
 )
 
 from web3.admin import Admin
+from web3.batch import Batch
 from web3.db import Db
 from web3.eth import Eth
 from web3.miner import Miner
@@ -40,6 +41,10 @@ from web3.providers.tester import (
 )
 from web3.providers.ipc import (
     IPCProvider,
+    PersistentIPCProvider,
+)
+from web3.providers.balancer import (
+    LoadBalancedHTTPProvider,
 )
 from web3.providers.manager import (
     RequestManager,
@@ -58,6 +63,8 @@ class Web3(object):
     RPCProvider = RPCProvider
     KeepAliveRPCProvider = KeepAliveRPCProvider
     IPCProvider = IPCProvider
+    PersistentIPCProvider = PersistentIPCProvider
+    LoadBalancedHTTPProvider = LoadBalancedHTTPProvider
     TestRPCProvider = TestRPCProvider
     EthereumTesterProvider = EthereumTesterProvider
 
@@ -120,8 +127,8 @@ class Web3(object):
     def isConnected(self):
         return self.currentProvider is not None and self.currentProvider.isConnected()
 
-    def createBatch(self):
-        raise NotImplementedError("Not Implemented")
+    def createBatch(self, batch_size=None):
+        return Batch(self, batch_size=batch_size)
 
     def receive(self, requestid, timeout=0, keep=False):
         return self._requestManager.receive(requestid, timeout, keep)
@@ -0,0 +1,69 @@
+"""
+asyncio based providers.  These modules use `yield from` and can only be
+imported on python 3.4 and above.
+"""
+import asyncio
+import json
+
+from eth_utils import (
+    force_text,
+    is_dict,
+)
+
+from .base import (
+    JSONBaseProvider,
+    encode_rpc_payload,
+    order_batch_responses,
+)
+
+
+class AsyncJSONBaseProvider(JSONBaseProvider):
+    @asyncio.coroutine
+    def coro_make_raw_request(self, request_data):
+        """
+        Send the already encoded ``request_data`` to the node and return the
+        raw response.
+        """
+        raise NotImplementedError("Providers must implement this method")
+
+    @asyncio.coroutine
+    def coro_make_request(self, method, params):
+        response = yield from self.coro_make_raw_request(
+            self.encode_rpc_request(method, params),
+        )
+        return response
+
+    @asyncio.coroutine
+    def coro_make_batch_request(self, requests):
+        rpc_requests = [
+            self.form_rpc_request(method, params)
+            for method, params
+            in requests
+        ]
+        if not rpc_requests:
+            return []
+
+        response_raw = yield from self.coro_make_raw_request(
+            encode_rpc_payload(rpc_requests),
+        )
+        responses = json.loads(force_text(response_raw))
+        return order_batch_responses(rpc_requests, responses)
+
+    def make_request(self, method, params):
+        raise NotImplementedError(
+            "Async providers can only be used through the `coro_make_request` "
+            "coroutine"
+        )
+
+    @asyncio.coroutine
+    def coro_isConnected(self):
+        try:
+            response_raw = yield from self.coro_make_request('web3_clientVersion', [])
+        except IOError:
+            return False
+
+        if is_dict(response_raw):
+            response = response_raw
+        else:
+            response = json.loads(force_text(response_raw))
+        return 'error' not in response
@@ -0,0 +1,157 @@
+import asyncio
+import json
+
+from eth_utils import (
+    force_text,
+    is_dict,
+)
+
+from web3.utils.streaming import (
+    JSONMessageFramer,
+)
+
+from .async_base import (
+    AsyncJSONBaseProvider,
+)
+from .base import (
+    encode_rpc_payload,
+    order_batch_responses,
+)
+from .ipc import (
+    get_default_ipc_path,
+    get_response_key,
+)
+
+
+class AsyncIPCProvider(AsyncJSONBaseProvider):
+    """
+    Keeps a single connection to the IPC socket open, with any number of
+    requests in flight at once.  Responses are matched to their requests by
+    JSON-RPC id.
+
+    Only unix domain sockets are supported.
+    """
+    read_size = 65536
+
+    def __init__(self, ipc_path=None, testnet=False, timeout=10, loop=None):
+        if ipc_path is None:
+            self.ipc_path = get_default_ipc_path(testnet)
+        else:
+            self.ipc_path = ipc_path
+
+        self.timeout = timeout
+        self.loop = loop or asyncio.get_event_loop()
+
+        self._writer = None
+        self._reader_task = None
+        self._pending = {}
+        self._connect_lock = asyncio.Lock(loop=self.loop)
+        super(AsyncIPCProvider, self).__init__()
+
+    @property
+    def is_open(self):
+        return self._writer is not None
+
+    @asyncio.coroutine
+    def coro_make_request(self, method, params):
+        rpc_request = self.form_rpc_request(method, params)
+        response = yield from self._send(
+            rpc_request['id'],
+            encode_rpc_payload(rpc_request),
+        )
+        return response
+
+    @asyncio.coroutine
+    def coro_make_batch_request(self, requests):
+        rpc_requests = [
+            self.form_rpc_request(method, params)
+            for method, params
+            in requests
+        ]
+        if not rpc_requests:
+            return []
+
+        responses = yield from self._send(
+            frozenset(rpc_request['id'] for rpc_request in rpc_requests),
+            encode_rpc_payload(rpc_requests),
+        )
+        return order_batch_responses(rpc_requests, responses)
+
+    def close(self):
+        self._close(IOError("The IPC connection to {0} was closed".format(self.ipc_path)))
+
+    @asyncio.coroutine
+    def _connect(self):
+        with (yield from self._connect_lock):
+            if not self.is_open:
+                try:
+                    reader, self._writer = yield from asyncio.open_unix_connection(
+                        self.ipc_path,
+                        loop=self.loop,
+                    )
+                except OSError as err:
+                    raise IOError(err)
+                self._reader_task = asyncio.ensure_future(
+                    self._read_responses(reader),
+                    loop=self.loop,
+                )
+
+    @asyncio.coroutine
+    def _send(self, response_key, request_data):
+        yield from self._connect()
+
+        future = asyncio.Future(loop=self.loop)
+        self._pending[response_key] = future
+        self._writer.write(request_data)
+
+        try:
+            response = yield from asyncio.wait_for(future, self.timeout, loop=self.loop)
+        except asyncio.TimeoutError:
+            raise IOError(
+                "No response from {0} after {1} seconds".format(self.ipc_path, self.timeout)
+            )
+        finally:
+            self._pending.pop(response_key, None)
+        return response
+
+    @asyncio.coroutine
+    def _read_responses(self, reader):
+        framer = JSONMessageFramer()
+        try:
+            while True:
+                data = yield from reader.read(self.read_size)
+                if not data:
+                    break
+                for message in framer.feed(data):
+                    self._dispatch_response(json.loads(force_text(message)))
+        except Exception as err:
+            self._close(IOError(err))
+        else:
+            self._close(IOError("The IPC connection to {0} was closed".format(self.ipc_path)))
+
+    def _dispatch_response(self, response):
+        future = self._pending.pop(get_response_key(response), None)
+        if future is not None:
+            futures = [future]
+        elif is_dict(response) and 'error' in response:
+            # An error which cannot be matched to a request, such as the
+            # rejection of a whole batch with a `null` id, is given to every
+            # pending request rather than leaving them to time out.
+            futures = list(self._pending.values())
+            self._pending.clear()
+        else:
+            futures = []
+
+        for future in futures:
+            if not future.done():
+                future.set_result(response)
+
+    def _close(self, error):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
@@ -0,0 +1,54 @@
+import asyncio
+
+from .manager import (
+    ReplayRequestManager,
+    RequestCaptured,
+    decode_response,
+    get_response_result,
+)
+
+
+class AsyncRequestManager(object):
+    def __init__(self, provider):
+        self.provider = provider
+
+    def setProvider(self, provider):
+        self.provider = provider
+
+    @asyncio.coroutine
+    def coro_request(self, method, params):
+        """
+        Make a request using the provider, returning the result once it
+        arrives.
+        """
+        response_raw = yield from self.provider.coro_make_request(method, params)
+        return get_response_result(decode_response(response_raw))
+
+    @asyncio.coroutine
+    def coro_request_batch(self, requests):
+        """
+        Asynchronous counterpart of `RequestManager.request_batch`.
+        """
+        responses_raw = yield from self.provider.coro_make_batch_request(requests)
+        return [decode_response(response_raw) for response_raw in responses_raw]
+
+    @asyncio.coroutine
+    def coro_run(self, host, fn):
+        """
+        Run ``fn`` against the modules of ``host``, sending each request it
+        makes through the provider asynchronously.
+
+        ``fn`` is re-run from the start each time it makes a request which
+        has not been answered yet, with the responses received so far
+        replayed, until it completes without needing any new requests.
+        """
+        responses = []
+        while True:
+            try:
+                return host.run(fn, ReplayRequestManager(responses))
+            except RequestCaptured as captured:
+                response_raw = yield from self.provider.coro_make_request(
+                    captured.method,
+                    captured.params,
+                )
+                responses.append((captured.method, decode_response(response_raw)))
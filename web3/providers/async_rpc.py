@@ -0,0 +1,82 @@
+import asyncio
+
+from eth_utils import (
+    to_dict,
+)
+
+from web3.utils.http import construct_user_agent
+
+from .async_base import (
+    AsyncJSONBaseProvider,
+)
+
+
+def is_aiohttp_available():
+    try:
+        import aiohttp  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class AsyncHTTPProvider(AsyncJSONBaseProvider):
+    endpoint_uri = None
+    _request_kwargs = None
+
+    def __init__(self, endpoint_uri, request_kwargs=None, loop=None):
+        if not is_aiohttp_available():
+            raise Exception("`AsyncHTTPProvider` requires the `aiohttp` package to be installed")
+
+        self.endpoint_uri = endpoint_uri
+        self._request_kwargs = request_kwargs or {}
+        self.loop = loop or asyncio.get_event_loop()
+        self._session = None
+        super(AsyncHTTPProvider, self).__init__()
+
+    def __str__(self):
+        return "Async RPC connection {0}".format(self.endpoint_uri)
+
+    @to_dict
+    def get_request_kwargs(self):
+        if 'headers' not in self._request_kwargs:
+            yield 'headers', self.get_request_headers()
+        for key, value in self._request_kwargs.items():
+            yield key, value
+
+    def get_request_headers(self):
+        return {
+            'Content-Type': 'application/json',
+            'User-Agent': construct_user_agent(str(type(self))),
+        }
+
+    def get_session(self):
+        if self._session is None:
+            import aiohttp
+            self._session = aiohttp.ClientSession(loop=self.loop)
+        return self._session
+
+    @asyncio.coroutine
+    def coro_make_raw_request(self, request_data):
+        import aiohttp
+
+        try:
+            response = yield from self.get_session().post(
+                self.endpoint_uri,
+                data=request_data,
+                **self.get_request_kwargs()
+            )
+        except aiohttp.ClientError as err:
+            raise IOError(err)
+
+        try:
+            response.raise_for_status()
+            response_body = yield from response.read()
+        finally:
+            response.release()
+        return response_body
+
+    @asyncio.coroutine
+    def close(self):
+        if self._session is not None:
+            yield from self._session.close()
+            self._session = None
@@ -0,0 +1,240 @@
+import itertools
+import logging
+import time
+
+from web3.utils.compat import (
+    spawn,
+    threading,
+)
+
+from .base import BaseProvider
+from .rpc import HTTPProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+#
+# Requests for these methods do not depend on, or change, any state held by
+# the individual node, so they can be sent to any node and retried on another
+# node if the first one fails.
+#
+READ_ONLY_METHODS = frozenset((
+    'web3_clientVersion',
+    'web3_sha3',
+    'net_version',
+    'net_peerCount',
+    'net_listening',
+    'eth_protocolVersion',
+    'eth_syncing',
+    'eth_gasPrice',
+    'eth_blockNumber',
+    'eth_getBalance',
+    'eth_getStorageAt',
+    'eth_getTransactionCount',
+    'eth_getBlockTransactionCountByHash',
+    'eth_getBlockTransactionCountByNumber',
+    'eth_getUncleCountByBlockHash',
+    'eth_getUncleCountByBlockNumber',
+    'eth_getCode',
+    'eth_call',
+    'eth_estimateGas',
+    'eth_getBlockByHash',
+    'eth_getBlockByNumber',
+    'eth_getTransactionByHash',
+    'eth_getTransactionByBlockHashAndIndex',
+    'eth_getTransactionByBlockNumberAndIndex',
+    'eth_getTransactionReceipt',
+    'eth_getUncleByBlockHashAndIndex',
+    'eth_getUncleByBlockNumberAndIndex',
+    'eth_getLogs',
+))
+
+ROUND_ROBIN = 'round-robin'
+LEAST_IN_FLIGHT = 'least-in-flight'
+LATENCY = 'latency'
+
+STRATEGIES = (ROUND_ROBIN, LEAST_IN_FLIGHT, LATENCY)
+
+
+def is_failover_error(error):
+    """
+    Returns whether ``error`` means the node could not serve the request, as
+    opposed to the request itself being invalid.
+    """
+    response = getattr(error, 'response', None)
+    status_code = getattr(response, 'status_code', None)
+    if status_code is not None:
+        return status_code >= 500
+    return isinstance(error, (IOError, OSError))
+
+
+class Endpoint(object):
+    """
+    Book keeping for a single node behind a `LoadBalancedHTTPProvider`.
+    """
+    ejected_until = None
+    is_probing = False
+    latency = None
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.in_flight = 0
+        self.failures = 0
+
+    def __str__(self):
+        return str(self.provider)
+
+    @property
+    def is_healthy(self):
+        return self.ejected_until is None
+
+    @property
+    def expected_latency(self):
+        # Endpoints which have not been measured yet are tried first.
+        return (self.latency or 0) * (self.in_flight + 1)
+
+
+class LoadBalancedHTTPProvider(BaseProvider):
+    """
+    Spreads requests across a number of JSON-RPC nodes.
+
+    Read only requests are sent to a node chosen by ``strategy`` and retried
+    on the remaining nodes if it fails.  All other requests, including
+    transactions and filters, are sent to the first healthy node in
+    ``endpoint_uris`` and are never retried since the node may have acted on
+    them.
+
+    A node which fails is ejected for ``eject_for`` seconds, after which it
+    is probed in the background with `isConnected` and brought back once it
+    responds.
+    """
+    def __init__(self,
+                 endpoint_uris,
+                 strategy=ROUND_ROBIN,
+                 request_kwargs=None,
+                 stream_responses=False,
+                 eject_for=30,
+                 latency_decay=0.3):
+        if not endpoint_uris:
+            raise ValueError("At least one endpoint uri is required")
+        if strategy not in STRATEGIES:
+            raise ValueError("Unknown strategy '{0}'.  Must be one of {1}".format(
+                strategy,
+                ', '.join(STRATEGIES),
+            ))
+
+        self.endpoints = [
+            Endpoint(HTTPProvider(endpoint_uri, request_kwargs, stream_responses))
+            for endpoint_uri
+            in endpoint_uris
+        ]
+        self.strategy = strategy
+        self.eject_for = eject_for
+        self.latency_decay = latency_decay
+
+        self._lock = threading.Lock()
+        self._round_robin_counter = itertools.count()
+
+    def __str__(self):
+        return "Load balanced RPC connection to {0}".format(
+            ', '.join(str(endpoint) for endpoint in self.endpoints)
+        )
+
+    def make_request(self, method, params):
+        return self._send(
+            method in READ_ONLY_METHODS,
+            lambda provider: provider.make_request(method, params),
+        )
+
+    def make_batch_request(self, requests):
+        return self._send(
+            all(method in READ_ONLY_METHODS for method, _ in requests),
+            lambda provider: provider.make_batch_request(requests),
+        )
+
+    def isConnected(self):
+        return any(endpoint.provider.isConnected() for endpoint in self.endpoints)
+
+    def get_candidates(self, read_only):
+        """
+        Returns the endpoints to try, in order.
+        """
+        with self._lock:
+            self._probe_ejected()
+            healthy = [endpoint for endpoint in self.endpoints if endpoint.is_healthy]
+
+            if not healthy:
+                # Every node has failed recently so try them all, starting
+                # with the one which has been ejected longest.
+                return sorted(self.endpoints, key=lambda endpoint: endpoint.ejected_until)
+            elif not read_only:
+                return healthy[:1]
+            elif self.strategy == ROUND_ROBIN:
+                offset = next(self._round_robin_counter) % len(healthy)
+                return healthy[offset:] + healthy[:offset]
+            elif self.strategy == LEAST_IN_FLIGHT:
+                return sorted(healthy, key=lambda endpoint: endpoint.in_flight)
+            elif self.strategy == LATENCY:
+                return sorted(healthy, key=lambda endpoint: endpoint.expected_latency)
+            else:
+                raise ValueError("Unknown strategy '{0}'".format(self.strategy))
+
+    def _send(self, read_only, send_fn):
+        candidates = self.get_candidates(read_only)
+
+        for index, endpoint in enumerate(candidates):
+            with self._lock:
+                endpoint.in_flight += 1
+            started_at = time.time()
+
+            try:
+                response = send_fn(endpoint.provider)
+            except Exception as err:
+                if not is_failover_error(err):
+                    raise
+                self._record_failure(endpoint, err)
+                if not read_only or index == len(candidates) - 1:
+                    raise
+            else:
+                self._record_success(endpoint, time.time() - started_at)
+                return response
+            finally:
+                with self._lock:
+                    endpoint.in_flight -= 1
+
+    def _record_success(self, endpoint, elapsed):
+        with self._lock:
+            endpoint.failures = 0
+            if endpoint.latency is None:
+                endpoint.latency = elapsed
+            else:
+                endpoint.latency += self.latency_decay * (elapsed - endpoint.latency)
+
+    def _record_failure(self, endpoint, error):
+        logger.warning("Ejecting %s after request failed: %s", endpoint, error)
+        with self._lock:
+            endpoint.failures += 1
+            endpoint.ejected_until = time.time() + self.eject_for
+
+    def _probe_ejected(self):
+        now = time.time()
+        for endpoint in self.endpoints:
+            if endpoint.is_healthy or endpoint.is_probing or endpoint.ejected_until > now:
+                continue
+            endpoint.is_probing = True
+            spawn(self._probe, endpoint=endpoint)
+
+    def _probe(self, endpoint):
+        try:
+            is_connected = endpoint.provider.isConnected()
+        except Exception:
+            is_connected = False
+
+        with self._lock:
+            endpoint.is_probing = False
+            if is_connected:
+                endpoint.ejected_until = None
+                endpoint.failures = 0
+            else:
+                endpoint.ejected_until = time.time() + self.eject_for
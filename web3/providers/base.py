@@ -7,6 +7,7 @@ from eth_utils import (
     force_bytes,
     force_obj_to_text,
     force_text,
+    is_dict,
 )
 
 
@@ -14,6 +15,20 @@ class BaseProvider(object):
     def make_request(self, method, params):
         raise NotImplementedError("Providers must implement this method")
 
+    def make_batch_request(self, requests):
+        """
+        Make each of the `(method, params)` pairs in ``requests``, returning
+        the responses in the same order.
+
+        Providers which can send multiple requests in a single round trip
+        should override this.
+        """
+        return [
+            self.make_request(method, params)
+            for method, params
+            in requests
+        ]
+
     def isConnected(self):
         raise NotImplementedError("Providers must implement this method")
 
@@ -22,18 +37,54 @@ class JSONBaseProvider(BaseProvider):
     def __init__(self):
         self.request_counter = itertools.count()
 
-    def encode_rpc_request(self, method, params):
-        return force_bytes(json.dumps(force_obj_to_text({
+    def form_rpc_request(self, method, params):
+        return {
             "jsonrpc": "2.0",
             "method": method,
             "params": params or [],
             "id": next(self.request_counter),
-        })))
+        }
+
+    def encode_rpc_request(self, method, params):
+        return encode_rpc_payload(self.form_rpc_request(method, params))
+
+    def make_raw_request(self, request_data):
+        """
+        Send the already encoded ``request_data`` to the node and return the
+        raw response.
+        """
+        raise NotImplementedError("Providers must implement this method")
+
+    def make_request(self, method, params):
+        return self.make_raw_request(self.encode_rpc_request(method, params))
+
+    def make_batch_request(self, requests):
+        """
+        Send all of the `(method, params)` pairs in ``requests`` as a single
+        JSON-RPC batch, returning the decoded responses in the same order as
+        the requests.
+        """
+        rpc_requests = [
+            self.form_rpc_request(method, params)
+            for method, params
+            in requests
+        ]
+        if not rpc_requests:
+            return []
+
+        request_data = encode_rpc_payload(rpc_requests)
+        response_raw = self.make_raw_request(request_data)
+        responses = json.loads(force_text(response_raw))
+
+        return order_batch_responses(rpc_requests, responses)
 
     def isConnected(self):
         try:
             response_raw = self.make_request('web3_clientVersion', [])
-            response = json.loads(force_text(response_raw))
+            if is_dict(response_raw):
+                response = response_raw
+            else:
+                response = json.loads(force_text(response_raw))
         except IOError:
             return False
         else:
@@ -41,3 +92,34 @@ class JSONBaseProvider(BaseProvider):
             assert 'error' not in response
             return True
         assert False
+
+
+def encode_rpc_payload(payload):
+    return force_bytes(json.dumps(force_obj_to_text(payload)))
+
+
+def order_batch_responses(rpc_requests, responses):
+    """
+    Nodes are free to answer the members of a batch in any order so the
+    responses are matched back up to their requests using the request `id`.
+    """
+    if is_dict(responses):
+        # The node rejected the batch as a whole.
+        raise ValueError(responses.get("error", responses))
+
+    responses_by_id = {
+        response.get('id'): response
+        for response
+        in responses
+    }
+
+    try:
+        return [
+            responses_by_id[rpc_request['id']]
+            for rpc_request
+            in rpc_requests
+        ]
+    except KeyError as err:
+        raise ValueError(
+            "No response found in batch for request id: {0}".format(err.args[0])
+        )
@@ -0,0 +1,188 @@
+import collections
+import json
+import time
+
+from eth_utils import (
+    force_text,
+    is_integer,
+    is_string,
+)
+
+from web3.utils.caching import (
+    generate_cache_key,
+)
+from web3.utils.compat import (
+    threading,
+)
+from web3.utils.empty import (
+    empty,
+)
+
+
+def is_pinned_block_identifier(block_identifier):
+    """
+    Returns whether ``block_identifier`` always refers to the same block, as
+    opposed to `latest` or `pending` which change as the chain grows.
+    """
+    if is_integer(block_identifier):
+        return True
+    elif is_string(block_identifier):
+        return force_text(block_identifier) not in {"latest", "pending"}
+    else:
+        return False
+
+
+def always(params):
+    return True
+
+
+def block_param(index):
+    def is_pinned(params):
+        if len(params) <= index:
+            # The node will default to `latest`.
+            return False
+        return is_pinned_block_identifier(params[index])
+    return is_pinned
+
+
+def is_not_null(result):
+    return result is not None
+
+
+def is_mined(result):
+    return result is not None and result.get('blockHash') is not None
+
+
+#
+# Maps each cacheable method to a pair of functions.  The first is given the
+# request params and returns whether the request refers to something
+# immutable.  The second is given the result and returns whether it is final,
+# so that results like a `null` receipt for a pending transaction are not
+# cached.
+#
+DEFAULT_CACHE_RULES = {
+    'web3_sha3': (always, is_not_null),
+    'net_version': (always, is_not_null),
+    'eth_getBlockByHash': (always, is_not_null),
+    'eth_getBlockTransactionCountByHash': (always, is_not_null),
+    'eth_getUncleCountByBlockHash': (always, is_not_null),
+    'eth_getTransactionByBlockHashAndIndex': (always, is_not_null),
+    'eth_getUncleByBlockHashAndIndex': (always, is_not_null),
+    'eth_getTransactionByHash': (always, is_mined),
+    'eth_getTransactionReceipt': (always, is_mined),
+    'eth_getBlockByNumber': (block_param(0), is_not_null),
+    'eth_getBlockTransactionCountByNumber': (block_param(0), is_not_null),
+    'eth_getUncleCountByBlockNumber': (block_param(0), is_not_null),
+    'eth_getTransactionByBlockNumberAndIndex': (block_param(0), is_not_null),
+    'eth_getUncleByBlockNumberAndIndex': (block_param(0), is_not_null),
+    'eth_getBalance': (block_param(1), is_not_null),
+    'eth_getCode': (block_param(1), is_not_null),
+    'eth_getTransactionCount': (block_param(1), is_not_null),
+    'eth_getStorageAt': (block_param(2), is_not_null),
+    'eth_call': (block_param(1), is_not_null),
+}
+
+
+class ResponseCache(object):
+    """
+    Least recently used cache for the results of RPC requests which cannot
+    change, such as blocks fetched by hash or state at a specific block
+    number.
+
+    * ``max_entries`` limits the number of cached results.
+    * ``max_bytes`` limits the total JSON encoded size of the cached results.
+    * ``ttl`` is the number of seconds after which a result is evicted.  This
+      bounds how long a result fetched by block number survives a chain
+      reorganization.
+    * ``rules`` maps method names to `(params_fn, result_fn)` pairs, see
+      `DEFAULT_CACHE_RULES`.  Methods without a rule are never cached.
+    """
+    hits = 0
+    misses = 0
+
+    def __init__(self, max_entries=1024, max_bytes=None, ttl=None, rules=None, clock=time.time):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        if rules is None:
+            self.rules = dict(DEFAULT_CACHE_RULES)
+        else:
+            self.rules = rules
+        self.clock = clock
+
+        self.total_bytes = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_cache_key(self, method, params):
+        """
+        Returns the key for the request, or `None` if it is not cacheable.
+        """
+        try:
+            params_fn, _ = self.rules[method]
+        except KeyError:
+            return None
+        if not params_fn(params):
+            return None
+        return generate_cache_key((method, params))
+
+    def get(self, cache_key, default=empty):
+        with self._lock:
+            try:
+                result, size, expires_at = self._entries.pop(cache_key)
+            except KeyError:
+                self.misses += 1
+                return default
+
+            if expires_at is not None and expires_at <= self.clock():
+                self.total_bytes -= size
+                self.misses += 1
+                return default
+
+            # Re-inserting marks the entry as the most recently used.
+            self._entries[cache_key] = (result, size, expires_at)
+            self.hits += 1
+            return result
+
+    def set(self, method, cache_key, result):
+        """
+        Store ``result`` if the rule for ``method`` considers it final.
+        """
+        _, result_fn = self.rules[method]
+        if not result_fn(result):
+            return
+
+        if self.max_bytes is None:
+            size = 0
+        else:
+            size = len(json.dumps(result))
+            if size > self.max_bytes:
+                return
+
+        if self.ttl is None:
+            expires_at = None
+        else:
+            expires_at = self.clock() + self.ttl
+
+        with self._lock:
+            if cache_key in self._entries:
+                self.total_bytes -= self._entries.pop(cache_key)[1]
+            self._entries[cache_key] = (result, size, expires_at)
+            self.total_bytes += size
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries or
+            (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self.total_bytes -= size
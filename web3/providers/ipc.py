@@ -12,32 +12,49 @@ except ImportError:
 
 from eth_utils import (
     force_text,
+    is_dict,
 )
 
 from web3.utils.compat import (
+    Event,
     Timeout,
     threading,
     socket,
+    spawn,
+)
+from web3.utils.streaming import (
+    JSONMessageFramer,
 )
 
-from .base import JSONBaseProvider
+from .base import (
+    JSONBaseProvider,
+    encode_rpc_payload,
+    order_batch_responses,
+)
 
 
-@contextlib.contextmanager
-def get_ipc_socket(ipc_path, timeout=0.1):
+def open_ipc_socket(ipc_path, timeout=0.1):
     if sys.platform == 'win32':
         # On Windows named pipe is used. Simulate socket with it.
         from web3.utils.windows import NamedPipe
 
-        pipe = NamedPipe(ipc_path)
-        with contextlib.closing(pipe):
-            yield pipe
+        return NamedPipe(ipc_path)
     else:
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.connect(ipc_path)
+        try:
+            sock.connect(ipc_path)
+        except Exception:
+            sock.close()
+            raise
         sock.settimeout(timeout)
-        with contextlib.closing(sock):
-            yield sock
+        return sock
+
+
+@contextlib.contextmanager
+def get_ipc_socket(ipc_path, timeout=0.1):
+    sock = open_ipc_socket(ipc_path, timeout)
+    with contextlib.closing(sock):
+        yield sock
 
 
 def get_default_ipc_path(testnet=False):
@@ -71,7 +88,11 @@ def get_default_ipc_path(testnet=False):
 
 
 class IPCProvider(JSONBaseProvider):
-    def __init__(self, ipc_path=None, testnet=False, *args, **kwargs):
+    read_size = 65536
+
+    def __init__(self, ipc_path=None, testnet=False, stream_responses=True, *args, **kwargs):
+        self.stream_responses = stream_responses
+
         if ipc_path is None:
             self.ipc_path = get_default_ipc_path(testnet)
         else:
@@ -80,36 +101,241 @@ class IPCProvider(JSONBaseProvider):
         self._lock = threading.Lock()
         super(IPCProvider, self).__init__(*args, **kwargs)
 
-    def make_request(self, method, params):
-        request = self.encode_rpc_request(method, params)
-
+    def make_raw_request(self, request):
         self._lock.acquire()
 
         try:
             with get_ipc_socket(self.ipc_path) as sock:
                 sock.sendall(request)
-                # TODO: use a BytesIO object here
-                response_raw = b""
-
-                with Timeout(10) as timeout:
-                    while True:
-                        try:
-                            response_raw += sock.recv(4096)
-                        except socket.timeout:
-                            timeout.sleep(0)
-                            continue
-
-                        if response_raw == b"":
-                            timeout.sleep(0)
-                        else:
-                            try:
-                                json.loads(force_text(response_raw))
-                            except JSONDecodeError:
-                                timeout.sleep(0)
-                                continue
-                            else:
-                                break
+                if self.stream_responses:
+                    response_raw = self._read_response_streaming(sock)
+                else:
+                    response_raw = self._read_response(sock)
         finally:
             self._lock.release()
 
         return response_raw
+
+    def _read_response(self, sock):
+        # TODO: use a BytesIO object here
+        response_raw = b""
+
+        with Timeout(10) as timeout:
+            while True:
+                try:
+                    response_raw += sock.recv(4096)
+                except socket.timeout:
+                    timeout.sleep(0)
+                    continue
+
+                if response_raw == b"":
+                    timeout.sleep(0)
+                else:
+                    try:
+                        json.loads(force_text(response_raw))
+                    except JSONDecodeError:
+                        timeout.sleep(0)
+                        continue
+                    else:
+                        break
+
+        return response_raw
+
+    def _read_response_streaming(self, sock):
+        """
+        Reads into a single reusable receive buffer, handing each chunk to a
+        `JSONMessageFramer` which finds the end of the response without
+        attempting to decode it.
+        """
+        framer = JSONMessageFramer()
+        receive_buffer = bytearray(self.read_size)
+        receive_view = memoryview(receive_buffer)
+
+        with Timeout(10) as timeout:
+            while True:
+                try:
+                    num_bytes = recv_into(sock, receive_buffer)
+                except socket.timeout:
+                    timeout.sleep(0)
+                    continue
+
+                if num_bytes == 0:
+                    raise IOError(
+                        "The IPC connection to {0} was closed before a complete "
+                        "response was received".format(self.ipc_path)
+                    )
+
+                messages = framer.feed(receive_view[:num_bytes])
+                if messages:
+                    return messages[0]
+
+
+def recv_into(sock, receive_buffer):
+    if hasattr(sock, 'recv_into'):
+        return sock.recv_into(receive_buffer)
+
+    # The windows `NamedPipe` only supports `recv`.
+    data = sock.recv(len(receive_buffer))
+    receive_buffer[:len(data)] = data
+    return len(data)
+
+
+def get_response_key(response):
+    if is_dict(response):
+        return response.get('id')
+    else:
+        return frozenset(item.get('id') for item in response)
+
+
+class IPCConnection(object):
+    """
+    A long lived connection to an IPC socket which allows many requests to be
+    in flight at once.  Responses are read by a background reader and handed
+    to the waiting request with the matching JSON-RPC id.
+    """
+    read_size = 65536
+
+    def __init__(self, ipc_path, timeout=10):
+        self.ipc_path = ipc_path
+        self.timeout = timeout
+        self.is_open = True
+
+        self._sock = open_ipc_socket(ipc_path, timeout=None)
+        self._send_lock = threading.Lock()
+        # Guards `is_open` and `_pending`, so that no request can be
+        # registered after `close` has failed the pending ones.
+        self._pending_lock = threading.Lock()
+        self._pending = {}
+        self._framer = JSONMessageFramer()
+        self._reader = spawn(self._read_responses)
+
+    def request(self, response_key, request_data):
+        """
+        Send ``request_data`` and block until the response matching
+        ``response_key`` arrives, returning the decoded response.
+        """
+        event = Event()
+        slot = {'event': event}
+
+        with self._pending_lock:
+            if not self.is_open:
+                raise IOError("The IPC connection to {0} is closed".format(self.ipc_path))
+            self._pending[response_key] = slot
+
+        try:
+            with self._send_lock:
+                self._sock.sendall(request_data)
+        except Exception:
+            with self._pending_lock:
+                self._pending.pop(response_key, None)
+            self.close()
+            raise
+
+        if not event.wait(self.timeout):
+            with self._pending_lock:
+                self._pending.pop(response_key, None)
+            raise socket.timeout(
+                "No response from {0} after {1} seconds".format(self.ipc_path, self.timeout)
+            )
+
+        if 'error' in slot:
+            raise slot['error']
+        return slot['response']
+
+    def close(self, error=None):
+        with self._pending_lock:
+            if not self.is_open:
+                return
+            self.is_open = False
+            pending_slots = list(self._pending.values())
+            self._pending.clear()
+
+        try:
+            if hasattr(self._sock, 'shutdown'):
+                # Wakes up the reader if it is blocked waiting on data.
+                self._sock.shutdown(socket.SHUT_RDWR)
+            self._sock.close()
+        except Exception:
+            pass
+
+        if error is None:
+            error = IOError("The IPC connection to {0} was closed".format(self.ipc_path))
+        for slot in pending_slots:
+            slot['error'] = error
+            slot['event'].set()
+
+    def _read_responses(self):
+        try:
+            while self.is_open:
+                data = self._sock.recv(self.read_size)
+                if not data:
+                    break
+                for message in self._framer.feed(data):
+                    self._dispatch_response(json.loads(force_text(message)))
+        except Exception as err:
+            self.close(IOError(err))
+        else:
+            self.close()
+
+    def _dispatch_response(self, response):
+        with self._pending_lock:
+            slot = self._pending.pop(get_response_key(response), None)
+            if slot is not None:
+                slots = [slot]
+            elif is_dict(response) and 'error' in response:
+                # An error which cannot be matched to a request, such as the
+                # rejection of a whole batch with a `null` id, is given to
+                # every pending request rather than leaving them to time out.
+                slots = list(self._pending.values())
+                self._pending.clear()
+            else:
+                slots = []
+
+        for slot in slots:
+            slot['response'] = response
+            slot['event'].set()
+
+
+class PersistentIPCProvider(IPCProvider):
+    """
+    An `IPCProvider` which keeps a single connection open and sends requests
+    over it without waiting for earlier requests to be answered.
+    """
+    def __init__(self, ipc_path=None, testnet=False, timeout=10, *args, **kwargs):
+        self.timeout = timeout
+        self._connection = None
+        super(PersistentIPCProvider, self).__init__(ipc_path, testnet, *args, **kwargs)
+
+    def get_connection(self):
+        with self._lock:
+            if self._connection is None or not self._connection.is_open:
+                self._connection = IPCConnection(self.ipc_path, timeout=self.timeout)
+            return self._connection
+
+    def make_request(self, method, params):
+        rpc_request = self.form_rpc_request(method, params)
+        return self.get_connection().request(
+            rpc_request['id'],
+            encode_rpc_payload(rpc_request),
+        )
+
+    def make_batch_request(self, requests):
+        rpc_requests = [
+            self.form_rpc_request(method, params)
+            for method, params
+            in requests
+        ]
+        if not rpc_requests:
+            return []
+
+        responses = self.get_connection().request(
+            frozenset(rpc_request['id'] for rpc_request in rpc_requests),
+            encode_rpc_payload(rpc_requests),
+        )
+        return order_batch_responses(rpc_requests, responses)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
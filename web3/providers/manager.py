@@ -1,3 +1,4 @@
+import functools
 import json
 import uuid
 
@@ -8,41 +9,101 @@ from eth_utils import (
 )
 
 from web3.utils.compat import (
-    spawn,
+    Pool,
+    Queue,
+)
+from web3.utils.empty import (
+    empty,
 )
 
 
 class RequestManager(object):
-    def __init__(self, provider):
+    def __init__(self, provider, pool_size=10, cache=None):
         self.pending_requests = {}
         self.provider = provider
+        self.pool_size = pool_size
+        self.pool = Pool(pool_size)
+        self.cache = cache
 
     def setProvider(self, provider):
         self.provider = provider
+        if self.cache is not None:
+            self.cache.clear()
 
     def request_blocking(self, method, params):
         """
-        Make a synchronous request using the provider
+        Make a synchronous request using the provider, or serve it from the
+        response cache if one is configured and has the result.
         """
+        if self.cache is None:
+            cache_key = None
+        else:
+            cache_key = self.cache.get_cache_key(method, params)
+
+        if cache_key is not None:
+            result = self.cache.get(cache_key)
+            if result is not empty:
+                return result
+
         response_raw = self.provider.make_request(method, params)
+        result = get_response_result(decode_response(response_raw))
+
+        if cache_key is not None:
+            self.cache.set(method, cache_key, result)
+        return result
+
+    def request_batch(self, requests):
+        """
+        Make a single batched request for all of the `(method, params)` pairs
+        in ``requests`` using the provider.  Returns the decoded response
+        objects in the same order as ``requests``.
+
+        Requests which can be served from the response cache are left out of
+        the batch.
+        """
+        if self.cache is None:
+            responses_raw = self.provider.make_batch_request(requests)
+            return [decode_response(response_raw) for response_raw in responses_raw]
+
+        responses = [None] * len(requests)
+        uncached = []
 
-        if is_string(response_raw):
-            response = json.loads(force_text(response_raw))
-        elif is_dict(response_raw):
-            response = response_raw
+        for index, (method, params) in enumerate(requests):
+            cache_key = self.cache.get_cache_key(method, params)
+            if cache_key is not None:
+                result = self.cache.get(cache_key)
+                if result is not empty:
+                    responses[index] = {'jsonrpc': '2.0', 'result': result}
+                    continue
+            uncached.append((index, method, params, cache_key))
 
-        if "error" in response:
-            raise ValueError(response["error"])
+        if uncached:
+            responses_raw = self.provider.make_batch_request([
+                (method, params)
+                for _, method, params, _
+                in uncached
+            ])
+            for (index, method, _, cache_key), response_raw in zip(uncached, responses_raw):
+                response = decode_response(response_raw)
+                responses[index] = response
+                if cache_key is not None and 'error' not in response:
+                    self.cache.set(method, cache_key, response['result'])
 
-        return response['result']
+        return responses
+
+    def request_future(self, method, params):
+        """
+        Make a request using one of the workers from the manager's pool,
+        returning a future whose `get` method blocks until the result is
+        available.
+
+        This blocks while ``pool_size`` requests are already in flight.
+        """
+        return self.pool.spawn(self.request_blocking, method, params)
 
     def request_async(self, method, params):
         request_id = uuid.uuid4()
-        self.pending_requests[request_id] = spawn(
-            self.request_blocking,
-            method,
-            params,
-        )
+        self.pending_requests[request_id] = self.request_future(method, params)
         return request_id
 
     def receive_blocking(self, request_id, timeout=None):
@@ -51,14 +112,119 @@ class RequestManager(object):
         except KeyError:
             raise KeyError("Request for id:{0} not found".format(request_id))
         else:
-            response_raw = request.get(timeout=timeout)
+            return request.get(timeout=timeout)
 
-        response = json.loads(response_raw)
+    def as_completed(self, requests):
+        """
+        Make a request for each of the `(method, params)` pairs in
+        ``requests``, yielding `(request, future)` pairs in the order that
+        the responses arrive.  The future's `get` method returns the result
+        or raises the error for that request.
 
-        if "error" in response:
-            raise ValueError(response["error"])
+        ``requests`` is consumed lazily and no more than ``pool_size``
+        requests are in flight at once, so it may be a generator over any
+        number of requests.
+        """
+        for _, request, future in self._as_completed(enumerate(requests)):
+            yield request, future
+
+    def gather(self, requests):
+        """
+        Make a request for each of the `(method, params)` pairs in
+        ``requests`` using the pool, returning the results in the same order
+        as ``requests``.  The first error encountered, if any, is raised once
+        all of the requests have completed.
+        """
+        futures = {}
+        for index, _, future in self._as_completed(enumerate(requests)):
+            futures[index] = future
+        return [futures[index].get() for index in range(len(futures))]
 
-        return response['result']
+    def _as_completed(self, indexed_requests):
+        completed = Queue()
+        in_flight = 0
+
+        for index, (method, params) in indexed_requests:
+            while in_flight >= self.pool_size:
+                yield completed.get()
+                in_flight -= 1
+            future = self.request_future(method, params)
+            future.rawlink(functools.partial(
+                put_completed,
+                completed=completed,
+                index=index,
+                request=(method, params),
+            ))
+            in_flight += 1
+
+        while in_flight:
+            yield completed.get()
+            in_flight -= 1
 
     def receive_async(self, request_id, *args, **kwargs):
         raise NotImplementedError("Callback pattern not implemented")
+
+
+def put_completed(future, completed, index, request):
+    completed.put((index, request, future))
+
+
+def decode_response(response_raw):
+    if is_string(response_raw):
+        return json.loads(force_text(response_raw))
+    elif is_dict(response_raw):
+        return response_raw
+    else:
+        raise TypeError("Unsupported response type: {0}".format(type(response_raw)))
+
+
+def get_response_result(response):
+    if "error" in response:
+        raise ValueError(response["error"])
+
+    return response['result']
+
+
+class RequestCaptured(Exception):
+    """
+    Raised by the `ReplayRequestManager` to interrupt a call at the first
+    request it does not have a response for.
+    """
+    def __init__(self, method, params):
+        self.method = method
+        self.params = params
+        super(RequestCaptured, self).__init__(method, params)
+
+
+class ReplayRequestManager(object):
+    """
+    Serves a call from a sequence of responses which were fetched ahead of
+    time.  This allows the normal module APIs, along with their input and
+    output formatters, to be used for requests which are actually sent some
+    other way.
+
+    Once the prefetched ``responses`` are exhausted, requests are passed on to
+    the ``fallback`` manager or, if there is none, interrupted by raising
+    `RequestCaptured`.
+    """
+    def __init__(self, responses=None, fallback=None):
+        self.responses = list(responses or [])
+        self.fallback = fallback
+        self.requests = []
+
+    def request_blocking(self, method, params):
+        index = len(self.requests)
+        self.requests.append((method, params))
+
+        if index < len(self.responses):
+            expected_method, response = self.responses[index]
+            if expected_method != method:
+                raise ValueError(
+                    "Replayed request for '{0}' does not match the recorded "
+                    "request for '{1}'".format(method, expected_method)
+                )
+            return get_response_result(response)
+        elif self.fallback is not None:
+            return self.fallback.request_blocking(method, params)
+        else:
+            raise RequestCaptured(method, params)
@@ -10,7 +10,12 @@ from web3.utils.six import (
     urlunparse,
 )
 from web3.utils.compat import (
+    get_pool_stats,
     make_post_request,
+    make_streaming_post_request,
+)
+from web3.utils.streaming import (
+    JSONMessageFramer,
 )
 from web3.utils.http import construct_user_agent
 
@@ -22,10 +27,27 @@ class HTTPProvider(JSONBaseProvider):
     endpoint_uri = None
     _request_args = None
     _request_kwargs = None
+    read_size = 65536
 
-    def __init__(self, endpoint_uri, request_kwargs=None):
+    def __init__(self,
+                 endpoint_uri,
+                 request_kwargs=None,
+                 stream_responses=False,
+                 pool_connections=10,
+                 pool_maxsize=10,
+                 pool_block=False,
+                 max_retries=0,
+                 session_strategy='shared'):
         self.endpoint_uri = endpoint_uri
         self._request_kwargs = request_kwargs or {}
+        self.stream_responses = stream_responses
+        self.session_options = {
+            'pool_connections': pool_connections,
+            'pool_maxsize': pool_maxsize,
+            'pool_block': pool_block,
+            'max_retries': max_retries,
+            'session_strategy': session_strategy,
+        }
         super(HTTPProvider, self).__init__()
 
     def __str__(self):
@@ -44,15 +66,47 @@ class HTTPProvider(JSONBaseProvider):
             'User-Agent': construct_user_agent(str(type(self))),
         }
 
-    def make_request(self, method, params):
-        request_data = self.encode_rpc_request(method, params)
+    def get_pool_stats(self):
+        """
+        Returns statistics about the connection pools used for this
+        provider's endpoint.
+        """
+        return get_pool_stats(self.endpoint_uri, self.session_options)
+
+    def make_raw_request(self, request_data):
+        if self.stream_responses:
+            return self._make_streaming_request(request_data)
+
         response = make_post_request(
             self.endpoint_uri,
             request_data,
+            session_options=self.session_options,
             **self.get_request_kwargs()
         )
         return response
 
+    def _make_streaming_request(self, request_data):
+        framer = JSONMessageFramer()
+        chunks = make_streaming_post_request(
+            self.endpoint_uri,
+            request_data,
+            self.read_size,
+            session_options=self.session_options,
+            **self.get_request_kwargs()
+        )
+        try:
+            for chunk in chunks:
+                messages = framer.feed(chunk)
+                if messages:
+                    return messages[0]
+        finally:
+            chunks.close()
+
+        raise IOError(
+            "The response from {0} ended before a complete JSON-RPC response "
+            "was received".format(self.endpoint_uri)
+        )
+
 
 class RPCProvider(HTTPProvider):
     """
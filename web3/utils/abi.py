@@ -1,12 +1,25 @@
+import binascii
 import itertools
 import re
+from io import (
+    BytesIO,
+)
 
 from eth_utils import (
-    coerce_args_to_bytes,
     coerce_args_to_text,
-    coerce_return_to_text,
     to_tuple,
     add_0x_prefix,
+    decode_hex,
+    force_bytes,
+    force_obj_to_bytes,
+    force_obj_to_text,
+    force_text,
+    is_dict,
+    is_text,
+    remove_0x_prefix,
+    to_normalized_address,
+    encode_hex,
+    function_abi_to_4byte_selector,
     is_list_like,
     is_string,
     is_integer,
@@ -15,8 +28,18 @@ from eth_utils import (
 )
 
 from eth_abi.abi import (
+    get_multi_decoder,
+    get_single_encoder,
+    is_hex_encoded_value,
     process_type,
 )
+from eth_abi.exceptions import (
+    EncodingError,
+)
+
+from web3.utils.exception import (
+    raise_from,
+)
 
 
 def filter_by_type(_type, contract_abi):
@@ -80,54 +103,116 @@ def filter_by_argument_name(argument_names, contract_abi):
     ]
 
 
-def is_encodable(_type, value):
-    try:
-        base, sub, arrlist = _type
-    except ValueError:
-        base, sub, arrlist = process_type(_type)
+HEX_ADDRESS_REGEX = re.compile('^0x[0-9a-fA-F]{40}$')
+
+
+def is_encodable_address(value):
+    if is_text(value) and len(value) == 42 and HEX_ADDRESS_REGEX.match(value):
+        return True
+    return is_address(value)
+
+
+def compile_abi_type_validator(processed_type):
+    """
+    Returns a function which returns whether a value can be encoded as
+    ``processed_type``, with the bounds and lengths for the type computed up
+    front.
+    """
+    base, sub, arrlist = processed_type
 
     if arrlist:
-        if not is_list_like(value):
-            return False
-        if arrlist[-1] and len(value) != arrlist[-1][0]:
-            return False
-        sub_type = (base, sub, arrlist[:-1])
-        return all(is_encodable(sub_type, sub_value) for sub_value in value)
+        item_validator = compile_abi_type_validator((base, sub, arrlist[:-1]))
+        array_size = arrlist[-1][0] if arrlist[-1] else None
+
+        def is_encodable_array(value):
+            if not is_list_like(value):
+                return False
+            if array_size is not None and len(value) != array_size:
+                return False
+            return all(item_validator(item) for item in value)
+        return is_encodable_array
     elif base == 'bool':
-        return is_boolean(value)
+        return is_boolean
     elif base == 'uint':
-        if not is_integer(value):
-            return False
-        exp = int(sub)
-        if value < 0 or value >= 2**exp:
-            return False
-        return True
-    elif base == 'int':
-        if not is_integer(value):
-            return False
-        exp = int(sub)
-        if value <= -1 * 2**(exp - 1) or value >= 2**(exp - 1):
-            return False
-        return True
-    elif base == 'string':
-        if not is_string(value):
-            return False
-        return True
-    elif base == 'bytes':
-        if not is_string(value):
-            return False
+        upper_bound = 2 ** int(sub)
 
-        if not sub:
-            return True
+        def is_encodable_uint(value):
+            return is_integer(value) and 0 <= value < upper_bound
+        return is_encodable_uint
+    elif base == 'int':
+        bound = 2 ** (int(sub) - 1)
 
+        def is_encodable_int(value):
+            return is_integer(value) and -bound < value < bound
+        return is_encodable_int
+    elif base == 'string' or (base == 'bytes' and not sub):
+        return is_string
+    elif base == 'bytes':
         max_length = int(sub)
-        return len(value) <= max_length
+
+        def is_encodable_bytes(value):
+            return is_string(value) and len(value) <= max_length
+        return is_encodable_bytes
     elif base == 'address':
-        if not is_address(value):
+        return is_encodable_address
+    else:
+        def is_encodable_unsupported(value):
+            raise ValueError("Unsupported type")
+        return is_encodable_unsupported
+
+
+#
+# ABI types are written the same way throughout a contract ABI so there are
+# only ever a small number of them.
+#
+_abi_type_validators = {}
+
+
+def get_abi_type_validator(_type):
+    """
+    Returns the validator for ``_type``, which is either an ABI type string
+    or a type which has already been processed with `process_type`.
+    """
+    if is_string(_type):
+        cache_key = _type
+    else:
+        base, sub, arrlist = _type
+        cache_key = (base, sub, tuple(tuple(dimension) for dimension in arrlist))
+
+    try:
+        return _abi_type_validators[cache_key]
+    except KeyError:
+        pass
+
+    if is_string(_type):
+        processed_type = process_abi_type(_type)
+    else:
+        processed_type = _type
+    validator = compile_abi_type_validator(processed_type)
+    _abi_type_validators[cache_key] = validator
+    return validator
+
+
+def is_encodable(_type, value):
+    return get_abi_type_validator(_type)(value)
+
+
+def get_arguments_validator(types):
+    """
+    Returns a function which returns whether a list of arguments, in the
+    order of ``types``, can be encoded.
+    """
+    validators = tuple(get_abi_type_validator(_type) for _type in types)
+    num_arguments = len(validators)
+
+    def are_encodable(arguments):
+        if len(arguments) != num_arguments:
             return False
+        for validator, argument in zip(validators, arguments):
+            if not validator(argument):
+                return False
         return True
-    else:
-        raise ValueError("Unsupported type")
+    return are_encodable
 
 
 def filter_by_encodability(args, kwargs, contract_abi):
@@ -139,22 +224,19 @@ def filter_by_encodability(args, kwargs, contract_abi):
     ]
 
 
-@coerce_args_to_bytes
 def check_if_arguments_can_be_encoded(function_abi, args, kwargs):
-    try:
-        arguments = merge_args_and_kwargs(function_abi, args, kwargs)
-    except TypeError:
-        return False
+    if kwargs:
+        try:
+            arguments = merge_args_and_kwargs(function_abi, args, kwargs)
+        except TypeError:
+            return False
+    else:
+        arguments = args
 
     if len(function_abi['inputs']) != len(arguments):
         return False
 
-    types = get_abi_input_types(function_abi)
-
-    return all(
-        is_encodable(_type, arg)
-        for _type, arg in zip(types, arguments)
-    )
+    return get_arguments_validator(get_abi_input_types(function_abi))(arguments)
 
 
 @coerce_args_to_text
@@ -250,8 +332,11 @@ TYPE_REGEX = (
 )
 
 
+TYPE_PATTERN = re.compile(TYPE_REGEX)
+
+
 def is_recognized_type(abi_type):
-    return bool(re.match(TYPE_REGEX, abi_type))
+    return get_abi_type_descriptor(abi_type).is_recognized
 
 
 NAME_REGEX = (
@@ -269,19 +354,108 @@ ENUM_REGEX = (
 ).format(lib_name=NAME_REGEX, enum_name=NAME_REGEX)
 
 
+ENUM_PATTERN = re.compile(ENUM_REGEX)
+
+
 def is_probably_enum(abi_type):
-    return bool(re.match(ENUM_REGEX, abi_type))
+    return get_abi_type_descriptor(abi_type).is_probably_enum
+
+
+class ABITypeDescriptor(object):
+    """
+    An ABI type string parsed with `process_type`, along with the result of
+    matching it against the type and enum regexes.
+
+    Descriptors are shared, see `get_abi_type_descriptor`, so the processed
+    type must not be modified.
+    """
+    __slots__ = (
+        'abi_type',
+        'is_recognized',
+        'is_probably_enum',
+        'normalized_type',
+        'is_dynamic',
+        '_processed_type',
+        '_return_normalizer',
+    )
+
+    def __init__(self, abi_type):
+        self.abi_type = abi_type
+        self.is_recognized = TYPE_PATTERN.match(abi_type) is not None
+        self.is_probably_enum = ENUM_PATTERN.match(abi_type) is not None
+
+        if not self.is_recognized and self.is_probably_enum:
+            self.normalized_type = 'uint8'
+        else:
+            self.normalized_type = abi_type
+
+        try:
+            self._processed_type = process_type(abi_type)
+        except ValueError:
+            self._processed_type = None
+            self.is_dynamic = None
+        else:
+            base, sub, arrlist = self._processed_type
+            self.is_dynamic = bool(arrlist) or base == 'string' or (base == 'bytes' and not sub)
+        self._return_normalizer = None
+
+    @property
+    def processed_type(self):
+        """
+        The `(base, sub, arrlist)` tuple for the type.  Raises the same
+        `ValueError` as `process_type` for invalid types.
+        """
+        if self._processed_type is None:
+            return process_type(self.abi_type)
+        return self._processed_type
+
+    @property
+    def return_normalizer(self):
+        if self._return_normalizer is None:
+            self._return_normalizer = compile_return_normalizer(self.processed_type)
+        return self._return_normalizer
+
+
+#
+# Contract ABIs only use a small number of distinct type strings, but the
+# registry is bounded in case types come from somewhere else.
+#
+MAX_ABI_TYPE_DESCRIPTORS = 4096
+
+_abi_type_descriptors = {}
+
+
+def get_abi_type_descriptor(abi_type):
+    """
+    Returns the memoized `ABITypeDescriptor` for the ABI type string
+    ``abi_type``.
+    """
+    try:
+        return _abi_type_descriptors[abi_type]
+    except KeyError:
+        pass
+
+    descriptor = ABITypeDescriptor(force_text(abi_type))
+    if len(_abi_type_descriptors) < MAX_ABI_TYPE_DESCRIPTORS:
+        _abi_type_descriptors[abi_type] = descriptor
+    return descriptor
+
+
+def process_abi_type(abi_type):
+    """
+    Memoized `process_type`.  The result is shared and must not be modified.
+    """
+    return get_abi_type_descriptor(abi_type).processed_type
 
 
 @to_tuple
 def normalize_event_input_types(abi_args):
     for arg in abi_args:
-        if is_recognized_type(arg['type']):
+        descriptor = get_abi_type_descriptor(arg['type'])
+        if descriptor.is_recognized or not descriptor.is_probably_enum:
             yield arg
-        elif is_probably_enum(arg['type']):
-            yield {k: 'uint8' if k == 'type' else v for k, v in arg.items()}
         else:
-            yield arg
+            yield {k: descriptor.normalized_type if k == 'type' else v for k, v in arg.items()}
 
 
 def abi_to_signature(abi):
@@ -294,17 +468,455 @@ def abi_to_signature(abi):
     return function_signature
 
 
-@coerce_return_to_text
 def normalize_return_type(data_type, data_value):
-    try:
-        base, sub, arrlist = data_type
-    except ValueError:
-        base, sub, arrlist = process_type(data_type)
+    if is_string(data_type):
+        return get_abi_type_descriptor(data_type).return_normalizer(data_value)
+    else:
+        return compile_return_normalizer(data_type)(data_value)
+
+
+NUMERIC_BASE_TYPES = frozenset(('int', 'uint', 'bool', 'real', 'ureal'))
+
+
+def noop(value):
+    return value
+
+
+def compile_return_normalizer(processed_type):
+    """
+    Returns a function equivalent to passing a decoded value of
+    ``processed_type`` through `normalize_return_type` and then coercing it
+    to text.
+    """
+    base, sub, arrlist = processed_type
+    if arrlist:
+        normalize_item = compile_return_normalizer((base, sub, arrlist[:-1]))
+        return lambda value: [normalize_item(item) for item in value]
+    elif base == 'address':
+        return lambda value: force_obj_to_text(add_0x_prefix(value))
+    elif base in NUMERIC_BASE_TYPES:
+        return noop
+    else:
+        return force_obj_to_text
+
+
+def to_bytes(value):
+    if is_text(value):
+        return decode_hex(value)
+    return force_bytes(value)
+
+
+def return_data_to_bytes(return_data):
+    """
+    Coerces ``return_data`` to bytes the same way as `decode_abi`, which also
+    accepts hex encoded data.
+    """
+    if is_hex_encoded_value(return_data):
+        return decode_hex(return_data)
+    return force_bytes(return_data)
+
+
+def compile_output_decoder(output_types):
+    """
+    Returns a function equivalent to decoding return data with `decode_abi`
+    and passing each value through `normalize_return_type`.
+    """
+    processed_types = tuple(process_abi_type(output_type) for output_type in output_types)
+    decoder = get_multi_decoder(processed_types)
+    normalizers = tuple(compile_return_normalizer(output_type) for output_type in processed_types)
+
+    def decode_output(return_data):
+        return [
+            normalize(value)
+            for normalize, value
+            in zip(normalizers, decoder(BytesIO(return_data_to_bytes(return_data))))
+        ]
+    return decode_output
+
+
+def get_encodability_key(value):
+    """
+    Returns a key which is the same for any two values which `is_encodable`
+    accepts for exactly the same ABI types, or `None` if no such key can be
+    computed for ``value``.
+    """
+    if is_boolean(value):
+        return (bool, value)
+    elif is_integer(value):
+        return (int, value.bit_length(), value < 0)
+    elif is_string(value):
+        return (type(value), len(value), is_address(value))
+    elif is_list_like(value):
+        item_keys = tuple(get_encodability_key(item) for item in value)
+        if None in item_keys:
+            return None
+        return (list, item_keys)
+    else:
+        return None
+
+
+WORD_MODULUS = 2 ** 256
+ADDRESS_WORD_PADDING = '0' * 24
+TRUE_WORD = '0' * 63 + '1'
+FALSE_WORD = '0' * 64
+EMPTY_WORD = '0' * 64
+
+
+def to_hex_text(value):
+    return binascii.hexlify(value).decode('ascii')
 
+
+def encode_int_word(value):
+    return '{0:064x}'.format(value % WORD_MODULUS)
+
+
+def encode_address_word(value):
+    if is_text(value) and len(value) == 42:
+        # Already validated by `is_address` so this is a 0x prefixed hex
+        # address.
+        return ADDRESS_WORD_PADDING + value[2:].lower()
+    return ADDRESS_WORD_PADDING + remove_0x_prefix(to_normalized_address(value))
+
+
+def encode_bool_word(value):
+    return TRUE_WORD if value else FALSE_WORD
+
+
+def encode_fixed_bytes_word(value):
+    return to_hex_text(force_bytes(value)).ljust(64, '0')
+
+
+def encode_dynamic_bytes(value):
+    data = to_hex_text(force_bytes(value))
+    if not data:
+        return EMPTY_WORD + EMPTY_WORD
+    return '{0:064x}'.format(len(data) // 2) + data.ljust(-(-len(data) // 64) * 64, '0')
+
+
+def compile_word_encoder(processed_type):
+    """
+    Returns a function which encodes a value of ``processed_type`` as the 64
+    hex characters of its ABI encoding, or `None` if the type is not a
+    single word value type.
+    """
+    base, sub, arrlist = processed_type
     if arrlist:
-        sub_type = (base, sub, arrlist[:-1])
-        return [normalize_return_type(sub_type, sub_value) for sub_value in data_value]
+        return None
+    elif base == 'uint' or base == 'int':
+        return encode_int_word
     elif base == 'address':
-        return add_0x_prefix(data_value)
+        return encode_address_word
+    elif base == 'bool':
+        return encode_bool_word
+    elif base == 'bytes' and sub:
+        return encode_fixed_bytes_word
     else:
-        return data_value
+        return None
+
+
+def compile_argument_encoder(processed_type):
+    """
+    Returns an `(is_dynamic, encode)` tuple for ``processed_type`` where
+    ``encode`` returns the hex encoding of an already validated value, which
+    goes in the tail of the call data if ``is_dynamic`` is set and in the
+    head otherwise.
+
+    Like `eth_abi`, only dynamic arrays, `bytes` and `string` are treated as
+    dynamic.
+    """
+    base, sub, arrlist = processed_type
+
+    word_encoder = compile_word_encoder(processed_type)
+    if word_encoder is not None:
+        return False, word_encoder
+    elif not arrlist and (base == 'string' or base == 'bytes'):
+        return True, encode_dynamic_bytes
+
+    encoder = get_single_encoder(base, sub, arrlist)
+
+    def encode_argument(value):
+        try:
+            return to_hex_text(encoder(force_obj_to_bytes(value)))
+        except EncodingError as e:
+            raise TypeError(
+                "One or more arguments could not be encoded to the necessary "
+                "ABI type: {0}".format(str(e))
+            )
+    return bool(arrlist and not arrlist[-1]), encode_argument
+
+
+class FunctionEncoder(object):
+    """
+    Encodes the call data for a single function, or the arguments of a
+    constructor when ``selector`` is empty.
+
+    The input types are processed, and an encoder for each of them built,
+    once when the encoder is created.  The arguments are encoded straight to
+    hex, without going through `eth_abi` for anything other than arrays.
+    """
+    def __init__(self, function_abi, selector=None):
+        self.function_abi = function_abi
+        self.input_types = get_abi_input_types(function_abi)
+        self.processed_types = tuple(
+            process_abi_type(input_type)
+            for input_type
+            in self.input_types
+        )
+
+        if selector is None:
+            selector = encode_hex(function_abi_to_4byte_selector(function_abi))
+        self.prefix = remove_0x_prefix(force_text(selector))
+
+        self.argument_encoders = tuple(
+            compile_argument_encoder(processed_type)
+            for processed_type
+            in self.processed_types
+        )
+        self.has_dynamic_arguments = any(
+            is_dynamic
+            for is_dynamic, _
+            in self.argument_encoders
+        )
+        self.encoders = tuple(encode for _, encode in self.argument_encoders)
+        self.are_encodable = get_arguments_validator(self.processed_types)
+
+    def validate(self, arguments):
+        """
+        Raises a `TypeError` unless ``arguments`` can be encoded.
+        """
+        if not self.are_encodable(arguments):
+            raise TypeError(
+                "One or more arguments could not be encoded to the necessary "
+                "ABI type.  Expected types are: {0}".format(
+                    ', '.join(self.input_types),
+                )
+            )
+
+    def encode_arguments(self, arguments):
+        """
+        Returns the 0x prefixed hex encoded call data for the list of
+        ``arguments``, which must be in the order of the function inputs.
+        """
+        return '0x' + self._encode_to_hex(arguments)
+
+    def encode(self, args=None, kwargs=None):
+        """
+        Returns the 0x prefixed hex encoded call data for ``args`` and
+        ``kwargs``.
+        """
+        if args is None:
+            args = tuple()
+        if kwargs is None:
+            kwargs = {}
+        return self.encode_arguments(merge_args_and_kwargs(self.function_abi, args, kwargs))
+
+    def encode_rows(self, rows):
+        """
+        Returns a list with the 0x prefixed hex encoded call data for each
+        row of ``rows``.  A row is either a list of positional arguments or
+        a dictionary of keyword arguments.
+        """
+        return ['0x' + hex_data for hex_data in self._encode_rows_to_hex(rows)]
+
+    def encode_rows_to_buffer(self, rows):
+        """
+        Returns a `(buffer, offsets)` tuple where ``buffer`` is the call
+        data for all of ``rows`` concatenated into a single byte string and
+        the call data for row ``i`` is ``buffer[offsets[i]:offsets[i + 1]]``.
+        """
+        hex_rows = self._encode_rows_to_hex(rows)
+
+        offsets = [0]
+        for hex_data in hex_rows:
+            offsets.append(offsets[-1] + len(hex_data) // 2)
+
+        return binascii.unhexlify(''.join(hex_rows)), offsets
+
+    def _encode_rows_to_hex(self, rows):
+        hex_rows = []
+        for row_index, row in enumerate(rows):
+            if is_dict(row):
+                row = merge_args_and_kwargs(self.function_abi, (), row)
+            try:
+                hex_rows.append(self._encode_to_hex(row))
+            except TypeError as e:
+                raise_from(TypeError("Could not encode row {0}: {1}".format(row_index, e)), e)
+        return hex_rows
+
+    def _encode_to_hex(self, arguments):
+        self.validate(arguments)
+
+        if not self.has_dynamic_arguments:
+            return self.prefix + ''.join([
+                encode(argument)
+                for encode, argument
+                in zip(self.encoders, arguments)
+            ])
+
+        head_chunks = []
+        tail_chunks = []
+        for (is_dynamic, encode), argument in zip(self.argument_encoders, arguments):
+            if is_dynamic:
+                head_chunks.append(None)
+                tail_chunks.append(encode(argument))
+            else:
+                head_chunks.append(encode(argument))
+
+        # The heads of dynamic arguments are the byte offsets of their tails.
+        tail_offset = sum(
+            64 if head_chunk is None else len(head_chunk)
+            for head_chunk
+            in head_chunks
+        )
+        tail_chunks_iter = iter(tail_chunks)
+        for index, head_chunk in enumerate(head_chunks):
+            if head_chunk is None:
+                head_chunks[index] = '{0:064x}'.format(tail_offset // 2)
+                tail_offset += len(next(tail_chunks_iter))
+
+        return self.prefix + ''.join(head_chunks) + ''.join(tail_chunks)
+
+
+class FunctionABIIndex(object):
+    """
+    Index of the functions in a contract ABI by name and number of arguments,
+    along with their selectors and output types, so that the function for a
+    call can be found without scanning the ABI.
+
+    When several overloads of a function take the same number of arguments
+    the one which can encode the arguments is chosen.  The result is
+    memoized by the properties of the arguments which decide whether they
+    are encodable, such as the bit length of integers.
+
+    The ABI must not be modified after the index has been built.
+    """
+    max_resolutions = 1024
+
+    def __init__(self, abi):
+        self.abi = abi
+        self.functions = filter_by_type('function', abi)
+
+        self.by_name = {}
+        self.by_name_and_arity = {}
+        for function_abi in self.functions:
+            self.by_name.setdefault(function_abi['name'], []).append(function_abi)
+            self.by_name_and_arity.setdefault(
+                (function_abi['name'], len(function_abi['inputs'])),
+                [],
+            ).append(function_abi)
+
+        # keyed by `id` since ABI dictionaries are not hashable.  The index
+        # holds a reference to each of them so the ids cannot be reused.
+        self.selectors = {}
+        self.output_types = {}
+        self.output_decoders = {}
+        self.encoders = {}
+        self.resolutions = {}
+
+    def find_function(self, fn_name=None, args=None, kwargs=None):
+        """
+        Returns the ABI of the function named ``fn_name`` which accepts
+        ``args`` and ``kwargs``, raising a `ValueError` if there is not
+        exactly one.
+        """
+        if fn_name:
+            candidates = self.by_name.get(fn_name, [])
+            if len(candidates) == 1:
+                return candidates[0]
+            elif not candidates:
+                raise ValueError("No matching functions found")
+        else:
+            candidates = self.functions
+
+        if args is None and kwargs is None:
+            if not candidates:
+                raise ValueError("No matching functions found")
+            else:
+                raise ValueError("Multiple functions found")
+
+        if args is None:
+            args = tuple()
+        if kwargs is None:
+            kwargs = {}
+        num_arguments = len(args) + len(kwargs)
+
+        if fn_name:
+            candidates = self.by_name_and_arity.get((fn_name, num_arguments), [])
+        else:
+            candidates = filter_by_argument_count(num_arguments, candidates)
+
+        if len(candidates) == 1:
+            return candidates[0]
+        elif not candidates:
+            raise ValueError("No matching functions found")
+
+        resolution_key = self._get_resolution_key(fn_name, args, kwargs)
+        if resolution_key is not None and resolution_key in self.resolutions:
+            return self.resolutions[resolution_key]
+
+        candidates = filter_by_encodability(args, kwargs, candidates)
+        if len(candidates) == 1:
+            if resolution_key is not None and len(self.resolutions) < self.max_resolutions:
+                self.resolutions[resolution_key] = candidates[0]
+            return candidates[0]
+        elif not candidates:
+            raise ValueError("No matching functions found")
+        else:
+            raise ValueError("Multiple functions found")
+
+    def get_selector(self, function_abi):
+        try:
+            return self.selectors[id(function_abi)]
+        except KeyError:
+            selector = encode_hex(function_abi_to_4byte_selector(function_abi))
+            if self._is_indexed(function_abi):
+                self.selectors[id(function_abi)] = selector
+            return selector
+
+    def get_output_types(self, function_abi):
+        try:
+            return self.output_types[id(function_abi)]
+        except KeyError:
+            output_types = get_abi_output_types(function_abi)
+            if self._is_indexed(function_abi):
+                self.output_types[id(function_abi)] = output_types
+            return output_types
+
+    def get_output_decoder(self, function_abi):
+        """
+        Returns a function which decodes the return data of a call to
+        ``function_abi`` into a list of normalized values.
+        """
+        try:
+            return self.output_decoders[id(function_abi)]
+        except KeyError:
+            output_decoder = compile_output_decoder(self.get_output_types(function_abi))
+            if self._is_indexed(function_abi):
+                self.output_decoders[id(function_abi)] = output_decoder
+            return output_decoder
+
+    def get_encoder(self, function_abi):
+        """
+        Returns the `FunctionEncoder` for the call data of ``function_abi``.
+        """
+        try:
+            return self.encoders[id(function_abi)]
+        except KeyError:
+            encoder = FunctionEncoder(function_abi, self.get_selector(function_abi))
+            if self._is_indexed(function_abi):
+                self.encoders[id(function_abi)] = encoder
+            return encoder
+
+    def _is_indexed(self, function_abi):
+        return any(indexed_abi is function_abi for indexed_abi in self.functions)
+
+    def _get_resolution_key(self, fn_name, args, kwargs):
+        arg_keys = tuple(get_encodability_key(arg) for arg in args)
+        kwarg_keys = tuple(sorted(
+            (key, get_encodability_key(value))
+            for key, value
+            in kwargs.items()
+        ))
+        if None in arg_keys or any(value_key is None for _, value_key in kwarg_keys):
+            return None
+        return (fn_name, arg_keys, kwarg_keys)
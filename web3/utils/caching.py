@@ -8,7 +8,6 @@ from eth_utils import (
     is_number,
     is_text,
     is_bytes,
-    force_bytes,
 )
 
 from .six import (
@@ -16,30 +15,110 @@ from .six import (
 )
 
 
+LIST_START = b'l['
+LIST_END = b']'
+DICT_START = b'd['
+DICT_END = b']'
+NULL = b'N'
+TRUE = b'T'
+FALSE = b'F'
+
+
+def _encode_bytes(value):
+    return b'b' + str(len(value)).encode('ascii') + b':' + value
+
+
+def _encode_text(value):
+    encoded = value.encode('utf8')
+    return b't' + str(len(encoded)).encode('ascii') + b':' + encoded
+
+
+def _encode_number(value):
+    return b'n' + repr(value).encode('ascii') + b';'
+
+
+def _encode_boolean(value):
+    return TRUE if value else FALSE
+
+
+def _encode_null(value):
+    return NULL
+
+
+SCALAR_ENCODERS = {
+    bytes: _encode_bytes,
+    type(u''): _encode_text,
+    int: _encode_number,
+    float: _encode_number,
+    bool: _encode_boolean,
+    type(None): _encode_null,
+}
+
+
+def _iter_dict_items(value):
+    for key in sorted(value.keys()):
+        yield key
+        yield value[key]
+
+
 def generate_cache_key(value):
     """
     Generates a cache key for the *args and **kwargs
+
+    The value is serialized in a single pass into a canonical form in which
+    every item is tagged with its type and length, so that values such as
+    `1` and `'1'`, or `['ab']` and `['a', 'b']`, cannot produce the same key,
+    and the result is hashed once.
     """
-    if is_bytes(value):
-        return hashlib.md5(value).hexdigest()
-    elif is_text(value):
-        return generate_cache_key(force_bytes(value))
-    elif is_boolean(value) or is_null(value) or is_number(value):
-        return generate_cache_key(repr(value))
-    elif is_dict(value):
-        return generate_cache_key((
-            (key, value[key])
-            for key
-            in sorted(value.keys())
-        ))
-    elif is_list_like(value) or isinstance(value, Generator):
-        return generate_cache_key("".join((
-            generate_cache_key(item)
-            for item
-            in value
-        )))
-    else:
-        raise TypeError("Cannot generate cache key for value {0} of type {1}".format(
-            value,
-            type(value),
-        ))
+    parts = []
+    stack = [(iter((value,)), None)]
+
+    while stack:
+        items, end_marker = stack[-1]
+        for item in items:
+            item_type = type(item)
+            try:
+                encoder = SCALAR_ENCODERS[item_type]
+            except KeyError:
+                pass
+            else:
+                parts.append(encoder(item))
+                continue
+
+            if item_type is list or item_type is tuple:
+                parts.append(LIST_START)
+                stack.append((iter(item), LIST_END))
+                break
+            elif item_type is dict:
+                parts.append(DICT_START)
+                stack.append((_iter_dict_items(item), DICT_END))
+                break
+            elif is_bytes(item):
+                parts.append(_encode_bytes(bytes(item)))
+            elif is_text(item):
+                parts.append(_encode_text(item))
+            elif is_boolean(item):
+                parts.append(_encode_boolean(item))
+            elif is_null(item):
+                parts.append(NULL)
+            elif is_number(item):
+                parts.append(_encode_number(item))
+            elif is_dict(item):
+                parts.append(DICT_START)
+                stack.append((_iter_dict_items(item), DICT_END))
+                break
+            elif is_list_like(item) or isinstance(item, Generator):
+                parts.append(LIST_START)
+                stack.append((iter(item), LIST_END))
+                break
+            else:
+                raise TypeError("Cannot generate cache key for value {0} of type {1}".format(
+                    item,
+                    type(item),
+                ))
+        else:
+            stack.pop()
+            if end_marker is not None:
+                parts.append(end_marker)
+
+    return hashlib.md5(b''.join(parts)).hexdigest()
@@ -23,9 +23,15 @@ if THREADING_BACKEND == 'stdlib':
         GreenletThread,
         spawn,
         subprocess,
+        Event,
+        AsyncResult,
+        Pool,
+        Queue,
     )
     from .compat_requests import (
+        get_pool_stats,
         make_post_request,
+        make_streaming_post_request,
     )
 elif THREADING_BACKEND == 'gevent':
     from .compat_gevent import (  # noqa: F401
@@ -37,7 +43,13 @@ elif THREADING_BACKEND == 'gevent':
         GreenletThread,
         spawn,
         subprocess,
+        Event,
+        AsyncResult,
+        Pool,
+        Queue,
+        get_pool_stats,
         make_post_request,
+        make_streaming_post_request,
     )
 else:
     raise ValueError("Unsupported threading backend.  Must be one of 'gevent' or 'stdlib'")
@@ -9,6 +9,16 @@ from gevent import (  # noqa: F401
     socket,
     threading,
 )
+from gevent.event import (  # noqa: F401
+    AsyncResult,
+    Event,
+)
+from gevent.pool import (  # noqa: F401
+    Pool,
+)
+from gevent.queue import (  # noqa: F401
+    Queue,
+)
 
 import pylru
 
@@ -20,6 +30,18 @@ from web3.utils.six import urlparse
 _client_cache = pylru.lrucache(8)
 
 
+class PooledClient(object):
+    """
+    An `HTTPClient` along with the size of its connection pool and the number
+    of requests web3 has made with it, which `HTTPClient` does not expose.
+    """
+    num_requests = 0
+
+    def __init__(self, client, concurrency):
+        self.client = client
+        self.concurrency = concurrency
+
+
 sleep = gevent.sleep
 spawn = gevent.spawn
 GreenletThread = gevent.Greenlet
@@ -49,11 +71,14 @@ def _get_client(host, port, **kwargs):
         ))
     )
     if cache_key not in _client_cache:
-        _client_cache[cache_key] = HTTPClient(host, port, **kwargs)
+        _client_cache[cache_key] = PooledClient(
+            HTTPClient(host, port, **kwargs),
+            kwargs['concurrency'],
+        )
     return _client_cache[cache_key]
 
 
-def make_post_request(endpoint_uri, data, **kwargs):
+def _get_client_for_endpoint(endpoint_uri, **kwargs):
     url_parts = urlparse(endpoint_uri)
 
     host, _, port = url_parts.netloc.partition(':')
@@ -71,8 +96,67 @@ def make_post_request(endpoint_uri, data, **kwargs):
     kwargs.setdefault('network_timeout', 10)
     kwargs.setdefault('concurrency', 10)
 
-    client = _get_client(host, port, **kwargs)
-    response = client.post(url_parts.path, body=data)
+    return _get_client(host, port, **kwargs), url_parts.path
+
+
+def _apply_session_options(kwargs, session_options):
+    # Each `HTTPClient` holds a single pool of connections to its host, so
+    # only the pool size applies.
+    if session_options and 'pool_maxsize' in session_options:
+        kwargs.setdefault('concurrency', session_options['pool_maxsize'])
+    return kwargs
+
+
+def _get_idle_connections(client):
+    # `HTTPClient` has no public API for its pool, so this is best effort and
+    # gives `None` if its internals change.
+    try:
+        return client._connection_pool._socket_queue.qsize()
+    except AttributeError:
+        return None
+
+
+def get_pool_stats(endpoint_uri, session_options=None):
+    pooled_client, _ = _get_client_for_endpoint(
+        endpoint_uri,
+        **_apply_session_options({}, session_options)
+    )
+    return {
+        'session_strategy': 'shared',
+        'pools': [{
+            'host': pooled_client.client.host,
+            'port': pooled_client.client.port,
+            'maxsize': pooled_client.concurrency,
+            'idle_connections': _get_idle_connections(pooled_client.client),
+            'num_requests': pooled_client.num_requests,
+        }],
+    }
+
+
+def make_post_request(endpoint_uri, data, session_options=None, **kwargs):
+    pooled_client, path = _get_client_for_endpoint(
+        endpoint_uri,
+        **_apply_session_options(kwargs, session_options)
+    )
+    pooled_client.num_requests += 1
+    response = pooled_client.client.post(path, body=data)
     response_body = response.read()
 
     return response_body
+
+
+def make_streaming_post_request(endpoint_uri, data, chunk_size, session_options=None, **kwargs):
+    pooled_client, path = _get_client_for_endpoint(
+        endpoint_uri,
+        **_apply_session_options(kwargs, session_options)
+    )
+    pooled_client.num_requests += 1
+    response = pooled_client.client.post(path, body=data)
+    try:
+        while True:
+            chunk = response.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        response.release()
@@ -1,24 +1,133 @@
+import threading
+
 import requests
+from requests.adapters import HTTPAdapter
 
 import pylru
 
 from web3.utils.caching import generate_cache_key
 
 
+SHARED_SESSIONS = 'shared'
+PER_THREAD_SESSIONS = 'per-thread'
+
+SESSION_STRATEGIES = (SHARED_SESSIONS, PER_THREAD_SESSIONS)
+
+DEFAULT_SESSION_OPTIONS = {
+    'pool_connections': 10,
+    'pool_maxsize': 10,
+    'pool_block': False,
+    'max_retries': 0,
+    'session_strategy': SHARED_SESSIONS,
+}
+
+
 _session_cache = pylru.lrucache(8)
+_session_cache_lock = threading.Lock()
+_thread_sessions = threading.local()
+
+
+def _get_session_options(session_options):
+    options = dict(DEFAULT_SESSION_OPTIONS)
+    options.update(session_options or {})
+    if options['session_strategy'] not in SESSION_STRATEGIES:
+        raise ValueError("Unknown session strategy '{0}'.  Must be one of {1}".format(
+            options['session_strategy'],
+            ', '.join(SESSION_STRATEGIES),
+        ))
+    return options
+
+
+def _make_session(options):
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=options['pool_connections'],
+        pool_maxsize=options['pool_maxsize'],
+        max_retries=options['max_retries'],
+        pool_block=options['pool_block'],
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
 
 
-def _get_session(*args, **kwargs):
-    cache_key = generate_cache_key((args, kwargs))
-    if cache_key not in _session_cache:
-        _session_cache[cache_key] = requests.Session()
-    return _session_cache[cache_key]
+def _get_session(endpoint_uri, session_options=None):
+    """
+    Returns the `requests.Session` to use for ``endpoint_uri``.
 
+    With the `shared` strategy a single session, whose connection pools are
+    safe to use from multiple threads, is used for each endpoint.  With the
+    `per-thread` strategy every thread gets a session of its own.
+    """
+    options = _get_session_options(session_options)
+    cache_key = generate_cache_key((endpoint_uri, options))
 
-def make_post_request(endpoint_uri, data, *args, **kwargs):
+    if options['session_strategy'] == PER_THREAD_SESSIONS:
+        sessions = getattr(_thread_sessions, 'sessions', None)
+        if sessions is None:
+            sessions = _thread_sessions.sessions = {}
+        if cache_key not in sessions:
+            sessions[cache_key] = _make_session(options)
+        return sessions[cache_key]
+
+    with _session_cache_lock:
+        if cache_key not in _session_cache:
+            _session_cache[cache_key] = _make_session(options)
+        return _session_cache[cache_key]
+
+
+def get_pool_stats(endpoint_uri, session_options=None):
+    """
+    Returns statistics about the connection pools of the session used for
+    ``endpoint_uri`` by the calling thread.
+    """
+    session = _get_session(endpoint_uri, session_options)
+    adapter = session.get_adapter(endpoint_uri)
+
+    pools = []
+    for key in adapter.poolmanager.pools.keys():
+        pool = adapter.poolmanager.pools.get(key)
+        if pool is None:
+            continue
+        pools.append({
+            'host': pool.host,
+            'port': pool.port,
+            'maxsize': pool.pool.maxsize if pool.pool is not None else 0,
+            'idle_connections': pool.pool.qsize() if pool.pool is not None else 0,
+            'num_connections': pool.num_connections,
+            'num_requests': pool.num_requests,
+        })
+    return {
+        'session_strategy': _get_session_options(session_options)['session_strategy'],
+        'pools': pools,
+    }
+
+
+def make_post_request(endpoint_uri, data, session_options=None, *args, **kwargs):
     kwargs.setdefault('timeout', 10)
-    session = _get_session(endpoint_uri)
+    session = _get_session(endpoint_uri, session_options)
     response = session.post(endpoint_uri, data=data, *args, **kwargs)
     response.raise_for_status()
 
     return response.content
+
+
+def make_streaming_post_request(endpoint_uri,
+                                data,
+                                chunk_size,
+                                session_options=None,
+                                *args,
+                                **kwargs):
+    """
+    Like `make_post_request` but yields the response body in chunks of up to
+    ``chunk_size`` bytes as they are received.
+    """
+    kwargs.setdefault('timeout', 10)
+    session = _get_session(endpoint_uri, session_options)
+    response = session.post(endpoint_uri, data=data, stream=True, *args, **kwargs)
+    try:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size):
+            yield chunk
+    finally:
+        response.close()
@@ -7,8 +7,14 @@ import subprocess  # noqa: F401
 import socket  # noqa: F401
 from wsgiref.simple_server import make_server  # noqa: F401
 
+from web3.utils.six import (
+    queue,
+)
+
 
 sleep = time.sleep
+Event = threading.Event
+Queue = queue.Queue
 
 
 class Timeout(Exception):
@@ -124,3 +130,103 @@ class GreenletThread(threading.Thread):
 
     def _run(self):
         pass
+
+
+class AsyncResult(object):
+    """
+    A limited subset of the `gevent.event.AsyncResult` API.
+    """
+    value = None
+    exception = None
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    def ready(self):
+        return self._event.is_set()
+
+    def successful(self):
+        return self.ready() and self.exception is None
+
+    def set(self, value=None):
+        self.value = value
+        self._notify()
+
+    def set_exception(self, exception):
+        self.exception = exception
+        self._notify()
+
+    def get(self, block=True, timeout=None):
+        if not self._event.wait(timeout if block else 0):
+            raise Timeout(timeout)
+        if self.exception is not None:
+            raise self.exception
+        return self.value
+
+    def rawlink(self, callback):
+        """
+        Call ``callback`` with this result once it is ready.  Callbacks run in
+        whichever thread sets the result.
+        """
+        with self._lock:
+            if not self.ready():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _notify(self):
+        with self._lock:
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
+class Pool(object):
+    """
+    A limited subset of the `gevent.pool.Pool` API backed by a fixed number
+    of worker threads.  Workers are started as they are needed, up to
+    ``size``.
+
+    `Pool.spawn` blocks while ``size`` functions are already running or
+    queued, so callers cannot get arbitrarily far ahead of the workers.
+    """
+    def __init__(self, size=10):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self._slots = threading.BoundedSemaphore(size)
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = []
+
+    def spawn(self, fn, *args, **kwargs):
+        self._slots.acquire()
+        result = AsyncResult()
+        self._tasks.put((result, fn, args, kwargs))
+        self._start_worker()
+        return result
+
+    def _start_worker(self):
+        with self._lock:
+            if len(self._workers) < self.size:
+                worker = threading.Thread(target=self._run_worker)
+                worker.daemon = True
+                worker.start()
+                self._workers.append(worker)
+
+    def _run_worker(self):
+        while True:
+            result, fn, args, kwargs = self._tasks.get()
+            try:
+                value = fn(*args, **kwargs)
+            except Exception as err:
+                # The slot is freed before the result is set so that
+                # callbacks are able to spawn further work.
+                self._slots.release()
+                result.set_exception(err)
+            else:
+                self._slots.release()
+                result.set(value)
@@ -3,6 +3,9 @@ from collections import (
     Mapping,
     MutableMapping,
     Hashable,
+    ItemsView,
+    KeysView,
+    ValuesView,
 )
 
 # Hashable must be immutable:
@@ -74,3 +77,308 @@ class AttributeDict(ReadableAttributeDict, Hashable):
             return self.__dict__ == dict(other)
         else:
             return False
+
+
+class RecordLayout(object):
+    """
+    The keys present in a record, in order, along with how each is stored.
+    Records built from dictionaries with the same keys share a layout.
+    """
+    __slots__ = ('keys', 'key_set', 'setters', 'extra_keys', 'decode_field')
+
+    def __init__(self, record_class, keys, decode_field=None):
+        self.keys = keys
+        self.decode_field = decode_field
+        self.key_set = frozenset(keys)
+        self.setters = tuple(
+            (key, record_class._descriptors[key].__set__)
+            for key in keys
+            if key in record_class._descriptors
+        )
+        self.extra_keys = tuple(
+            key
+            for key in keys
+            if key not in record_class._descriptors
+        )
+
+
+def freeze(value):
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    return value
+
+
+class Record(object):
+    """
+    Immutable, slotted alternative to `AttributeDict` for results which are
+    created in large numbers.  Subclasses list the fields they expect in
+    `__slots__` and are finished with the `record` decorator.
+
+    Values can be read both as attributes and as items.  Keys which are not
+    listed in `__slots__` are kept in a separate dictionary, and the hash is
+    computed once and then cached.
+
+    Records created with `lazy` keep the raw dictionary and only decode each
+    value the first time it is read.
+    """
+    __slots__ = ('_layout', '_extra', '_hash', '_raw')
+
+    _descriptors = {}
+    _fields = frozenset()
+    _layouts = None
+    max_layouts = 256
+
+    def __init__(self, dictionary=None, **kwargs):
+        if dictionary is None:
+            dictionary = kwargs
+        elif kwargs or not isinstance(dictionary, dict):
+            dictionary = dict(dictionary, **kwargs)
+
+        keys = tuple(dictionary)
+        layout = self._layouts.get(keys)
+        if layout is None:
+            layout = RecordLayout(type(self), keys)
+            if len(self._layouts) < self.max_layouts:
+                self._layouts[keys] = layout
+
+        for key, setter in layout.setters:
+            setter(self, dictionary[key])
+
+        set_slot = object.__setattr__
+        set_slot(self, '_layout', layout)
+        if layout.extra_keys:
+            set_slot(self, '_extra', {key: dictionary[key] for key in layout.extra_keys})
+        else:
+            set_slot(self, '_extra', None)
+        set_slot(self, '_hash', None)
+        set_slot(self, '_raw', None)
+
+    @classmethod
+    def lazy(cls, raw, decode_field):
+        """
+        Returns a record for the undecoded dictionary ``raw``.  The value for
+        each key is computed by ``decode_field(key, raw_value)`` when it is
+        first read and then stored on the record.  ``raw`` must not be
+        modified afterwards.
+        """
+        keys = tuple(raw)
+        layout_key = (decode_field, keys)
+        layout = cls._layouts.get(layout_key)
+        if layout is None:
+            layout = RecordLayout(cls, keys, decode_field)
+            if len(cls._layouts) < cls.max_layouts:
+                cls._layouts[layout_key] = layout
+
+        record = cls.__new__(cls)
+        set_slot = object.__setattr__
+        set_slot(record, '_layout', layout)
+        set_slot(record, '_extra', None)
+        set_slot(record, '_hash', None)
+        set_slot(record, '_raw', raw)
+        return record
+
+    def _decode(self, key):
+        value = self._layout.decode_field(key, self._raw[key])
+        descriptor = self._descriptors.get(key)
+        if descriptor is not None:
+            descriptor.__set__(self, value)
+        else:
+            if self._extra is None:
+                object.__setattr__(self, '_extra', {})
+            self._extra[key] = value
+        return value
+
+    def __getattr__(self, attr):
+        # Only called for attributes which are not set on the record.
+        if not attr.startswith('_'):
+            if self._extra is not None and attr in self._extra:
+                return self._extra[attr]
+            elif self._raw is not None and attr in self._layout.key_set:
+                return self._decode(attr)
+        raise AttributeError("'{0}' object has no attribute '{1}'".format(
+            type(self).__name__,
+            attr,
+        ))
+
+    def __setattr__(self, attr, val):
+        raise TypeError('This data is immutable -- create a copy instead of modifying')
+
+    def __delattr__(self, key):
+        raise TypeError('This data is immutable -- create a copy instead of modifying')
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        elif self._raw is not None and key in self._layout.key_set:
+            return self._decode(key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._layout.keys)
+
+    def __len__(self):
+        return len(self._layout.keys)
+
+    def __contains__(self, key):
+        return key in self._layout.key_set
+
+    def get(self, key, default=None):
+        if key in self._layout.key_set:
+            return self[key]
+        return default
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def to_dict(self):
+        return {key: self[key] for key in self._layout.keys}
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        else:
+            return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash(freeze(self.to_dict())))
+        return self._hash
+
+    def __reduce__(self):
+        return (type(self), (self.to_dict(),))
+
+    def __repr__(self):
+        return self.__class__.__name__ + "(%r)" % self.to_dict()
+
+    def _repr_pretty_(self, builder, cycle):
+        """
+        Custom pretty output for the IPython console
+        """
+        builder.text(self.__class__.__name__ + "(")
+        if cycle:
+            builder.text("<cycle>")
+        else:
+            builder.pretty(self.to_dict())
+        builder.text(")")
+
+
+def record(record_class):
+    """
+    Finishes a `Record` subclass, registering it as an `AttributeDict` so
+    that it is accepted everywhere one is.
+    """
+    record_class._descriptors = {
+        field: getattr(record_class, field)
+        for field in record_class.__slots__
+    }
+    record_class._fields = frozenset(record_class.__slots__)
+    record_class._layouts = {}
+    AttributeDict.register(record_class)
+    return record_class
+
+
+@record
+class Log(Record):
+    __slots__ = (
+        'address',
+        'blockHash',
+        'blockNumber',
+        'data',
+        'logIndex',
+        'removed',
+        'topics',
+        'transactionHash',
+        'transactionIndex',
+        'transactionLogIndex',
+        'type',
+    )
+
+
+@record
+class Transaction(Record):
+    __slots__ = (
+        'blockHash',
+        'blockNumber',
+        'chainId',
+        'condition',
+        'creates',
+        'from',
+        'gas',
+        'gasPrice',
+        'hash',
+        'input',
+        'networkId',
+        'nonce',
+        'publicKey',
+        'r',
+        'raw',
+        's',
+        'standardV',
+        'to',
+        'transactionIndex',
+        'v',
+        'value',
+    )
+
+
+@record
+class Receipt(Record):
+    __slots__ = (
+        'blockHash',
+        'blockNumber',
+        'contractAddress',
+        'cumulativeGasUsed',
+        'from',
+        'gasUsed',
+        'logs',
+        'logsBloom',
+        'root',
+        'status',
+        'to',
+        'transactionHash',
+        'transactionIndex',
+    )
+
+
+@record
+class Block(Record):
+    __slots__ = (
+        'author',
+        'difficulty',
+        'extraData',
+        'gasLimit',
+        'gasUsed',
+        'hash',
+        'logsBloom',
+        'miner',
+        'mixHash',
+        'nonce',
+        'number',
+        'parentHash',
+        'receiptsRoot',
+        'sealFields',
+        'sha3Uncles',
+        'size',
+        'stateRoot',
+        'timestamp',
+        'totalDifficulty',
+        'transactions',
+        'transactionsRoot',
+        'uncles',
+    )
@@ -0,0 +1,104 @@
+import copy
+import functools
+
+from web3.admin import Admin
+from web3.db import Db
+from web3.eth import Eth
+from web3.miner import Miner
+from web3.net import Net
+from web3.personal import Personal
+from web3.shh import Shh
+from web3.testing import Testing
+from web3.txpool import TxPool
+from web3.version import Version
+
+from .encoding import (
+    to_hex,
+)
+
+
+MODULES = (
+    ('eth', Eth),
+    ('db', Db),
+    ('shh', Shh),
+    ('net', Net),
+    ('personal', Personal),
+    ('version', Version),
+    ('txpool', TxPool),
+    ('miner', Miner),
+    ('admin', Admin),
+    ('testing', Testing),
+)
+
+MODULE_NAMES = tuple(module_name for module_name, _ in MODULES)
+
+
+class ModuleHost(object):
+    """
+    Stands in for a `Web3` instance, holding its own instances of the
+    modules which send their requests through whichever manager is currently
+    assigned to `_requestManager`.
+
+    If ``web3`` is given its modules are copied so that any configuration,
+    such as `eth.defaultAccount`, carries over.
+    """
+    toHex = staticmethod(to_hex)
+
+    def __init__(self, request_manager, web3=None):
+        self._requestManager = request_manager
+        for module_name, module_class in MODULES:
+            if web3 is None:
+                module = module_class(self)
+            else:
+                module = copy.copy(getattr(web3, module_name))
+                module.web3 = self
+            setattr(self, module_name, module)
+
+    def run(self, fn, request_manager):
+        original_manager = self._requestManager
+        self._requestManager = request_manager
+        try:
+            return fn(self)
+        finally:
+            self._requestManager = original_manager
+
+
+class DeferredModule(object):
+    """
+    Exposes the same API as the wrapped module, but rather than making
+    requests, each property access or method call is passed to
+    ``defer_fn`` as a function of a `ModuleHost`.
+
+    Setting attributes, such as `eth.defaultAccount`, sets them on the
+    wrapped module.
+    """
+    def __init__(self, host, module_name, defer_fn):
+        self._host = host
+        self._module_name = module_name
+        self._defer_fn = defer_fn
+
+    def __getattr__(self, attr):
+        module = getattr(self._host, self._module_name)
+        module_name = self._module_name
+
+        if isinstance(getattr(type(module), attr, None), property):
+            return self._defer_fn(
+                lambda host: getattr(getattr(host, module_name), attr)
+            )
+
+        value = getattr(module, attr)
+        if not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def deferred(*args, **kwargs):
+            return self._defer_fn(
+                lambda host: getattr(getattr(host, module_name), attr)(*args, **kwargs)
+            )
+        return deferred
+
+    def __setattr__(self, attr, value):
+        if attr.startswith('_'):
+            super(DeferredModule, self).__setattr__(attr, value)
+        else:
+            setattr(getattr(self._host, self._module_name), attr, value)
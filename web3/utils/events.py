@@ -1,7 +1,20 @@
+import functools
 import itertools
+import operator
+from io import (
+    BytesIO,
+)
+
+import pylru
 
 from eth_utils import (
+    decode_hex,
     encode_hex,
+    force_obj_to_bytes,
+    force_obj_to_text,
+    force_text,
+    is_text,
+    to_normalized_address,
     to_tuple,
     is_list_like,
     coerce_return_to_text,
@@ -9,43 +22,37 @@ from eth_utils import (
 )
 
 from eth_abi import (
-    decode_abi,
-    decode_single,
     encode_single,
 )
+from eth_abi.exceptions import (
+    NonEmptyPaddingBytes,
+)
 from eth_abi.abi import (
-    process_type,
+    get_multi_decoder,
+    get_single_decoder,
 )
 
 from .abi import (
+    filter_by_type,
+    get_abi_type_descriptor,
     get_abi_input_names,
     get_indexed_event_inputs,
     exclude_indexed_event_inputs,
-    normalize_return_type,
     normalize_event_input_types,
+    process_abi_type,
+    to_bytes,
+)
+from .caching import (
+    generate_cache_key,
+)
+from .compat import (
+    threading,
 )
 
 
 @coerce_return_to_text
 def construct_event_topic_set(event_abi, arguments=None):
-    if arguments is None:
-        arguments = {}
-    if isinstance(arguments, (list, tuple)):
-        if len(arguments) != len(event_abi['inputs']):
-            raise ValueError(
-                "When passing an argument list, the number of arguments must "
-                "match the event constructor."
-            )
-        arguments = {
-            arg['name']: [arg_value]
-            for arg, arg_value
-            in zip(event_abi['inputs'], arguments)
-        }
-
-    normalized_args = {
-        key: value if is_list_like(value) else [value]
-        for key, value in arguments.items()
-    }
+    normalized_args = normalize_event_argument_filters(event_abi, arguments)
 
     event_topic = encode_hex(event_abi_to_log_topic(event_abi))
     indexed_args = get_indexed_event_inputs(event_abi)
@@ -71,24 +78,7 @@ def construct_event_topic_set(event_abi, arguments=None):
 
 @coerce_return_to_text
 def construct_event_data_set(event_abi, arguments=None):
-    if arguments is None:
-        arguments = {}
-    if isinstance(arguments, (list, tuple)):
-        if len(arguments) != len(event_abi['inputs']):
-            raise ValueError(
-                "When passing an argument list, the number of arguments must "
-                "match the event constructor."
-            )
-        arguments = {
-            arg['name']: [arg_value]
-            for arg, arg_value
-            in zip(event_abi['inputs'], arguments)
-        }
-
-    normalized_args = {
-        key: value if is_list_like(value) else [value]
-        for key, value in arguments.items()
-    }
+    normalized_args = normalize_event_argument_filters(event_abi, arguments)
 
     indexed_args = exclude_indexed_event_inputs(event_abi)
     zipped_abi_and_args = [
@@ -111,15 +101,114 @@ def construct_event_data_set(event_abi, arguments=None):
     return topics
 
 
+def normalize_event_argument_filters(event_abi, arguments=None):
+    """
+    Returns a dictionary mapping argument names to the list of values which
+    are accepted for them.
+    """
+    if arguments is None:
+        return {}
+    if isinstance(arguments, (list, tuple)):
+        if len(arguments) != len(event_abi['inputs']):
+            raise ValueError(
+                "When passing an argument list, the number of arguments must "
+                "match the event constructor."
+            )
+        return {
+            arg['name']: [arg_value]
+            for arg, arg_value
+            in zip(event_abi['inputs'], arguments)
+        }
+    return {
+        key: value if is_list_like(value) else [value]
+        for key, value in arguments.items()
+    }
+
+
+def encode_argument_filter(arg_type, options):
+    """
+    Returns the distinct hex encodings of ``options`` for an argument of
+    ``arg_type``, or `None` if any value is accepted.
+    """
+    if not options or any(option is None for option in options):
+        return None
+
+    seen = set()
+    encoded_options = []
+    for option in options:
+        encoded = force_text(encode_hex(encode_single(arg_type, force_obj_to_bytes(option))))
+        if encoded not in seen:
+            seen.add(encoded)
+            encoded_options.append(encoded)
+    return encoded_options
+
+
+def construct_event_topic_filter(event_abi, arguments=None):
+    """
+    Returns the ``topics`` filter parameter for the logs of ``event_abi``
+    whose indexed arguments match ``arguments``.
+
+    After the event topic, each position is `None` to accept any value, a
+    single topic, or a list of topics any of which is accepted.  Unlike
+    `construct_event_topic_set` the size grows with the number of accepted
+    values rather than the number of combinations of them.
+    """
+    normalized_args = normalize_event_argument_filters(event_abi, arguments)
+
+    topics = [force_text(encode_hex(event_abi_to_log_topic(event_abi)))]
+    for arg in get_indexed_event_inputs(event_abi):
+        encoded_options = encode_argument_filter(
+            get_abi_type_descriptor(arg['type']).normalized_type,
+            normalized_args.get(arg['name']),
+        )
+        if encoded_options is not None and len(encoded_options) == 1:
+            topics.append(encoded_options[0])
+        else:
+            topics.append(encoded_options)
+
+    while topics[-1] is None:
+        topics.pop()
+    return topics
+
+
+def construct_event_data_filters(event_abi, arguments=None):
+    """
+    Returns an `(offset, is_dynamic, values)` tuple for each non-indexed
+    argument of ``event_abi`` which is filtered on by ``arguments``.
+
+    ``offset`` is the position in the log data of the argument's value, or
+    of the offset of its value if ``is_dynamic`` is set.  ``values`` are the
+    accepted hex encodings of the value.
+    """
+    normalized_args = normalize_event_argument_filters(event_abi, arguments)
+
+    data_filters = []
+    offset = 0
+    for arg in exclude_indexed_event_inputs(event_abi):
+        arg_type = get_abi_type_descriptor(arg['type']).normalized_type
+        base, sub, arrlist = process_abi_type(arg_type)
+        if arrlist:
+            is_dynamic = not arrlist[-1]
+        else:
+            is_dynamic = base == 'string' or (base == 'bytes' and not sub)
+
+        encoded_options = encode_argument_filter(arg_type, normalized_args.get(arg['name']))
+        if encoded_options is not None:
+            data_filters.append((offset, is_dynamic, encoded_options))
+
+        if is_dynamic:
+            offset += 32
+        else:
+            offset += 32 * functools.reduce(operator.mul, (dim[0] for dim in arrlist), 1)
+    return data_filters
+
+
 def is_dynamic_sized_type(_type):
-    base_type, type_size, arrlist = process_type(_type)
-    if arrlist:
-        return True
-    elif base_type == 'string':
-        return True
-    elif base_type == 'bytes' and type_size == '':
-        return True
-    return False
+    descriptor = get_abi_type_descriptor(_type)
+    if descriptor.is_dynamic is None:
+        # Invalid types raise the `ValueError` from `process_type`.
+        process_abi_type(_type)
+    return descriptor.is_dynamic
 
 
 @to_tuple
@@ -136,74 +225,316 @@ def get_event_abi_types_for_decoding(event_inputs):
             yield input_abi['type']
 
 
-@coerce_return_to_text
-def get_event_data(event_abi, log_entry):
+def check_word_padding(word, padding):
+    if not word.startswith(padding):
+        raise NonEmptyPaddingBytes(
+            "Padding bytes were not empty: {0}".format(word[:len(padding)])
+        )
+
+
+def compile_word_decoder(processed_type):
     """
-    Given an event ABI and a log entry for that event, return the decoded
+    Returns a function which decodes, and normalizes, a value of
+    ``processed_type`` directly from the 64 hex characters of its ABI
+    encoding, or `None` if the type is not a single word value type.
     """
-    if event_abi['anonymous']:
-        log_topics = log_entry['topics']
+    base, sub, arrlist = processed_type
+    if arrlist:
+        return None
+    elif base == 'uint':
+        uint_padding = '0' * (64 - int(sub) // 4)
+
+        def decode_uint(word):
+            check_word_padding(word, uint_padding)
+            return int(word, 16)
+        return decode_uint
+    elif base == 'address':
+        address_padding = '0' * 24
+
+        def decode_address(word):
+            check_word_padding(word, address_padding)
+            int(word, 16)
+            return '0x' + word[24:].lower()
+        return decode_address
+    elif base == 'bool':
+        bool_padding = '0' * 63
+
+        def decode_bool(word):
+            check_word_padding(word, bool_padding)
+            if word[63] == '0':
+                return False
+            elif word[63] == '1':
+                return True
+            raise NonEmptyPaddingBytes(
+                "Boolean must be either 0x0 or 0x1.  Got: {0}".format(word)
+            )
+        return decode_bool
+    elif base == 'bytes' and sub == '32':
+        return lambda word: force_text(decode_hex(word))
     else:
-        log_topics = log_entry['topics'][1:]
+        return None
+
+
+class EventDecoder(object):
+    """
+    Decodes the log entries for a single event.
+
+    The event ABI is analysed, and the decoders for its inputs are built,
+    once when the decoder is created, so decoding each log entry only has to
+    decode its topics and data.
+    """
+    def __init__(self, event_abi):
+        self.event_abi = event_abi
+        self.event_name = force_text(event_abi['name'])
+        self.is_anonymous = event_abi['anonymous']
+
+        topics_abi = get_indexed_event_inputs(event_abi)
+        topic_types = get_event_abi_types_for_decoding(normalize_event_input_types(topics_abi))
+        self.topic_names = get_abi_input_names({'inputs': topics_abi})
+
+        data_abi = exclude_indexed_event_inputs(event_abi)
+        data_types = get_event_abi_types_for_decoding(normalize_event_input_types(data_abi))
+        self.data_names = get_abi_input_names({'inputs': data_abi})
 
-    log_topics_abi = get_indexed_event_inputs(event_abi)
-    log_topic_normalized_inputs = normalize_event_input_types(log_topics_abi)
-    log_topic_types = get_event_abi_types_for_decoding(log_topic_normalized_inputs)
-    log_topic_names = get_abi_input_names({'inputs': log_topics_abi})
+        processed_topic_types = tuple(process_abi_type(topic_type) for topic_type in topic_types)
+        processed_data_types = tuple(process_abi_type(data_type) for data_type in data_types)
 
-    if len(log_topics) != len(log_topic_types):
-        raise ValueError("Expected {0} log topics.  Got {1}".format(
-            len(log_topic_types),
-            len(log_topics),
+        self.num_topics = len(processed_topic_types)
+        self.topic_decoders = tuple(zip(
+            self.topic_names,
+            [get_single_decoder(*topic_type) for topic_type in processed_topic_types],
+            [get_abi_type_descriptor(topic_type).return_normalizer for topic_type in topic_types],
+        ))
+        self.data_decoder = get_multi_decoder(processed_data_types)
+        self.data_normalizers = tuple(zip(
+            self.data_names,
+            [get_abi_type_descriptor(data_type).return_normalizer for data_type in data_types],
         ))
 
-    log_data = log_entry['data']
-    log_data_abi = exclude_indexed_event_inputs(event_abi)
-    log_data_normalized_inputs = normalize_event_input_types(log_data_abi)
-    log_data_types = get_event_abi_types_for_decoding(log_data_normalized_inputs)
-    log_data_names = get_abi_input_names({'inputs': log_data_abi})
-
-    # sanity check that there are not name intersections between the topic
-    # names and the data argument names.
-    duplicate_names = set(log_topic_names).intersection(log_data_names)
-    if duplicate_names:
-        raise ValueError(
-            "Invalid Event ABI:  The following argument names are duplicated "
-            "between event inputs: '{0}'".format(', '.join(duplicate_names))
-        )
+        # Most events only use types which fit in a single word, which are
+        # decoded straight from the hex encoded topics and data.
+        topic_word_decoders = [
+            compile_word_decoder(topic_type) for topic_type in processed_topic_types
+        ]
+        if all(topic_word_decoders):
+            self.topic_word_decoders = tuple(zip(self.topic_names, topic_word_decoders))
+        else:
+            self.topic_word_decoders = None
 
-    decoded_log_data = decode_abi(log_data_types, log_data)
-    normalized_log_data = [
-        normalize_return_type(data_type, data_value)
-        for data_type, data_value
-        in zip(log_data_types, decoded_log_data)
-    ]
+        data_word_decoders = [
+            compile_word_decoder(data_type) for data_type in processed_data_types
+        ]
+        if all(data_word_decoders):
+            self.data_word_decoders = tuple(
+                (name, 2 + 64 * index, 66 + 64 * index, decoder)
+                for index, (name, decoder)
+                in enumerate(zip(self.data_names, data_word_decoders))
+            )
+            self.data_hex_length = 2 + 64 * len(data_word_decoders)
+        else:
+            self.data_word_decoders = None
 
-    decoded_topic_data = [
-        decode_single(topic_type, topic_data)
-        for topic_type, topic_data
-        in zip(log_topic_types, log_topics)
-    ]
-    normalized_topic_data = [
-        normalize_return_type(data_type, data_value)
-        for data_type, data_value
-        in zip(log_topic_types, decoded_topic_data)
-    ]
+        # sanity check that there are not name intersections between the topic
+        # names and the data argument names.
+        self.duplicate_names = set(self.topic_names).intersection(self.data_names)
 
-    event_args = dict(itertools.chain(
-        zip(log_topic_names, normalized_topic_data),
-        zip(log_data_names, normalized_log_data),
-    ))
-
-    event_data = {
-        'args': event_args,
-        'event': event_abi['name'],
-        'logIndex': log_entry['logIndex'],
-        'transactionIndex': log_entry['transactionIndex'],
-        'transactionHash': log_entry['transactionHash'],
-        'address': log_entry['address'],
-        'blockHash': log_entry['blockHash'],
-        'blockNumber': log_entry['blockNumber'],
-    }
+    def decode(self, log_entry):
+        """
+        Given a log entry for the event, return the decoded event data.
+        """
+        if self.is_anonymous:
+            log_topics = log_entry['topics']
+        else:
+            log_topics = log_entry['topics'][1:]
+
+        if len(log_topics) != self.num_topics:
+            raise ValueError("Expected {0} log topics.  Got {1}".format(
+                self.num_topics,
+                len(log_topics),
+            ))
+
+        if self.duplicate_names:
+            raise ValueError(
+                "Invalid Event ABI:  The following argument names are duplicated "
+                "between event inputs: '{0}'".format(', '.join(self.duplicate_names))
+            )
+
+        event_args = {}
+
+        log_data = log_entry['data']
+        if (self.data_word_decoders is not None and
+                is_text(log_data) and
+                len(log_data) >= self.data_hex_length and
+                log_data.startswith('0x')):
+            for name, start, end, decoder in self.data_word_decoders:
+                event_args[name] = decoder(log_data[start:end])
+        else:
+            decoded_log_data = self.data_decoder(BytesIO(to_bytes(log_data)))
+            for (name, normalize), value in zip(self.data_normalizers, decoded_log_data):
+                event_args[name] = normalize(value)
+
+        if (self.topic_word_decoders is not None and
+                all(is_text(topic) and len(topic) == 66 for topic in log_topics)):
+            for (name, decoder), topic in zip(self.topic_word_decoders, log_topics):
+                event_args[name] = decoder(topic[2:])
+        else:
+            for (name, decoder, normalize), topic in zip(self.topic_decoders, log_topics):
+                event_args[name] = normalize(decoder(BytesIO(to_bytes(topic))))
+
+        return {
+            'args': event_args,
+            'event': self.event_name,
+            'logIndex': force_obj_to_text(log_entry['logIndex']),
+            'transactionIndex': force_obj_to_text(log_entry['transactionIndex']),
+            'transactionHash': force_obj_to_text(log_entry['transactionHash']),
+            'address': force_obj_to_text(log_entry['address']),
+            'blockHash': force_obj_to_text(log_entry['blockHash']),
+            'blockNumber': force_obj_to_text(log_entry['blockNumber']),
+        }
+
+    def decode_logs(self, log_entries):
+        """
+        Decode each of ``log_entries``, returning a list of the event data.
+        """
+        decode = self.decode
+        return [decode(log_entry) for log_entry in log_entries]
+
+    __call__ = decode
+
+
+_event_decoder_cache = pylru.lrucache(256)
+_event_decoder_cache_lock = threading.Lock()
+
+
+def get_event_decoder(event_abi):
+    """
+    Returns an `EventDecoder` for ``event_abi``, reusing the decoder from
+    previous calls with the same ABI.
+
+    Decoders are looked up by the identity of ``event_abi`` first, since
+    contracts pass the same ABI object for every log, and then by its
+    contents.
+    """
+    with _event_decoder_cache_lock:
+        try:
+            decoder = _event_decoder_cache[id(event_abi)]
+        except KeyError:
+            pass
+        else:
+            if decoder.event_abi is event_abi:
+                return decoder
+
+        cache_key = generate_cache_key(event_abi)
+        try:
+            decoder = _event_decoder_cache[cache_key]
+        except KeyError:
+            decoder = _event_decoder_cache[cache_key] = EventDecoder(event_abi)
+        if decoder.event_abi is event_abi:
+            _event_decoder_cache[id(event_abi)] = decoder
+        return decoder
+
+
+def get_event_data(event_abi, log_entry):
+    """
+    Given an event ABI and a log entry for that event, return the decoded
+    """
+    return get_event_decoder(event_abi).decode(log_entry)
+
+
+class LogRouter(object):
+    """
+    Decodes logs emitted by any number of contracts, finding the decoder for
+    each log by its address and first topic, and passes the event data to
+    the handlers registered for the event's name.
+
+    Anonymous events have no topic identifying them and are not routed.
+    """
+    def __init__(self):
+        # Maps `(address, topic)` to the decoders for events with that topic.
+        # An address of `None` matches logs from any address.
+        self.decoders = {}
+        self.handlers = {}
+
+    def add_abi(self, abi, address=None):
+        """
+        Route the events in ``abi``, only for logs from ``address`` if given.
+        """
+        if address is not None:
+            address = to_normalized_address(address)
+
+        for event_abi in filter_by_type('event', abi):
+            if event_abi['anonymous']:
+                continue
+            event_topic = encode_hex(event_abi_to_log_topic(event_abi))
+            decoders = self.decoders.setdefault((address, force_text(event_topic)), [])
+            decoders.append(get_event_decoder(event_abi))
+
+    def add_contract(self, contract):
+        """
+        Route the events of ``contract``, which may be a contract factory or
+        instance.  Only logs from the contract's address are routed if it has
+        one.
+        """
+        self.add_abi(contract.abi, contract.address)
+
+    def add_handler(self, event_name, handler):
+        """
+        Call ``handler`` with the event data for each routed event named
+        ``event_name``.
+        """
+        self.handlers.setdefault(event_name, []).append(handler)
+
+    def get_decoder(self, log_entry):
+        """
+        Returns the `EventDecoder` for ``log_entry``, or `None` if no known
+        event matches it.
+        """
+        log_topics = log_entry['topics']
+        if not log_topics:
+            return None
+        event_topic = force_text(log_topics[0]).lower()
+        address = force_text(log_entry['address']).lower()
+
+        decoders = self.decoders.get((address, event_topic))
+        if decoders is None:
+            decoders = self.decoders.get((None, event_topic))
+            if decoders is None:
+                return None
+
+        if len(decoders) == 1:
+            return decoders[0]
+        # Events can share a signature while indexing different inputs, such
+        # as the ERC20 and ERC721 `Transfer` events.
+        for decoder in decoders:
+            if decoder.num_topics == len(log_topics) - 1:
+                return decoder
+        return None
+
+    def decode(self, log_entry):
+        """
+        Returns the decoded event data for ``log_entry``, or `None` if no
+        known event matches it.
+        """
+        decoder = self.get_decoder(log_entry)
+        if decoder is None:
+            return None
+        return decoder.decode(log_entry)
+
+    def route(self, log_entry):
+        """
+        Decode ``log_entry`` and pass it to the handlers for its event,
+        returning the event data, or `None` if no known event matches it.
+        """
+        event_data = self.decode(log_entry)
+        if event_data is not None:
+            for handler in self.handlers.get(event_data['event'], ()):
+                handler(event_data)
+        return event_data
 
-    return event_data
+    def route_logs(self, log_entries):
+        """
+        Route each of ``log_entries``, returning the event data for the logs
+        which matched a known event.
+        """
+        routed = (self.route(log_entry) for log_entry in log_entries)
+        return [event_data for event_data in routed if event_data is not None]
@@ -1,18 +1,43 @@
+import collections
 import re
-import random
+import time
 
 from eth_utils import (
+    big_endian_to_int,
+    decode_hex,
+    force_text,
+    is_integer,
     is_string,
     is_list_like,
 )
 
+from web3.formatters import (
+    input_filter_params_formatter,
+    log_array_formatter,
+    output_block_formatter,
+)
+from web3.providers.manager import (
+    get_response_result,
+)
+
 from .events import (
-    construct_event_topic_set,
+    construct_event_data_filters,
     construct_event_data_set,
+    construct_event_topic_filter,
+)
+from .datastructures import (
+    AttributeDict,
+)
+from .polling import (
+    AdaptivePollInterval,
+    is_transient_error,
 )
 from .compat import (
+    Event,
+    Pool,
     sleep,
-    GreenletThread,
+    spawn,
+    threading,
 )
 
 
@@ -23,17 +48,65 @@ def construct_event_filter_params(event_abi,
                                   fromBlock=None,
                                   toBlock=None,
                                   address=None):
+    filter_params = _construct_event_filter_params(
+        event_abi,
+        contract_address,
+        argument_filters,
+        topics,
+        fromBlock,
+        toBlock,
+        address,
+    )
+    data_filters_set = construct_event_data_set(event_abi, argument_filters)
+
+    return data_filters_set, filter_params
+
+
+def construct_event_log_filter(event_abi,
+                               contract_address=None,
+                               argument_filters=None,
+                               topics=None,
+                               fromBlock=None,
+                               toBlock=None,
+                               address=None):
+    """
+    Like `construct_event_filter_params`, but returns a `LogMatcher` for the
+    argument filters in place of the data filter set.
+    """
+    filter_params = _construct_event_filter_params(
+        event_abi,
+        contract_address,
+        argument_filters,
+        topics,
+        fromBlock,
+        toBlock,
+        address,
+    )
+    log_matcher = LogMatcher(
+        addresses=filter_params.get('address'),
+        # Extra `topics` are combined with the event's topics in a way that
+        # cannot be checked position by position.
+        topics=filter_params['topics'] if topics is None else None,
+        data_filters=construct_event_data_filters(event_abi, argument_filters),
+    )
+
+    return log_matcher, filter_params
+
+
+def _construct_event_filter_params(event_abi,
+                                   contract_address,
+                                   argument_filters,
+                                   topics,
+                                   fromBlock,
+                                   toBlock,
+                                   address):
     filter_params = {}
 
+    topic_filter = construct_event_topic_filter(event_abi, argument_filters)
     if topics is None:
-        topic_set = construct_event_topic_set(event_abi, argument_filters)
-    else:
-        topic_set = [topics] + construct_event_topic_set(event_abi, argument_filters)
-
-    if len(topic_set) == 1 and is_list_like(topic_set[0]):
-        filter_params['topics'] = topic_set[0]
+        filter_params['topics'] = topic_filter
     else:
-        filter_params['topics'] = topic_set
+        filter_params['topics'] = [topics, topic_filter]
 
     if address and contract_address:
         if is_list_like(address):
@@ -55,42 +128,280 @@ def construct_event_filter_params(event_abi,
     if toBlock is not None:
         filter_params['toBlock'] = toBlock
 
-    data_filters_set = construct_event_data_set(event_abi, argument_filters)
+    return filter_params
+
+
+def decode_hex_values(values):
+    """
+    Returns the set of raw bytes for ``values``, which may be a single hex
+    string, or `None` if ``values`` is `None`.
+    """
+    if values is None:
+        return None
+    elif is_string(values):
+        values = [values]
+    return frozenset(decode_hex(value) for value in values)
+
+
+class LogMatcher(object):
+    """
+    Checks log entries against the accepted values for their address, for
+    each topic position, and for each filtered argument in their data.
+
+    ``topics`` has the same form as the ``topics`` filter parameter, and
+    ``data_filters`` the form returned by `construct_event_data_filters`.
+    The accepted values are kept as sets of raw bytes, so the cost of a
+    check does not depend on how many values are accepted.
+    """
+    def __init__(self, addresses=None, topics=None, data_filters=None):
+        self.addresses = decode_hex_values(addresses)
+        self.topics = tuple(decode_hex_values(values) for values in topics or ())
+        self.data_filters = tuple(
+            (
+                offset,
+                is_dynamic,
+                decode_hex_values(values),
+                tuple(sorted(set(len(value) for value in decode_hex_values(values)))),
+            )
+            for offset, is_dynamic, values
+            in data_filters or ()
+        )
 
-    return data_filters_set, filter_params
+    def match(self, entry):
+        if self.addresses is not None and decode_hex(entry['address']) not in self.addresses:
+            return False
+
+        if self.topics:
+            log_topics = entry['topics']
+            if len(log_topics) < len(self.topics):
+                return False
+            for accepted, topic in zip(self.topics, log_topics):
+                if accepted is not None and decode_hex(topic) not in accepted:
+                    return False
+
+        if self.data_filters:
+            data = decode_hex(entry['data'])
+            for offset, is_dynamic, accepted, lengths in self.data_filters:
+                if is_dynamic:
+                    head = data[offset:offset + 32]
+                    if len(head) < 32:
+                        return False
+                    offset = big_endian_to_int(head)
+                if not any(data[offset:offset + length] in accepted for length in lengths):
+                    return False
+
+        return True
 
 
-class Filter(GreenletThread):
+class FilterScheduler(object):
+    """
+    Polls every watched filter for a ``web3`` instance from a single thread.
+
+    On each tick the changes for all of the filters which are due are
+    requested in a single JSON-RPC batch, and the callbacks for each filter
+    with changes are run using a pool of at most ``max_workers`` threads.
+    The next tick does not start until the callbacks have returned, so each
+    filter sees its entries in order.
+
+    The time between ticks is decided by an `AdaptivePollInterval`, which
+    the scheduler tells about the blocks its filters see, whether each tick
+    found any changes and whether the batch failed.  Passing
+    ``poll_interval`` uses a fixed interval instead.  Filters with their own
+    ``poll_interval`` are left out of the batch until they are due.  The
+    polling thread is only running while there are filters being watched.
+    """
+    def __init__(self, web3, poll_interval=None, max_workers=10, adaptive_interval=None):
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        if adaptive_interval is None:
+            adaptive_interval = AdaptivePollInterval()
+        self.adaptive_interval = adaptive_interval
+        self.max_workers = max_workers
+        self.pool = Pool(max_workers)
+        self.filters = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add(self, watched_filter):
+        with self._lock:
+            if watched_filter not in self.filters:
+                self.filters.append(watched_filter)
+            if self._thread is None:
+                self._thread = spawn(self._run)
+
+    def remove(self, watched_filter):
+        with self._lock:
+            if watched_filter in self.filters:
+                self.filters.remove(watched_filter)
+
+    def spawn(self, fn, *args, **kwargs):
+        """
+        Run ``fn`` using one of the scheduler's workers.
+        """
+        return self.pool.spawn(fn, *args, **kwargs)
+
+    def poll(self, filters):
+        """
+        Request the changes for each of ``filters`` in a single batch and run
+        their callbacks.  A filter whose request or callbacks fail is stopped and
+        the exception is stored on its ``exception`` attribute.
+        """
+        responses = self.web3._requestManager.request_batch([
+            watched_filter.get_changes_request() for watched_filter in filters
+        ])
+
+        futures = []
+        has_changes = False
+        for watched_filter, response in zip(filters, responses):
+            try:
+                changes = log_array_formatter(get_response_result(response))
+            except Exception as err:
+                self._fail(watched_filter, err)
+                continue
+            if changes:
+                has_changes = True
+                watched_filter.record_blocks(changes, self.adaptive_interval)
+            if changes and watched_filter.running:
+                watched_filter._idle.clear()
+                future = self.spawn(watched_filter._process_changes, changes)
+                futures.append((watched_filter, future))
+
+        for watched_filter, future in futures:
+            try:
+                future.get()
+            except Exception as err:
+                self._fail(watched_filter, err)
+
+        self.adaptive_interval.record_poll(has_changes)
+
+    @property
+    def interval(self):
+        """
+        The number of seconds to wait before the next tick.
+        """
+        if self.poll_interval is not None:
+            return self.poll_interval
+        return self.adaptive_interval.interval
+
+    def _fail(self, watched_filter, err):
+        watched_filter.exception = err
+        watched_filter.running = False
+        watched_filter.stopped = True
+        self.remove(watched_filter)
+        try:
+            watched_filter.uninstall_filter()
+        except Exception:
+            # The filter has already failed with ``err`` and the node drops
+            # filters which are no longer polled, so this is not reported.
+            pass
+        finally:
+            watched_filter._finished.set()
+
+    def _run(self):
+        while True:
+            now = time.time()
+            with self._lock:
+                if not self.filters:
+                    self._thread = None
+                    return
+                filters = [
+                    watched_filter
+                    for watched_filter
+                    in self.filters
+                    if watched_filter.running and watched_filter._next_poll_at <= now
+                ]
+
+            for watched_filter in filters:
+                watched_filter._next_poll_at = now + (watched_filter.poll_interval or 0)
+
+            if filters:
+                try:
+                    self.poll(filters)
+                except Exception:
+                    # Failing to reach the node is treated as temporary and
+                    # the filters are polled again after backing off.
+                    self.adaptive_interval.record_error()
+            sleep(self.interval)
+
+
+_filter_schedulers_lock = threading.Lock()
+
+
+def get_filter_scheduler(web3):
+    """
+    Returns the `FilterScheduler` used by the filters for ``web3``, creating
+    it the first time it is needed.
+    """
+    with _filter_schedulers_lock:
+        scheduler = getattr(web3, '_filterScheduler', None)
+        if scheduler is None:
+            scheduler = web3._filterScheduler = FilterScheduler(web3)
+        return scheduler
+
+
+def set_filter_scheduler(web3, scheduler):
+    """
+    Use ``scheduler`` for the filters created from ``web3`` which have not
+    started watching yet.
+    """
+    with _filter_schedulers_lock:
+        web3._filterScheduler = scheduler
+
+
+class Filter(object):
     callbacks = None
     running = None
     stopped = False
     poll_interval = None
+    exception = None
+    changes_method = 'eth_getFilterChanges'
 
     def __init__(self, web3, filter_id):
         self.web3 = web3
         self.filter_id = filter_id
         self.callbacks = []
-        super(Filter, self).__init__()
+        self._idle = Event()
+        self._idle.set()
+        self._finished = Event()
+        self._next_poll_at = 0
 
     def __str__(self):
         return "Filter for {0}".format(self.filter_id)
 
-    def _run(self):
+    @property
+    def scheduler(self):
+        return get_filter_scheduler(self.web3)
+
+    def start(self):
         if self.stopped:
             raise ValueError("Cannot restart a Filter")
         self.running = True
+        self.scheduler.add(self)
 
-        while self.running:
-            changes = self.web3.eth.getFilterChanges(self.filter_id)
-            if changes:
-                for entry in changes:
-                    for callback_fn in self.callbacks:
-                        if self.is_valid_entry(entry):
-                            callback_fn(self.format_entry(entry))
-            if self.poll_interval is None:
-                sleep(random.random())
-            else:
-                sleep(self.poll_interval)
+    def get_changes_request(self):
+        """
+        Returns the `(method, params)` pair used to poll for changes.
+        """
+        return self.changes_method, [self.filter_id]
+
+    def uninstall_filter(self):
+        return self.web3.eth.uninstallFilter(self.filter_id)
+
+    def record_blocks(self, changes, adaptive_interval):
+        """
+        Hook for subclasses to tell ``adaptive_interval`` about the blocks
+        revealed by ``changes``.
+        """
+        pass
+
+    def _process_changes(self, changes):
+        try:
+            for entry in changes:
+                for callback_fn in self.callbacks:
+                    if self.is_valid_entry(entry):
+                        callback_fn(self.format_entry(entry))
+        finally:
+            self._idle.set()
 
     def format_entry(self, entry):
         """
@@ -112,19 +423,49 @@ class Filter(GreenletThread):
 
         if not self.running:
             self.start()
-        sleep(0)
 
     def stop_watching(self, timeout=0):
+        """
+        Stop polling and uninstall the filter, waiting up to ``timeout``
+        seconds for callbacks which are already running to return.
+        """
         self.running = False
         self.stopped = True
-        self.web3.eth.uninstallFilter(self.filter_id)
-        self.join(timeout)
+        self.scheduler.remove(self)
+        try:
+            self.uninstall_filter()
+        finally:
+            self._finished.set()
+        self._idle.wait(timeout)
 
     stopWatching = stop_watching
 
+    def join(self, timeout=None):
+        """
+        Wait up to ``timeout`` seconds, or forever if ``timeout`` is None, for
+        the filter to stop watching and for its callbacks to return.  A filter
+        stops when `stop_watching` is called or when polling it or one of its
+        callbacks raises.
+        """
+        if timeout is None:
+            self._finished.wait()
+            self._idle.wait()
+        else:
+            deadline = time.time() + timeout
+            self._finished.wait(timeout)
+            self._idle.wait(max(0, deadline - time.time()))
+
+    def is_alive(self):
+        """
+        Returns whether the filter is being polled or its callbacks are still
+        running.
+        """
+        return bool(self.running) or not self._idle.is_set()
+
 
 class BlockFilter(Filter):
-    pass
+    def record_blocks(self, changes, adaptive_interval):
+        adaptive_interval.record_block()
 
 
 class TransactionFilter(Filter):
@@ -147,16 +488,44 @@ def construct_data_filter_regex(data_filter_set):
     ))
 
 
-class LogFilter(Filter):
+class LogEntryFilterMixin(object):
+    """
+    Checks and formats log entries for the `LogFilter` and `LogScanner`.
+    Entries are checked with ``log_matcher`` if one is set, and otherwise
+    against the ``data_filter_set``.
+    """
     data_filter_set = None
     data_filter_set_regex = None
     log_entry_formatter = None
+    log_matcher = None
 
+    def format_entry(self, entry):
+        if self.log_entry_formatter:
+            return self.log_entry_formatter(entry)
+        return entry
+
+    def set_data_filters(self, data_filter_set):
+        self.data_filter_set = data_filter_set
+        if any(data_filter_set):
+            self.data_filter_set_regex = construct_data_filter_regex(
+                data_filter_set,
+            )
+
+    def is_valid_entry(self, entry):
+        if self.log_matcher is not None:
+            return self.log_matcher.match(entry)
+        if not self.data_filter_set_regex:
+            return True
+        return bool(self.data_filter_set_regex.match(entry['data']))
+
+
+class LogFilter(LogEntryFilterMixin, Filter):
     def __init__(self, *args, **kwargs):
         self.log_entry_formatter = kwargs.pop(
             'log_entry_formatter',
             self.log_entry_formatter,
         )
+        self.log_matcher = kwargs.pop('log_matcher', self.log_matcher)
         if 'data_filter_set' in kwargs:
             self.set_data_filters(kwargs.pop('data_filter_set'))
         super(LogFilter, self).__init__(*args, **kwargs)
@@ -179,63 +548,342 @@ class LogFilter(Filter):
         ]
         return formatted_log_entries
 
-    def format_entry(self, entry):
-        if self.log_entry_formatter:
-            return self.log_entry_formatter(entry)
-        return entry
-
-    def set_data_filters(self, data_filter_set):
-        self.data_filter_set = data_filter_set
-        if any(data_filter_set):
-            self.data_filter_set_regex = construct_data_filter_regex(
-                data_filter_set,
-            )
-
-    def is_valid_entry(self, entry):
-        if not self.data_filter_set_regex:
-            return True
-        return bool(self.data_filter_set_regex.match(entry['data']))
+    def record_blocks(self, changes, adaptive_interval):
+        block_numbers = [
+            entry['blockNumber']
+            for entry
+            in changes
+            if is_integer(entry.get('blockNumber'))
+        ]
+        if block_numbers:
+            adaptive_interval.record_block(max(block_numbers))
 
 
 class PastLogFilter(LogFilter):
-    def _run(self):
+    def start(self):
         if self.stopped:
             raise ValueError("Cannot restart a Filter")
         self.running = True
+        self._idle.clear()
+        self.scheduler.spawn(self._get_past_logs)
 
-        previous_logs = self.web3.eth.getFilterLogs(self.filter_id)
+    def _get_past_logs(self):
+        try:
+            previous_logs = self.web3.eth.getFilterLogs(self.filter_id)
+            if previous_logs:
+                self._process_changes(previous_logs)
+        except Exception as err:
+            self.exception = err
+        finally:
+            self.running = False
+            self._idle.set()
 
-        if previous_logs:
-            for entry in previous_logs:
-                for callback_fn in self.callbacks:
-                    if self.is_valid_entry(entry):
-                        callback_fn(self.format_entry(entry))
 
-        self.running = False
+class ShhFilter(Filter):
+    changes_method = 'shh_getFilterChanges'
+
+    def uninstall_filter(self):
+        return self.web3.shh.uninstallFilter(self.filter_id)
+
+
+#
+# Fragments of the errors nodes return when an `eth_getLogs` request covers
+# too many blocks or matches too many logs.
+#
+CHUNK_TOO_LARGE_MESSAGES = (
+    'query returned more than',
+    'too many',
+    'limit exceeded',
+    'response size',
+    'block range',
+    'query timeout exceeded',
+)
 
 
-class ShhFilter(Filter):
-    def _run(self):
-        if self.stopped:
-            raise ValueError("Cannot restart a filter")
-        self.running = True
+def is_chunk_too_large_error(error):
+    """
+    Returns whether ``error`` is an error returned by the node which suggests
+    that the request would succeed if it covered fewer blocks.  Failures to
+    reach the node, including timeouts, are not.
+    """
+    if not isinstance(error, ValueError):
+        return False
+    message = str(error).lower()
+    return any(fragment in message for fragment in CHUNK_TOO_LARGE_MESSAGES)
+
+
+class LogScanner(LogEntryFilterMixin):
+    """
+    Fetches the logs matching ``filter_params`` with `eth_getLogs`, splitting
+    the block range into chunks which are requested concurrently and yielded
+    in order.
+
+    Chunks which fail because they are too large are split in half and the
+    size of later chunks is reduced.  Chunks which return fewer than half of
+    ``target_results`` logs cause later chunks to grow, up to
+    ``max_chunk_size`` blocks.  At most ``concurrency`` chunks are held in
+    memory at once.
+
+    ``checkpoint`` is the first block whose logs have not all been yielded.
+    A scan can be resumed by starting a new scanner from it.
+    """
+    checkpoint = None
+
+    def __init__(self,
+                 web3,
+                 filter_params,
+                 chunk_size=1000,
+                 min_chunk_size=1,
+                 max_chunk_size=100000,
+                 target_results=1000,
+                 concurrency=4,
+                 log_entry_formatter=None,
+                 data_filter_set=None,
+                 log_matcher=None):
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        if not 1 <= min_chunk_size <= chunk_size <= max_chunk_size:
+            raise ValueError(
+                "Chunk sizes must satisfy 1 <= min_chunk_size <= chunk_size <= max_chunk_size"
+            )
 
-        while self.running:
-            changes = self.web3.shh.getFilterChanges(self.filter_id)
-            if changes:
-                for entry in changes:
-                    for callback_fn in self.callbacks:
-                        if self.is_valid_entry(entry):
-                            callback_fn(self.format_entry(entry))
-            if self.poll_interval is None:
-                sleep(random.random())
+        self.web3 = web3
+        self.filter_params = filter_params
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_results = target_results
+        self.concurrency = concurrency
+        if log_entry_formatter is not None:
+            self.log_entry_formatter = log_entry_formatter
+        if data_filter_set is not None:
+            self.set_data_filters(data_filter_set)
+        if log_matcher is not None:
+            self.log_matcher = log_matcher
+
+    def __iter__(self):
+        return self.scan()
+
+    def get_block_range(self):
+        """
+        Returns the first and last block numbers to scan, resolving
+        `earliest` and `latest`.
+        """
+        return (
+            self._resolve_block_number(self.filter_params.get('fromBlock', 'earliest')),
+            self._resolve_block_number(self.filter_params.get('toBlock', 'latest')),
+        )
+
+    def scan(self):
+        from_block, to_block = self.get_block_range()
+        self.checkpoint = from_block
+
+        pending = collections.deque()
+        next_block = from_block
+
+        while pending or next_block <= to_block:
+            while len(pending) < self.concurrency and next_block <= to_block:
+                end_block = min(next_block + self.chunk_size - 1, to_block)
+                pending.append(self._fetch(next_block, end_block))
+                next_block = end_block + 1
+
+            start_block, end_block, future = pending.popleft()
+            try:
+                log_entries = future.get()
+            except Exception as err:
+                num_blocks = end_block - start_block + 1
+                if num_blocks <= self.min_chunk_size or not is_chunk_too_large_error(err):
+                    raise
+                self.chunk_size = max(self.min_chunk_size, min(self.chunk_size, num_blocks // 2))
+                middle_block = start_block + num_blocks // 2 - 1
+                pending.appendleft(self._fetch(middle_block + 1, end_block))
+                pending.appendleft(self._fetch(start_block, middle_block))
+                continue
+
+            log_entries = log_array_formatter(log_entries) or []
+            self._adjust_chunk_size(len(log_entries))
+
+            for log_entry in log_entries:
+                if self.is_valid_entry(log_entry):
+                    yield self.format_entry(log_entry)
+            self.checkpoint = end_block + 1
+
+    def _fetch(self, start_block, end_block):
+        params = dict(self.filter_params, fromBlock=start_block, toBlock=end_block)
+        future = self.web3._requestManager.request_future(
+            'eth_getLogs',
+            [input_filter_params_formatter(params)],
+        )
+        return start_block, end_block, future
+
+    def _adjust_chunk_size(self, num_results):
+        if num_results > self.target_results:
+            self.chunk_size = max(self.min_chunk_size, self.chunk_size // 2)
+        elif num_results < self.target_results // 2:
+            self.chunk_size = min(self.max_chunk_size, self.chunk_size * 2)
+
+    def _resolve_block_number(self, block_identifier):
+        if is_integer(block_identifier):
+            return block_identifier
+
+        block_identifier = force_text(block_identifier)
+        if block_identifier == 'earliest':
+            return 0
+        elif block_identifier == 'latest':
+            return self.web3.eth.blockNumber
+        elif block_identifier.startswith('0x'):
+            return int(block_identifier, 16)
+        else:
+            raise ValueError(
+                "Cannot scan logs up to the block '{0}'".format(block_identifier)
+            )
+
+
+BLOCK_ADDED = 'added'
+BLOCK_REMOVED = 'removed'
+
+
+class BlockReorgTooDeep(ValueError):
+    """
+    Raised by the `BlockFollower` when a reorg replaces every block it still
+    remembers after older blocks have been forgotten, so the common ancestor
+    cannot be found.
+    """
+    pass
+
+
+class BlockFollower(object):
+    """
+    Follows the head of the chain one block number at a time, emitting an
+    ``added`` event for each new block, with its logs, and a ``removed``
+    event for each block which is undone by a reorg.
+
+    The number, hash and logs of the last ``max_reorg_depth`` blocks are
+    kept in a ring buffer.  A reorg is detected when the parent hash of the
+    next block does not match the last block in the buffer.  The stale
+    blocks are then removed, newest first, until the new chain joins the
+    remembered one, and the new blocks are added in order.  Each block is
+    therefore emitted exactly once for each time it joins or leaves the
+    chain.
+
+    Logs are only requested if ``filter_params`` is given, in which case
+    they are fetched in the same JSON-RPC batch as their block.
+    """
+    log_entry_formatter = None
+
+    def __init__(self,
+                 web3,
+                 from_block='latest',
+                 filter_params=None,
+                 max_reorg_depth=64,
+                 log_entry_formatter=None,
+                 adaptive_interval=None):
+        if max_reorg_depth < 1:
+            raise ValueError("max_reorg_depth must be at least 1")
+        self.web3 = web3
+        self.from_block = from_block
+        self.filter_params = filter_params
+        self.blocks = collections.deque(maxlen=max_reorg_depth)
+        self.next_block = None
+        # Whether older blocks than those in `blocks` have been emitted, in
+        # which case a reorg past them cannot be followed.
+        self.has_forgotten_blocks = False
+        if log_entry_formatter is not None:
+            self.log_entry_formatter = log_entry_formatter
+        if adaptive_interval is None:
+            adaptive_interval = AdaptivePollInterval()
+        self.adaptive_interval = adaptive_interval
+
+    def __iter__(self):
+        return self.follow()
+
+    def follow(self):
+        """
+        Yield events forever, polling for new blocks using
+        ``adaptive_interval``.  Failures to reach the node are retried
+        without losing track of the chain.
+        """
+        while True:
+            has_events = False
+            try:
+                for event in self.poll():
+                    has_events = True
+                    yield event
+            except Exception as err:
+                if not is_transient_error(err):
+                    raise
+                self.adaptive_interval.record_error()
             else:
-                sleep(self.poll_interval)
+                if has_events:
+                    self.adaptive_interval.record_block()
+                self.adaptive_interval.record_poll(has_events)
+            sleep(self.adaptive_interval.interval)
 
-    def stop_watching(self, timeout=0):
-        self.running = False
-        self.stopped = True
-        self.web3.shh.uninstallFilter(self.filter_id)
-        self.join(timeout)
+    def poll(self):
+        """
+        Walk from the last block seen up to the current head, yielding the
+        events in the order they happened.  The follower only moves past a
+        block as its event is yielded, so if the walk fails part way the next
+        call carries on from the first event which was not yielded.
+        """
+        head = self.web3.eth.blockNumber
+        if self.next_block is None:
+            if self.from_block == 'latest':
+                self.next_block = head
+            else:
+                self.next_block = self.from_block
+
+        reorg_depth = 0
+        while self.next_block <= head:
+            block, logs = self._get_block_and_logs(self.next_block)
+            if block is None:
+                return
+
+            if self.blocks and block['parentHash'] != self.blocks[-1]['block']['hash']:
+                if len(self.blocks) == 1 and self.has_forgotten_blocks:
+                    raise BlockReorgTooDeep(
+                        "The reorg at block {0} is deeper than the {1} blocks which are "
+                        "remembered".format(block['number'], reorg_depth + 1)
+                    )
+                removed = self.blocks.pop()
+                reorg_depth += 1
+                self.next_block = removed['block']['number']
+                yield AttributeDict({
+                    'type': BLOCK_REMOVED,
+                    'block': removed['block'],
+                    'logs': removed['logs'],
+                })
+                continue
+
+            if len(self.blocks) == self.blocks.maxlen:
+                self.has_forgotten_blocks = True
+            self.blocks.append({'block': block, 'logs': logs})
+            self.next_block += 1
+            yield AttributeDict({'type': BLOCK_ADDED, 'block': block, 'logs': logs})
 
-    stopWatching = stop_watching
+    def format_entry(self, entry):
+        if self.log_entry_formatter:
+            return self.log_entry_formatter(entry)
+        return entry
+
+    def _get_block_and_logs(self, block_number):
+        requests = [('eth_getBlockByNumber', [hex(block_number), False])]
+        if self.filter_params is not None:
+            params = dict(self.filter_params, fromBlock=block_number, toBlock=block_number)
+            requests.append(('eth_getLogs', [input_filter_params_formatter(params)]))
+
+        responses = self.web3._requestManager.request_batch(requests)
+        block = get_response_result(responses[0])
+        if block is None:
+            # The node does not have the block yet, or it was removed by a
+            # reorg since the head was requested.
+            return None, []
+        block = output_block_formatter(block)
+        if self.filter_params is None:
+            return block, []
+
+        log_entries = log_array_formatter(get_response_result(responses[1])) or []
+        if any(entry['blockHash'] != block['hash'] for entry in log_entries):
+            # The block was replaced between the two requests.
+            return self._get_block_and_logs(block_number)
+        return block, [self.format_entry(entry) for entry in log_entries]
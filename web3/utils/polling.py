@@ -0,0 +1,95 @@
+import socket
+import time
+
+
+def is_transient_error(error):
+    """
+    Returns whether ``error`` looks like a failure to reach the node, which
+    is worth retrying, rather than an error returned by the node.
+    """
+    return isinstance(error, (IOError, OSError, socket.timeout, socket.error))
+
+
+class AdaptivePollInterval(object):
+    """
+    Decides how long to wait before polling the node again.
+
+    The interval starts at ``min_interval`` and is multiplied by ``backoff``
+    after each poll which finds nothing, up to half of the observed block
+    time, or ``max_interval`` if that is shorter or no blocks have been
+    seen.  A poll which finds something, or reveals a new block, resets the
+    interval to ``min_interval`` so the node is polled again quickly.
+
+    Failed polls double the interval each time, starting from
+    ``min_interval``, up to ``max_error_interval``.
+    """
+    block_time = None
+    last_block_number = None
+    last_block_at = None
+    errors = 0
+
+    def __init__(self,
+                 min_interval=0.1,
+                 max_interval=1.0,
+                 backoff=1.5,
+                 max_error_interval=30):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("Backoff must be at least 1")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_error_interval = max_error_interval
+        self._interval = min_interval
+
+    @property
+    def interval(self):
+        if self.errors:
+            return min(self.max_error_interval, self.min_interval * 2 ** self.errors)
+        return self._interval
+
+    @property
+    def max_poll_interval(self):
+        if self.block_time is None:
+            return self.max_interval
+        return max(self.min_interval, min(self.max_interval, self.block_time / 2))
+
+    def record_block(self, block_number=None):
+        """
+        Record that a block was seen.  Without a ``block_number`` the block is
+        assumed to be new.  Returns whether the block is new.
+        """
+        if block_number is not None and self.last_block_number is not None:
+            if block_number <= self.last_block_number:
+                return False
+            num_blocks = block_number - self.last_block_number
+        else:
+            num_blocks = 1
+
+        now = time.time()
+        if self.last_block_at is not None:
+            block_time = (now - self.last_block_at) / num_blocks
+            if self.block_time is None:
+                self.block_time = block_time
+            else:
+                self.block_time = 0.75 * self.block_time + 0.25 * block_time
+
+        self.last_block_at = now
+        if block_number is not None:
+            self.last_block_number = block_number
+        self._interval = self.min_interval
+        return True
+
+    def record_poll(self, has_changes):
+        """
+        Record a poll which succeeded, and whether it found anything.
+        """
+        self.errors = 0
+        if has_changes:
+            self._interval = self.min_interval
+        else:
+            self._interval = min(self._interval * self.backoff, self.max_poll_interval)
+
+    def record_error(self):
+        self.errors += 1
@@ -6,10 +6,12 @@ if sys.version_info.major == 2:
         urlparse,
         urlunparse,
         Generator,
+        queue,
     )
 else:
     from .six_py3 import (  # noqa: #401
         urlparse,
         urlunparse,
         Generator,
+        queue,
     )
@@ -1,3 +1,4 @@
+import Queue as queue  # noqa: F401
 from urlparse import (  # noqa: F401
     urlparse,
     urlunparse,
@@ -1,4 +1,5 @@
 import collections
+import queue  # noqa: F401
 
 from urllib.parse import (  # noqa: F401
     urlparse,
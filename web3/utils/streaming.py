@@ -0,0 +1,86 @@
+import re
+
+
+STRUCTURAL_REGEX = re.compile(b'[{}\\[\\]"]')
+STRING_REGEX = re.compile(b'["\\\\]')
+
+OPENING_BYTES = frozenset(bytearray(b'{['))
+CLOSING_BYTES = frozenset(bytearray(b'}]'))
+QUOTE = ord(b'"')
+BACKSLASH = ord(b'\\')
+
+
+class JSONMessageFramer(object):
+    """
+    Splits a stream of bytes into the individual top level JSON objects and
+    arrays it contains.
+
+    Data is scanned as it arrives and the scan picks up where it left off, so
+    each byte is only looked at once regardless of how many chunks a message
+    is split across.
+    """
+    def __init__(self):
+        self.buffer = bytearray()
+        self.scan_position = 0
+        self.message_start = None
+        self.depth = 0
+        self.in_string = False
+
+    def feed(self, data):
+        """
+        Append ``data`` to the buffer, returning a list of any messages which
+        are now complete.
+        """
+        self.buffer += data
+        return list(self._pop_messages())
+
+    def _pop_messages(self):
+        buffer = self.buffer
+        position = self.scan_position
+
+        while True:
+            if self.in_string:
+                match = STRING_REGEX.search(buffer, position)
+                if match is None:
+                    position = len(buffer)
+                    break
+                position = match.end()
+                if buffer[match.start()] == BACKSLASH:
+                    if position >= len(buffer):
+                        # The escaped character has not arrived yet.
+                        position = match.start()
+                        break
+                    position += 1
+                else:
+                    self.in_string = False
+                continue
+
+            match = STRUCTURAL_REGEX.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+
+            position = match.end()
+            char = buffer[match.start()]
+
+            if char == QUOTE:
+                self.in_string = True
+            elif char in OPENING_BYTES:
+                if self.depth == 0:
+                    self.message_start = match.start()
+                self.depth += 1
+            elif char in CLOSING_BYTES:
+                self.depth -= 1
+                if self.depth == 0:
+                    yield bytes(buffer[self.message_start:position])
+                    del buffer[:position]
+                    position = 0
+                    self.message_start = None
+                elif self.depth < 0:
+                    raise ValueError("Unbalanced JSON data in stream")
+
+        if self.message_start is None:
+            # Nothing but whitespace between messages has been seen.
+            del buffer[:position]
+            position = 0
+        self.scan_position = position
@@ -1,20 +1,173 @@
-import random
+import collections
+import time
+
+from cytoolz.itertoolz import (
+    partition_all,
+)
+
+from web3.formatters import (
+    output_transaction_receipt_formatter,
+)
+from web3.providers.manager import (
+    get_response_result,
+)
 
 from .compat import (
     Timeout,
+    sleep,
+)
+from .encoding import (
+    to_decimal,
+)
+from .polling import (
+    AdaptivePollInterval,
+    is_transient_error,
 )
 
 
-def wait_for_transaction_receipt(web3, txn_hash, timeout=120):
+def wait_for_transaction_receipt(web3, txn_hash, timeout=120, poll_interval=None):
+    """
+    Poll for the receipt of ``txn_hash`` until it is available, backing off
+    while it is not and when the node cannot be reached.  The block number
+    is requested in the same batch as the receipt, so that the node is polled
+    again quickly once a new block arrives.  Passing ``poll_interval`` polls
+    for the receipt alone at a fixed interval instead.
+    """
+    adaptive_interval = AdaptivePollInterval()
     with Timeout(timeout) as _timeout:
         while True:
-            txn_receipt = web3.eth.getTransactionReceipt(txn_hash)
-            if txn_receipt is not None:
-                break
-            _timeout.sleep(random.random())
+            try:
+                if poll_interval is None:
+                    txn_receipt, block_number = get_transaction_receipt_and_block_number(
+                        web3,
+                        txn_hash,
+                    )
+                else:
+                    txn_receipt = web3.eth.getTransactionReceipt(txn_hash)
+            except Exception as err:
+                if not is_transient_error(err):
+                    raise
+                adaptive_interval.record_error()
+            else:
+                if txn_receipt is not None:
+                    break
+                if poll_interval is None:
+                    adaptive_interval.record_poll(adaptive_interval.record_block(block_number))
+
+            if poll_interval is None:
+                _timeout.sleep(adaptive_interval.interval)
+            else:
+                _timeout.sleep(poll_interval)
     return txn_receipt
 
 
+def get_transaction_receipt_and_block_number(web3, txn_hash):
+    """
+    Request the receipt for ``txn_hash`` and the current block number in a
+    single JSON-RPC batch.
+    """
+    receipt_response, block_number_response = web3._requestManager.request_batch([
+        ('eth_getTransactionReceipt', [txn_hash]),
+        ('eth_blockNumber', []),
+    ])
+    return (
+        output_transaction_receipt_formatter(get_response_result(receipt_response)),
+        to_decimal(get_response_result(block_number_response)),
+    )
+
+
+def wait_for_transaction_receipts(web3, txn_hashes, timeout=120, batch_size=None):
+    """
+    Wait for the receipts of all of ``txn_hashes``, yielding each receipt as
+    soon as it is found.
+
+    The receipts are requested in JSON-RPC batches of at most ``batch_size``
+    hashes, once up front and then only when a block filter reports a new
+    block, so the number of requests grows with the number of blocks rather
+    than the number of transactions.  Raises `Timeout` if some receipts are
+    still missing after ``timeout`` seconds of waiting, not counting the time
+    spent by the caller between receipts.
+    """
+    pending = collections.OrderedDict((txn_hash, None) for txn_hash in txn_hashes)
+    if not pending:
+        return
+
+    block_filter = web3.eth.filter('latest')
+    adaptive_interval = AdaptivePollInterval()
+    # A deadline rather than a `Timeout` context, which must not be held open
+    # while the caller handles each receipt.
+    deadline = time.time() + timeout
+    try:
+        needs_check = True
+        while pending:
+            if needs_check:
+                try:
+                    receipts = get_transaction_receipts(web3, list(pending), batch_size)
+                except Exception as err:
+                    if not is_transient_error(err):
+                        raise
+                    adaptive_interval.record_error()
+                    _sleep_before_deadline(adaptive_interval.interval, deadline, timeout)
+                    continue
+
+                needs_check = False
+                for txn_hash, receipt in receipts:
+                    del pending[txn_hash]
+                    yielded_at = time.time()
+                    yield receipt
+                    # Time spent by the caller does not count towards the timeout.
+                    deadline += time.time() - yielded_at
+                continue
+
+            try:
+                needs_check = bool(web3.eth.getFilterChanges(block_filter.filter_id))
+            except Exception as err:
+                if not is_transient_error(err):
+                    raise
+                adaptive_interval.record_error()
+            else:
+                if needs_check:
+                    adaptive_interval.record_block()
+                adaptive_interval.record_poll(needs_check)
+
+            if not needs_check:
+                _sleep_before_deadline(adaptive_interval.interval, deadline, timeout)
+    finally:
+        block_filter.uninstall_filter()
+
+
+def _sleep_before_deadline(seconds, deadline, timeout):
+    """
+    Sleep for ``seconds``, or until ``deadline`` if that is sooner, raising
+    `Timeout` once the deadline has passed.
+    """
+    remaining = deadline - time.time()
+    if remaining > 0:
+        sleep(min(seconds, remaining))
+    if time.time() >= deadline:
+        raise Timeout(timeout)
+
+
+def get_transaction_receipts(web3, txn_hashes, batch_size=None):
+    """
+    Request the receipts for ``txn_hashes`` using JSON-RPC batches of at most
+    ``batch_size`` requests, returning `(txn_hash, receipt)` pairs for the
+    receipts which were found, in the same order as ``txn_hashes``.
+    """
+    receipts = []
+    for chunk in partition_all(batch_size or len(txn_hashes) or 1, txn_hashes):
+        responses = web3._requestManager.request_batch([
+            ('eth_getTransactionReceipt', [txn_hash])
+            for txn_hash
+            in chunk
+        ])
+        for txn_hash, response in zip(chunk, responses):
+            receipt = output_transaction_receipt_formatter(get_response_result(response))
+            if receipt is not None:
+                receipts.append((txn_hash, receipt))
+    return receipts
+
+
 def get_block_gas_limit(web3, block_identifier=None):
     if block_identifier is None:
         block_identifier = web3.eth.blockNumber